@@ -52,7 +52,7 @@ class DataCleaner:
             if df_clean[col].isnull().sum() > 0:
                 mode_val = df_clean[col].mode()
                 if len(mode_val) > 0:
-                    df_clean[col].fillna(mode_val[0], inplace=True)
+                    df_clean[col] = df_clean[col].fillna(mode_val[0])
         return df_clean
     
     @staticmethod
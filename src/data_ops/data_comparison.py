@@ -91,6 +91,40 @@ class DataComparison:
         
         return results
     
+    @staticmethod
+    def compare_schemas(df1, df2_columns, df2_rows):
+        """
+        Compare a DataFrame against another dataset's schema only
+        
+        Fast path for callers that only report shapes and column sets, so the
+        second dataset does not have to be fully loaded.
+        
+        Parameters:
+        -----------
+        df1 : DataFrame
+            First dataset
+        df2_columns : sequence
+            Column names of the second dataset
+        df2_rows : int
+            Row count of the second dataset
+        
+        Returns:
+        --------
+        comparison_results : dict
+            Same shape/column keys as compare_dataframes
+        """
+        df2_shape = (df2_rows, len(df2_columns))
+        df1_cols = set(df1.columns)
+        df2_cols = set(df2_columns)
+        return {
+            'df1_shape': df1.shape,
+            'df2_shape': df2_shape,
+            'same_shape': df1.shape == df2_shape,
+            'common_columns': list(df1_cols & df2_cols),
+            'only_in_df1': list(df1_cols - df2_cols),
+            'only_in_df2': list(df2_cols - df1_cols),
+        }
+    
     @staticmethod
     def find_duplicates(df1, df2, subset=None):
         """Find duplicate rows between two DataFrames"""
@@ -136,30 +170,61 @@ class DataComparison:
             return None, str(e)
     
     @staticmethod
-    def get_summary_comparison(df1, df2):
-        """Get statistical summary comparison"""
+    def get_summary_comparison(df1, df2, common_numeric=None):
+        """
+        Get statistical summary comparison
+        
+        Parameters:
+        -----------
+        df1 : DataFrame
+            First dataset
+        df2 : DataFrame
+            Second dataset
+        common_numeric : list, optional
+            Numeric columns present in both frames, if the caller already
+            knows them; otherwise they are derived from the dtypes
+        
+        Returns:
+        --------
+        (comparison, error) : (DataFrame or None, str or None)
+            Per-column means, difference and percent change
+        """
         try:
-            # Get numeric columns only
-            numeric_df1 = df1.select_dtypes(include=[np.number])
-            numeric_df2 = df2.select_dtypes(include=[np.number])
+            # Nothing to average: skip the dtype scan and both mean() passes
+            if len(df1) == 0 or len(df2) == 0:
+                return None, "Cannot compare summaries of an empty dataset"
             
-            # Get common numeric columns
-            common_numeric = list(set(numeric_df1.columns) & set(numeric_df2.columns))
+            if common_numeric is None:
+                common_numeric = DataComparison._common_numeric_columns(df1, df2)
             
             if not common_numeric:
                 return None, "No common numeric columns to compare"
             
-            comparison = pd.DataFrame()
-            for col in common_numeric:
-                comparison.loc[col, 'Mean_DF1'] = numeric_df1[col].mean()
-                comparison.loc[col, 'Mean_DF2'] = numeric_df2[col].mean()
-                comparison.loc[col, 'Diff'] = numeric_df2[col].mean() - numeric_df1[col].mean()
-                comparison.loc[col, 'Pct_Change'] = (
-                    (numeric_df2[col].mean() - numeric_df1[col].mean()) / 
-                    numeric_df1[col].mean() * 100
-                ) if numeric_df1[col].mean() != 0 else 0
+            # One mean() pass per frame for all columns
+            mean1 = df1[common_numeric].mean()
+            mean2 = df2[common_numeric].mean()
+            diff = mean2 - mean1
+            with np.errstate(divide='ignore', invalid='ignore'):
+                pct = np.where(mean1 != 0, diff / mean1 * 100, 0)
+            
+            comparison = pd.DataFrame({
+                'Mean_DF1': mean1,
+                'Mean_DF2': mean2,
+                'Diff': diff,
+                'Pct_Change': pct
+            })
             
             return comparison.round(2), None
         
         except Exception as e:
             return None, str(e)
+    
+    @staticmethod
+    def _common_numeric_columns(df1, df2):
+        """Columns numeric (excluding bool) in both frames, in df1's order"""
+        def is_number(dtype):
+            return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+        
+        dtypes2 = df2.dtypes
+        return [col for col, dtype in df1.dtypes.items()
+                if col in dtypes2.index and is_number(dtype) and is_number(dtypes2[col])]
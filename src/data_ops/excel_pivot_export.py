@@ -10,12 +10,52 @@ from openpyxl import Workbook, load_workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.worksheet.table import Table, TableStyleInfo
 from openpyxl.chart import PieChart, BarChart, Reference
+import importlib.util
 import os
 
+# xlsxwriter writes plain cell values without openpyxl's per-cell style
+# bookkeeping; fall back to openpyxl when it is not installed
+FAST_EXCEL_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else 'openpyxl'
+
 
 class ExcelPivotExporter:
     """Export DataFrames with native Excel pivot tables"""
     
+    @staticmethod
+    def _build_pivot(df, pivot_config):
+        """
+        Compute the pivot described by pivot_config
+        
+        Only the index, column and value fields are sliced out of df before
+        pivoting, so wide frames do not drag every column through the groupby.
+        
+        Parameters:
+        -----------
+        df : DataFrame
+            Source data
+        pivot_config : dict
+            Pivot configuration ('index', 'columns', 'values', 'aggfunc')
+        
+        Returns:
+        --------
+        DataFrame with the pivoted values, missing cells filled with 0
+        """
+        fields = []
+        for key in ('index', 'columns', 'values'):
+            value = pivot_config.get(key)
+            if value:
+                fields.extend(value if isinstance(value, list) else [value])
+        needed = list(dict.fromkeys(fields))
+        
+        return df.loc[:, needed].pivot_table(
+            index=pivot_config.get('index'),
+            columns=pivot_config.get('columns') or None,
+            values=pivot_config.get('values'),
+            aggfunc=pivot_config.get('aggfunc', 'sum'),
+            fill_value=0,
+            observed=True
+        )
+    
     @staticmethod
     def export_with_pivot(df, file_path, pivot_config=None):
         """
@@ -70,14 +110,7 @@ class ExcelPivotExporter:
                 ws_pivot = wb.create_sheet("Pivot Analysis")
                 
                 # Create pandas pivot table
-                pivot_df = pd.pivot_table(
-                    df,
-                    index=pivot_config.get('index'),
-                    columns=pivot_config.get('columns'),
-                    values=pivot_config.get('values'),
-                    aggfunc=pivot_config.get('aggfunc', 'sum'),
-                    fill_value=0
-                )
+                pivot_df = ExcelPivotExporter._build_pivot(df, pivot_config)
                 
                 # Write pivot results to sheet
                 for r in dataframe_to_rows(pivot_df, index=True, header=True):
@@ -108,6 +141,43 @@ class ExcelPivotExporter:
         except Exception as e:
             return False, f"Error exporting Excel with pivot: {str(e)}"
     
+    @staticmethod
+    def export_values_only(df, file_path, pivot_config=None):
+        """
+        Export DataFrame and its pivot as plain values (no table styling)
+        
+        Much faster than export_with_pivot on large frames because no
+        per-cell styles are written.
+        
+        Parameters:
+        -----------
+        df : DataFrame
+            Source data
+        file_path : str
+            Output Excel file path
+        pivot_config : dict
+            Same layout as for export_with_pivot
+        
+        Returns:
+        --------
+        success : bool
+        message : str
+        """
+        try:
+            pivot_df = None
+            if pivot_config:
+                pivot_df = ExcelPivotExporter._build_pivot(df, pivot_config)
+            
+            with pd.ExcelWriter(file_path, engine=FAST_EXCEL_ENGINE) as writer:
+                df.to_excel(writer, sheet_name="Source Data", index=False)
+                if pivot_df is not None:
+                    pivot_df.to_excel(writer, sheet_name="Pivot Analysis")
+            
+            return True, f"Excel file with pivot exported successfully to: {file_path}"
+        
+        except Exception as e:
+            return False, f"Error exporting Excel with pivot: {str(e)}"
+    
     @staticmethod
     def export_multiple_pivots(df, file_path, pivot_configs):
         """
@@ -164,14 +234,7 @@ class ExcelPivotExporter:
                 ws_pivot = wb.create_sheet(sheet_name)
                 
                 # Create pandas pivot table
-                pivot_df = pd.pivot_table(
-                    df,
-                    index=config.get('index'),
-                    columns=config.get('columns') if config.get('columns') else None,
-                    values=config.get('values'),
-                    aggfunc=config.get('aggfunc', 'sum'),
-                    fill_value=0
-                )
+                pivot_df = ExcelPivotExporter._build_pivot(df, config)
                 
                 # Write pivot results to sheet
                 for r in dataframe_to_rows(pivot_df, index=True, header=True):
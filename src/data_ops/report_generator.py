@@ -259,8 +259,8 @@ class ReportGenerator:
 </html>
 """
         
-        # Write to file
-        with open(file_path, 'w', encoding='utf-8') as f:
+        # Write to file through a 1 MiB buffer so the HTML goes out in few syscalls
+        with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write(html_content)
         
         return True, file_path
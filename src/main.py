@@ -12,11 +12,17 @@ import tkinter as tk
 import sys
 import os
 
+import pandas as pd
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ui.main_window import DataAnalystApp
 
+# Copy-on-write: filtered/sliced frames share buffers with their source until
+# written to, instead of duplicating every matching row up front
+pd.set_option("mode.copy_on_write", True)
+
 
 def main():
     """
@@ -6,7 +6,13 @@ Extracted from main_window.py to improve code organization
 
 import pandas as pd
 import os
+
+try:
+    import orjson
+except ImportError:  # optional: pandas' own JSON writer is used instead
+    orjson = None
 from tkinter import messagebox
+from data_ops.excel_pivot_export import FAST_EXCEL_ENGINE
 
 
 class DataService:
@@ -16,8 +22,9 @@ class DataService:
         self.supported_formats = {
             'csv': ['.csv'],
             'excel': ['.xlsx', '.xls'],
-            'json': ['.json'],
-            'parquet': ['.parquet']
+            'json': ['.json', '.jsonl'],
+            'parquet': ['.parquet'],
+            'feather': ['.feather']
         }
     
     def import_csv(self, file_path, encoding='utf-8'):
@@ -81,7 +88,7 @@ class DataService:
     
     def import_json(self, file_path):
         """
-        Import JSON file
+        Import JSON file (.jsonl files are read as one record per line)
         
         Args:
             file_path: Path to JSON file
@@ -90,7 +97,7 @@ class DataService:
             DataFrame: Loaded data
         """
         try:
-            df = pd.read_json(file_path)
+            df = pd.read_json(file_path, lines=file_path.lower().endswith('.jsonl'))
             return df
             
         except FileNotFoundError:
@@ -136,7 +143,11 @@ class DataService:
             bool: True if successful
         """
         try:
-            df.to_csv(file_path, index=index, encoding=encoding)
+            # Serialize in 100k-row chunks through a 1 MiB buffer so large
+            # frames neither build the whole CSV in memory nor issue many small writes
+            with open(file_path, 'wb', buffering=1 << 20) as fp:
+                df.to_csv(fp, index=index, encoding=encoding,
+                          chunksize=100_000, lineterminator='\n')
             return True
             
         except PermissionError:
@@ -145,7 +156,7 @@ class DataService:
         except Exception as e:
             raise ValueError(f"Error exporting CSV: {str(e)}")
     
-    def export_excel(self, df, file_path, sheet_name='Sheet1', index=False):
+    def export_excel(self, df, file_path, sheet_name='Sheet1', index=False, styled=False):
         """
         Export to Excel
         
@@ -154,12 +165,15 @@ class DataService:
             file_path: Output file path
             sheet_name: Sheet name (default: Sheet1)
             index: Include index (default: False)
+            styled: Write through openpyxl so styles can be applied;
+                plain value exports use the faster xlsxwriter engine (default: False)
             
         Returns:
             bool: True if successful
         """
         try:
-            df.to_excel(file_path, sheet_name=sheet_name, index=index, engine='openpyxl')
+            engine = 'openpyxl' if styled else FAST_EXCEL_ENGINE
+            df.to_excel(file_path, sheet_name=sheet_name, index=index, engine=engine)
             return True
             
         except PermissionError:
@@ -188,6 +202,44 @@ class DataService:
         except Exception as e:
             raise ValueError(f"Error exporting JSON: {str(e)}")
     
+    def export_jsonl(self, df, file_path, chunksize=100_000):
+        """
+        Export to line-delimited JSON (one record per line), streamed in chunks
+        
+        Unlike export_json, the whole document is never held in memory.
+        
+        Args:
+            df: DataFrame to export
+            file_path: Output file path
+            chunksize: Rows serialized per chunk (default: 100000)
+            
+        Returns:
+            bool: True if successful
+        """
+        try:
+            with open(file_path, 'wb', buffering=1 << 20) as fp:
+                for start in range(0, len(df), chunksize):
+                    chunk = df.iloc[start:start + chunksize]
+                    if orjson is not None:
+                        for rec in chunk.to_dict(orient='records'):
+                            # OPT_NON_STR_KEYS: integer headers, header=None reads and
+                            # pivot results have non-string column labels
+                            fp.write(orjson.dumps(rec, default=str,
+                                                  option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+                            fp.write(b'\n')
+                    else:
+                        text = chunk.to_json(orient='records', lines=True, date_format='iso')
+                        fp.write(text.encode('utf-8'))
+                        if not text.endswith('\n'):
+                            fp.write(b'\n')
+            return True
+            
+        except PermissionError:
+            raise PermissionError(f"Permission denied: {file_path}. File may be open in another program.")
+            
+        except Exception as e:
+            raise ValueError(f"Error exporting JSON Lines: {str(e)}")
+    
     def export_parquet(self, df, file_path):
         """
         Export to Parquet
@@ -200,12 +252,37 @@ class DataService:
             bool: True if successful
         """
         try:
-            df.to_parquet(file_path, index=False)
+            df.to_parquet(file_path, index=False, compression='zstd')
             return True
             
+        except PermissionError:
+            raise PermissionError(f"Permission denied: {file_path}. File may be open in another program.")
+            
         except Exception as e:
             raise ValueError(f"Error exporting Parquet: {str(e)}")
     
+    def export_feather(self, df, file_path):
+        """
+        Export to Feather (Arrow IPC), the fastest format to read back
+        
+        Args:
+            df: DataFrame to export
+            file_path: Output file path
+            
+        Returns:
+            bool: True if successful
+        """
+        try:
+            # Feather cannot store a non-default index
+            df.reset_index(drop=True).to_feather(file_path, compression='zstd')
+            return True
+            
+        except PermissionError:
+            raise PermissionError(f"Permission denied: {file_path}. File may be open in another program.")
+            
+        except Exception as e:
+            raise ValueError(f"Error exporting Feather: {str(e)}")
+    
     def get_excel_sheet_names(self, file_path):
         """
         Get list of sheet names from Excel file
@@ -317,8 +394,12 @@ class DataService:
             return self.export_excel(df, file_path, **kwargs)
         elif file_ext == '.json':
             return self.export_json(df, file_path, **kwargs)
+        elif file_ext == '.jsonl':
+            return self.export_jsonl(df, file_path, **kwargs)
         elif file_ext == '.parquet':
             return self.export_parquet(df, file_path, **kwargs)
+        elif file_ext == '.feather':
+            return self.export_feather(df, file_path, **kwargs)
         else:
             raise ValueError(f"Unsupported export format: {file_ext}")
     
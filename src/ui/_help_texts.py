@@ -0,0 +1,258 @@
+"""
+Help Texts
+Static help and about content shown by the main window
+
+SEPARATION OF CONCERNS: Help content only
+Loaded on first use by DataAnalystApp so the text stays out of
+main_window's import.
+"""
+
+# DataAnalystApp.show_guide (message box)
+GUIDE = """QUICK START GUIDE
+        
+1. Import Data: File > Import CSV/Excel
+2. View Data: Click 'View Data' or press Ctrl+D
+3. Clean Data: Use Clean menu options
+4. Analyze: Use Analysis menu for insights
+5. Visualize: Create charts from Visualize menu
+6. Export: File > Export to save results
+
+For Shopify Analysis:
+- Use Time Series Analysis for sales trends
+- Use E-commerce Dashboard for quick insights
+- Group By Analysis for customer segmentation
+"""
+
+# DataAnalystApp.show_shortcuts (message box)
+SHORTCUTS = """KEYBOARD SHORTCUTS
+
+FILE OPERATIONS:
+Ctrl+O - Import CSV file
+Ctrl+E - Export CSV file  
+Ctrl+Q - Quit application
+
+DATA OPERATIONS:
+Ctrl+D - View Data
+Ctrl+S - Show Statistics
+Ctrl+R - Reset Data to original
+Ctrl+F - Advanced Filters
+
+HELP:
+F1 - About NexData
+
+TIP: All shortcuts work with capital or lowercase!
+"""
+
+# Help > Quick Start Guide
+QUICK_START = """NEXDATA - QUICK START GUIDE
+        
+🚀 GET STARTED IN 5 MINUTES!
+
+STEP 1: IMPORT YOUR DATA
+• File > Import CSV (or Import Excel)
+• Select your data file
+• ✅ Data loads automatically
+
+STEP 2: VIEW YOUR DATA
+• Click "View Data" button (left panel)
+• Browse your dataset
+• Check columns and data types
+
+STEP 3: CHECK DATA QUALITY
+• Data > Data Quality Check
+• Review quality score (0-100)
+• Follow recommendations
+
+STEP 4: RUN AUTO INSIGHTS
+• Analysis > Auto Insights
+• Get automated pattern detection
+• Review trends and correlations
+
+STEP 5: CREATE VISUALIZATIONS
+• Visualize > Histogram (or any chart type)
+• Select column to visualize
+• Use zoom/pan tools to explore
+
+STEP 6: EXPORT RESULTS
+• File > Generate Executive Report
+• Professional HTML report created
+• Opens in browser automatically
+
+📊 COMMON TASKS:
+
+SQL QUERIES (Most Powerful!):
+• Analysis > SQL Query
+• Example: SELECT * FROM data WHERE Salary > 50000
+• Example: SELECT Department, AVG(Salary) FROM data GROUP BY Department
+
+CUSTOMER ANALYSIS:
+• Analysis > RFM Customer Segmentation
+• Identifies Champions, Loyal, At-Risk customers
+• Perfect for marketing campaigns
+
+SALES FORECASTING:
+• Analysis > Time Series Forecasting
+• Predict future sales/revenue
+• Choose: Linear Trend, Moving Average, or Exponential Smoothing
+
+DATA COMPARISON:
+• Tools > Compare Datasets
+• Load second file to compare
+• See differences automatically
+
+💡 TIPS:
+• Always check Data Quality first
+• Use Auto Insights for quick overview
+• SQL Query can do almost anything
+• Export reports for presentations
+• Try different themes (View > Theme)
+
+🆘 NEED HELP?
+• Help > User Guide & Tutorials (full documentation)
+• Help > Performance Monitor (if slow)
+• Help > About (feature list)
+
+🎯 RECOMMENDED WORKFLOW:
+1. Import data
+2. Data Quality Check
+3. Clean data (remove duplicates/outliers)
+4. Auto Insights
+5. Detailed analysis (SQL/Statistics)
+6. Visualizations
+7. Generate reports
+
+✨ YOU'RE READY! Start exploring your data!
+
+For detailed tutorials: Help > User Guide & Tutorials
+"""
+
+# Analysis > Pivot Table
+PIVOT_HELP = """PIVOT TABLES in NexData
+
+🎯 WHAT IS A PIVOT TABLE?
+A pivot table summarizes data by grouping and aggregating.
+
+Example: Summarize employee salaries by department
+
+ORIGINAL DATA:
+Name          | Department   | Salary
+John Doe      | Sales        | 55000
+Jane Smith    | Engineering  | 75000
+Bob Johnson   | Sales        | 65000
+
+PIVOT TABLE RESULT:
+Department   | Average Salary | Count
+Sales        | 60,000         | 2
+Engineering  | 75,000         | 1
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+💡 HOW TO CREATE IN NEXDATA:
+
+Use Analysis > SQL Query (MORE POWERFUL than traditional pivot tables!)
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📝 EXAMPLE QUERIES FOR YOUR DATA:
+
+1. BASIC PIVOT - Average by Group:
+SELECT Department, 
+       AVG(Salary) as Avg_Salary,
+       COUNT(*) as Count
+FROM data
+GROUP BY Department
+
+2. SUM BY CATEGORY:
+SELECT Department, 
+       SUM(Salary) as Total_Salary
+FROM data
+GROUP BY Department
+
+3. MULTIPLE AGGREGATIONS:
+SELECT Department,
+       AVG(Salary) as Avg_Salary,
+       MIN(Salary) as Min_Salary,
+       MAX(Salary) as Max_Salary,
+       COUNT(*) as Employees
+FROM data
+GROUP BY Department
+ORDER BY Avg_Salary DESC
+
+4. PIVOT WITH FILTERING:
+SELECT Department,
+       AVG(Salary) as Avg_Salary
+FROM data
+WHERE Experience > 5
+GROUP BY Department
+
+5. TRUE PIVOT (Columns from Rows):
+SELECT 
+    CASE WHEN Experience < 3 THEN 'Junior'
+         WHEN Experience < 8 THEN 'Mid'
+         ELSE 'Senior' END as Level,
+    AVG(CASE WHEN Department='Sales' THEN Salary END) as Sales,
+    AVG(CASE WHEN Department='Engineering' THEN Salary END) as Engineering,
+    AVG(CASE WHEN Department='Marketing' THEN Salary END) as Marketing
+FROM data
+GROUP BY Level
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+✅ TO EXPORT RESULTS:
+1. Run SQL Query
+2. Results appear in Output tab
+3. Copy (Ctrl+A then Ctrl+C)
+4. Paste into Excel or Google Sheets
+
+OR generate HTML report: File > Generate Executive Report
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+💡 TIPS:
+• Replace "Department" with your column name
+• Replace "Salary" with the column you want to aggregate
+• Table name is always "data" (lowercase)
+• Check Dataset Info panel for exact column names
+• Start simple, then add complexity
+
+🆘 MORE HELP:
+• Help > User Guide & Tutorials
+• docs/PIVOT_SQL_GUIDE.md (detailed guide)
+"""
+
+# Help > About (also F1)
+ABOUT = """NexData v3.0 - Professional Data Analysis
+Shopify Edition - Next-Generation Analytics
+
+Created for E-commerce & Shopify Data Analysts
+
+✨ 60+ Features Including:
+• Data Import/Export (CSV, Excel, JSON, PowerPoint)
+• Advanced Data Cleaning & Quality Assessment
+• Statistical Analysis & A/B Testing
+• RFM Customer Segmentation (10 segments)
+• Time Series Forecasting (3 methods)
+• Auto Insights & Anomaly Detection
+• Sales/Customer Dashboards
+• SQL Query Interface
+• 10+ Visualization Types
+• Data Comparison Tool
+• Theme Support (System/Light/Dark)
+• Performance Monitoring
+
+🎯 Perfect for analyzing:
+- Sales trends & Revenue forecasting
+- Customer segmentation & Retention
+- Product performance & Inventory
+- Marketing campaign effectiveness
+- Data quality & Validation
+
+🚀 NEW in v3.0:
+• Pivot Tables • RFM Analysis • Auto Insights
+• Forecasting • Quality Checker • Dashboards
+• Dataset Comparison • PowerPoint Export
+
+👨‍💻 Developed by: YEXIU21
+
+© 2025 NexData - Built with Python, Pandas, Matplotlib
+Next-Generation Data Analytics Platform"""
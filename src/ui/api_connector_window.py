@@ -190,7 +190,7 @@ class APIConnectorWindow:
             
             # Test connection
             self.status_bar.config(text="Testing connection...")
-            self.window.update()
+            self.window.update_idletasks()
             
             success, message = api.test_connection()
             
@@ -225,7 +225,7 @@ class APIConnectorWindow:
             # Update initial status
             self.shopify_result.config(text="Fetching data...", foreground="blue")
             self.status_bar.config(text="Fetching data...")
-            self.window.update()
+            self.window.update_idletasks()
             
             # Define task function for progress tracking
             def fetch_task(progress):
@@ -308,7 +308,7 @@ class APIConnectorWindow:
             endpoint = self.api_endpoint.get() or ''
             
             self.status_bar.config(text="Testing connection...")
-            self.window.update()
+            self.window.update_idletasks()
             
             success, data, error = api.get(endpoint)
             
@@ -349,7 +349,7 @@ class APIConnectorWindow:
             # Update status
             self.generic_result.config(text="Fetching data...", foreground="blue")
             self.status_bar.config(text="Fetching data...")
-            self.window.update()
+            self.window.update_idletasks()
             
             # Fetch data
             success, data, error = api.get(self.api_endpoint.get(), params=params if params else None)
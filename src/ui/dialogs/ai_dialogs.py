@@ -21,6 +21,9 @@ class AIDialogs:
             df: DataFrame to analyze
             ai_service: AI service instance
             action_map: Dict mapping tool names to action methods
+            
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         dialog = tk.Toplevel(parent)
         dialog.title("Data Quality Advisor - AI Recommendations")
@@ -81,7 +84,9 @@ class AIDialogs:
         summary_text += f"{len(high_priority)} High, {len(medium_priority)} Medium, {len(low_priority)} Low"
         ttk.Label(summary_frame, text=summary_text, font=('Arial', 10, 'bold')).pack()
         
-        ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=10)
+        ttk.Button(dialog, text="Close", command=dialog.withdraw).pack(pady=10)
+        
+        return dialog
     
     @staticmethod
     def _create_recommendations_view(parent, recommendations, dialog):
@@ -101,9 +106,17 @@ class AIDialogs:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
+        # One dispatch table shared by every button instead of a closure pair per row
+        actions = [rec['action'] for rec in recommendations]
+        
+        def run_action(i):
+            # Hidden, not destroyed: the main window pools this dialog
+            dialog.withdraw()
+            actions[i]()
+        
         # Add recommendations
-        for idx, rec in enumerate(recommendations, 1):
-            rec_frame = ttk.LabelFrame(scrollable_frame, text=f"Issue #{idx}: {rec['issue']}", padding=10)
+        for idx, rec in enumerate(recommendations):
+            rec_frame = ttk.LabelFrame(scrollable_frame, text=f"Issue #{idx + 1}: {rec['issue']}", padding=10)
             rec_frame.pack(fill=tk.X, padx=10, pady=5)
             
             ttk.Label(rec_frame, text=f"Impact: {rec['impact']}", 
@@ -112,18 +125,12 @@ class AIDialogs:
             ttk.Label(rec_frame, text=f"Recommended Tool: {rec['tool']}", 
                      font=('Arial', 9, 'bold'), foreground='blue').pack(anchor='w', pady=2)
             
-            def make_action(action, dlg):
-                def run_action():
-                    dlg.destroy()
-                    action()
-                return run_action
-            
             ttk.Button(rec_frame, text=f"🔧 Fix with {rec['tool']}", 
-                      command=make_action(rec['action'], dialog),
+                      command=lambda i=idx: run_action(i),
                       style='Action.TButton').pack(anchor='w', pady=5)
     
     @staticmethod
-    def show_ai_report_generator_dialog(parent, df, ai_service, root):
+    def show_ai_report_generator_dialog(parent, df, ai_service, root, report_content=None):
         """
         Show AI Report Generator dialog
         
@@ -132,6 +139,11 @@ class AIDialogs:
             df: DataFrame to analyze
             ai_service: AI service instance
             root: Root window for clipboard operations
+            report_content: Pre-generated report text; generated from df when None
+        
+        Returns:
+            The dialog window (tk.Toplevel). Its set_report(text) attribute
+            replaces the displayed report so the window can be reused.
         """
         dialog = tk.Toplevel(parent)
         dialog.title("AI Report Generator")
@@ -147,10 +159,22 @@ class AIDialogs:
         report_text = scrolledtext.ScrolledText(report_frame, wrap=tk.WORD, font=('Courier', 9))
         report_text.pack(fill=tk.BOTH, expand=True)
         
-        # Generate report using AI service
-        report_content = ai_service.generate_report(df)
+        # Generate report using AI service unless the caller already has it
+        if report_content is None:
+            report_content = ai_service.generate_report(df)
         report_text.insert(1.0, report_content)
         report_text.config(state=tk.DISABLED)
+        del report_content  # The widget holds the text; closures read it from there
+        
+        def current_report():
+            return report_text.get("1.0", "end-1c")
+        
+        def set_report(text):
+            report_text.config(state=tk.NORMAL)
+            report_text.replace("1.0", tk.END, text)
+            report_text.config(state=tk.DISABLED)
+        
+        dialog.set_report = set_report
         
         # Export buttons
         export_frame = ttk.Frame(dialog)
@@ -163,14 +187,16 @@ class AIDialogs:
             )
             if file_path:
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(report_content)
+                    f.write(current_report())
                 messagebox.showinfo("Success", f"Report exported to:\n{file_path}")
         
         def copy_to_clipboard():
             root.clipboard_clear()
-            root.clipboard_append(report_content)
+            root.clipboard_append(current_report(), type='STRING')
             messagebox.showinfo("Success", "Report copied to clipboard!")
         
         ttk.Button(export_frame, text="📄 Export as TXT", command=export_txt, style='Action.TButton').pack(side=tk.LEFT, padx=5)
         ttk.Button(export_frame, text="📋 Copy to Clipboard", command=copy_to_clipboard).pack(side=tk.LEFT, padx=5)
-        ttk.Button(export_frame, text="Close", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(export_frame, text="Close", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
@@ -4,12 +4,33 @@ Contains all analysis-related dialogs extracted from main_window.py
 Following SEPARATION OF CONCERNS and CLEAN CODE principles
 """
 
+import functools
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import numpy as np
 import pandas as pd
 
 
+# Analysis backends are imported on first use and pinned, so repeated
+# button clicks skip the import machinery entirely
+@functools.lru_cache(maxsize=None)
+def _sql_interface():
+    from data_ops.sql_interface import SQLInterface
+    return SQLInterface
+
+
+@functools.lru_cache(maxsize=None)
+def _hypothesis_testing():
+    from analysis.statistical_tests import HypothesisTesting
+    return HypothesisTesting
+
+
+@functools.lru_cache(maxsize=None)
+def _ab_testing():
+    from analysis.statistical_tests import ABTesting
+    return ABTesting
+
+
 class AnalysisDialogs:
     """Factory class for analysis dialogs"""
     
@@ -22,6 +43,9 @@ class AnalysisDialogs:
             parent: Parent window
             df: DataFrame to analyze
             create_plot_callback: Callback function(plot_func)
+            
+        Returns:
+            The dialog window (tk.Toplevel), or None if df has no usable columns
         """
         # Find date columns
         date_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
@@ -74,9 +98,11 @@ class AnalysisDialogs:
                 fig.autofmt_xdate()
             
             create_plot_callback(plot_func)
-            dialog.destroy()
+            dialog.withdraw()  # Kept for reuse by the main window's dialog pool
         
         ttk.Button(dialog, text="Analyze", command=analyze).pack(pady=15)
+        
+        return dialog
     
     @staticmethod
     def show_correlation_analysis(df, output_callback):
@@ -122,6 +148,9 @@ class AnalysisDialogs:
             output_callback: Callback function(text) to display output
             notebook_callback: Callback to switch to output tab
             status_callback: Callback to update status
+            
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         dialog = tk.Toplevel(parent)
         dialog.title("Column Analysis")
@@ -161,9 +190,11 @@ class AnalysisDialogs:
             output_callback("\n".join(output))
             notebook_callback()
             status_callback(f"Column {col} analyzed")
-            dialog.destroy()
+            dialog.withdraw()  # Kept for reuse by the main window's dialog pool
         
         ttk.Button(dialog, text="Analyze", command=analyze).pack(pady=15)
+        
+        return dialog
     
     @staticmethod
     def show_sort_data_dialog(parent, df, analysis_service, output_callback, notebook_callback, 
@@ -438,7 +469,7 @@ class AnalysisDialogs:
     @staticmethod
     def show_sql_query_dialog(parent, df, status_callback):
         """Show SQL query dialog"""
-        from data_ops.sql_interface import SQLInterface
+        SQLInterface = _sql_interface()
         
         dialog = tk.Toplevel(parent)
         dialog.title("SQL Query")
@@ -531,7 +562,7 @@ class AnalysisDialogs:
         result_text.pack(pady=10)
         
         def run_test():
-            from analysis.statistical_tests import HypothesisTesting
+            HypothesisTesting = _hypothesis_testing()
             
             test_type = test_var.get()
             col1 = col1_var.get()
@@ -629,7 +660,7 @@ class AnalysisDialogs:
         result_text.pack(pady=10)
         
         def run_ab_test():
-            from analysis.statistical_tests import ABTesting
+            ABTesting = _ab_testing()
             
             try:
                 result_text.delete(1.0, tk.END)
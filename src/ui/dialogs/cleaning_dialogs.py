@@ -24,6 +24,8 @@ class CleaningDialogs:
             df: DataFrame to clean
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, removed_count, status_msg)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         dialog = tk.Toplevel(parent)
         dialog.title("Remove Duplicates")
@@ -54,9 +56,8 @@ class CleaningDialogs:
         col_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
         scrollbar.config(command=col_listbox.yview)
         
-        # Add all columns to listbox
-        for col in df.columns:
-            col_listbox.insert(tk.END, col)
+        # Add all columns to listbox in a single Tcl call
+        col_listbox.insert(tk.END, *df.columns)
         
         # Select all by default
         col_listbox.select_set(0, tk.END)
@@ -165,7 +166,9 @@ class CleaningDialogs:
         ttk.Button(action_frame, text="Preview", command=preview_duplicates).pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Remove Duplicates", command=remove, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(action_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_handle_missing_dialog(parent, df, on_complete_callback):
@@ -176,6 +179,8 @@ class CleaningDialogs:
             parent: Parent window
             df: DataFrame to clean
             on_complete_callback: Callback function(cleaned_df, method, column, status_msg)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         dialog = tk.Toplevel(parent)
         dialog.title("Handle Missing Values")
@@ -242,13 +247,13 @@ class CleaningDialogs:
                         result_df = result_df.dropna(subset=[selected_col])
                     elif method == "mean":
                         if pd.api.types.is_numeric_dtype(result_df[selected_col]):
-                            result_df[selected_col].fillna(result_df[selected_col].mean(), inplace=True)
+                            result_df[selected_col] = result_df[selected_col].fillna(result_df[selected_col].mean())
                         else:
                             messagebox.showwarning("Warning", f"{selected_col} is not numeric!")
                             return
                     elif method == "median":
                         if pd.api.types.is_numeric_dtype(result_df[selected_col]):
-                            result_df[selected_col].fillna(result_df[selected_col].median(), inplace=True)
+                            result_df[selected_col] = result_df[selected_col].fillna(result_df[selected_col].median())
                         else:
                             messagebox.showwarning("Warning", f"{selected_col} is not numeric!")
                             return
@@ -257,9 +262,9 @@ class CleaningDialogs:
                         if custom_val == "":
                             messagebox.showwarning("Warning", "Please enter a custom value!")
                             return
-                        result_df[selected_col].fillna(custom_val, inplace=True)
+                        result_df[selected_col] = result_df[selected_col].fillna(custom_val)
                     elif method == "ffill":
-                        result_df[selected_col].fillna(method='ffill', inplace=True)
+                        result_df[selected_col] = result_df[selected_col].ffill()
                 
                 # Build status message
                 status_msg = f"Handled missing values: {method}"
@@ -274,6 +279,8 @@ class CleaningDialogs:
                 messagebox.showerror("Error", f"Failed to handle missing values:\n{str(e)}")
         
         ttk.Button(dialog, text="Apply", command=apply).pack(pady=15)
+        
+        return dialog
     
     @staticmethod
     def show_remove_outliers_dialog(parent, df, cleaning_service, on_complete_callback):
@@ -285,6 +292,8 @@ class CleaningDialogs:
             df: DataFrame to analyze
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, removed_count, status_msg, details)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
         if not numeric_cols:
@@ -462,7 +471,9 @@ class CleaningDialogs:
                   command=detect_outliers).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Remove Outliers", command=remove, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_smart_fill_missing_dialog(parent, df, cleaning_service, on_complete_callback):
@@ -474,6 +485,8 @@ class CleaningDialogs:
             df: DataFrame to process
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, filled_count, status_msg, details)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         # Find columns with missing values
         missing_cols = df.columns[df.isnull().any()].tolist()
@@ -657,7 +670,9 @@ class CleaningDialogs:
         ttk.Button(action_frame, text="Preview", command=show_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Apply Fill", command=apply_fill, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(action_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_find_replace_dialog(parent, df, cleaning_service, on_complete_callback):
@@ -669,6 +684,8 @@ class CleaningDialogs:
             df: DataFrame to process
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, count, status_msg, details)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         import tkinter.scrolledtext as scrolledtext
         
@@ -788,7 +805,9 @@ class CleaningDialogs:
         ttk.Button(btn_frame, text="Preview", command=show_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Replace All", command=apply_replace, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_standardize_text_case_dialog(parent, df, cleaning_service, on_complete_callback):
@@ -800,6 +819,8 @@ class CleaningDialogs:
             df: DataFrame to process
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, col, case, status_msg)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         import tkinter.scrolledtext as scrolledtext
         import pandas as pd
@@ -899,7 +920,9 @@ class CleaningDialogs:
         ttk.Button(btn_frame, text="Preview", command=show_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Apply", command=apply_case, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_remove_empty_dialog(parent, df, cleaning_service, on_complete_callback):
@@ -911,6 +934,8 @@ class CleaningDialogs:
             df: DataFrame to process
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, rows_removed, cols_removed, status_msg)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         import tkinter.scrolledtext as scrolledtext
         
@@ -970,7 +995,9 @@ class CleaningDialogs:
         
         ttk.Button(btn_frame, text="Remove", command=apply_remove, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_convert_data_types_dialog(parent, df, cleaning_service, on_complete_callback):
@@ -982,6 +1009,8 @@ class CleaningDialogs:
             df: DataFrame to process
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, col, target_type, status_msg)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         import tkinter.scrolledtext as scrolledtext
         import pandas as pd
@@ -1094,7 +1123,9 @@ class CleaningDialogs:
         ttk.Button(btn_frame, text="Preview", command=show_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Convert", command=apply_conversion, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_standardize_dates_dialog(parent, df, cleaning_service, on_complete_callback):
@@ -1106,6 +1137,8 @@ class CleaningDialogs:
             df: DataFrame to process
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, col, fmt, status_msg)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         import tkinter.scrolledtext as scrolledtext
         import pandas as pd
@@ -1188,7 +1221,9 @@ class CleaningDialogs:
         ttk.Button(btn_frame, text="Preview", command=show_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Apply", command=apply_format, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_remove_special_chars_dialog(parent, df, cleaning_service, on_complete_callback):
@@ -1200,6 +1235,8 @@ class CleaningDialogs:
             df: DataFrame to process
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, col, status_msg)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         import tkinter.scrolledtext as scrolledtext
         import pandas as pd
@@ -1310,7 +1347,9 @@ class CleaningDialogs:
         ttk.Button(btn_frame, text="Preview", command=show_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Apply", command=apply_remove, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_split_column_dialog(parent, df, cleaning_service, on_complete_callback):
@@ -1322,6 +1361,8 @@ class CleaningDialogs:
             df: DataFrame to process
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, col, num_cols, status_msg)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         import tkinter.scrolledtext as scrolledtext
         import pandas as pd
@@ -1408,7 +1449,9 @@ class CleaningDialogs:
         ttk.Button(btn_frame, text="Preview", command=show_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Split", command=apply_split, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_merge_columns_dialog(parent, df, cleaning_service, on_complete_callback):
@@ -1420,6 +1463,8 @@ class CleaningDialogs:
             df: DataFrame to process
             cleaning_service: CleaningService instance
             on_complete_callback: Callback function(cleaned_df, col1, col2, new_name, status_msg)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         import tkinter.scrolledtext as scrolledtext
         
@@ -1516,7 +1561,9 @@ class CleaningDialogs:
         ttk.Button(btn_frame, text="Preview", command=show_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Merge", command=apply_merge, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def show_clean_order_ids_dialog(parent, df, on_complete_callback):
@@ -1527,6 +1574,8 @@ class CleaningDialogs:
             parent: Parent window
             df: DataFrame to process
             on_complete_callback: Callback function(cleaned_df, col, affected_count, status_msg, output_msg)
+        Returns:
+            The dialog window (tk.Toplevel)
         """
         import re
         
@@ -1830,7 +1879,9 @@ class CleaningDialogs:
                   command=show_preview).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Apply Cleaning", command=apply_cleaning, 
                   style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=dialog.withdraw).pack(side=tk.LEFT, padx=5)
+        
+        return dialog
     
     @staticmethod
     def confirm_trim_all_columns(parent, df, cleaning_service, on_complete_callback):
@@ -7,6 +7,10 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
 
+# Above this many wedges, percentages are baked into the labels in one pass
+# instead of matplotlib formatting an extra text artist per wedge
+PIE_AUTOPCT_MAX = 20
+
 
 class VisualizationDialogs:
     """Factory class for all visualization-related dialogs"""
@@ -206,8 +210,7 @@ class VisualizationDialogs:
         col_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=col_listbox.yview)
         
-        for col in numeric_cols:
-            col_listbox.insert(tk.END, col)
+        col_listbox.insert(tk.END, *numeric_cols)
         
         # Select all by default
         col_listbox.select_set(0, tk.END)
@@ -609,13 +612,25 @@ class VisualizationDialogs:
                 elif show_values_var.get():
                     autopct_format = lambda pct: f'{int(pct/100*value_counts.sum())}'
                 
+                labels = value_counts.index
+                if autopct_format is not None and len(value_counts) > PIE_AUTOPCT_MAX:
+                    total = value_counts.sum()
+                    if show_percent_var.get() and show_values_var.get():
+                        labels = [f"{name} {v / total:.1%} ({int(v)})" for name, v in value_counts.items()]
+                    elif show_percent_var.get():
+                        labels = [f"{name} {v / total:.1%}" for name, v in value_counts.items()]
+                    else:
+                        labels = [f"{name} ({int(v)})" for name, v in value_counts.items()]
+                    autopct_format = None
+                
                 # Chart title
                 chart_title = title_var.get() if title_var.get() else f'Distribution of {col}'
                 
                 def plot_func(fig, ax):
-                    wedges, texts, autotexts = ax.pie(
+                    # ax.pie only returns autotexts when autopct is set
+                    wedges, texts, *autotexts = ax.pie(
                         value_counts.values, 
-                        labels=value_counts.index, 
+                        labels=labels, 
                         autopct=autopct_format,
                         startangle=90,
                         colors=colors,
@@ -628,7 +643,7 @@ class VisualizationDialogs:
                         text.set_fontsize(10)
                     
                     if autotexts:
-                        for autotext in autotexts:
+                        for autotext in autotexts[0]:
                             autotext.set_color('white')
                             autotext.set_fontsize(9)
                             autotext.set_fontweight('bold')
@@ -7,22 +7,23 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import seaborn as sns
 import os
+import re
+import heapq
+import threading
+import functools
+import operator
+import importlib
+import importlib.util
+from concurrent.futures import Future
 from datetime import datetime
 import warnings
 
 warnings.filterwarnings('ignore')
-sns.set_style('whitegrid')
 
 # Import theme manager
 from ui.theme_manager import ThemeManager
 
-# Import Excel pivot exporter
-from data_ops.excel_pivot_export import ExcelPivotExporter
-
 # Import API connector window
 from ui.api_connector_window import APIConnectorWindow
 from data_ops.data_manager import get_data_manager
@@ -49,6 +50,184 @@ from .dialogs.analysis_dialogs import AnalysisDialogs
 from .dialogs.ai_dialogs import AIDialogs
 
 
+# Repository paths resolved once at import
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_DOCS_DIR = os.path.join(_REPO_ROOT, 'docs')
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy(modpath, attr):
+    """Import modpath on first use and return its attribute, memoized"""
+    return getattr(importlib.import_module(modpath), attr)
+
+
+@functools.lru_cache(maxsize=None)
+def _seaborn():
+    """Import seaborn and apply the app's plot style on the first chart"""
+    sns = importlib.import_module('seaborn')
+    sns.set_style('whitegrid')
+    return sns
+
+
+# Report/analysis classes resolved on demand and warmed up in the background
+_PREFETCH = (
+    ('data_ops.report_generator', 'ReportGenerator'),
+    ('data_ops.report_generator', 'EmailReportFormatter'),
+    ('data_ops.data_quality', 'DataQualityChecker'),
+    ('analysis.auto_insights', 'AutoInsights'),
+    ('data_ops.data_comparison', 'DataComparison'),
+    ('data_ops.sql_interface', 'DataProfiler'),
+    ('data_ops.pptx_export', 'PowerPointExporter'),
+)
+
+
+def _prefetch_modules():
+    """Resolve _PREFETCH entries so the first menu click finds them loaded"""
+    for modpath, attr in _PREFETCH:
+        try:
+            _lazy(modpath, attr)
+        except Exception:
+            pass  # Reported when the feature is actually used
+
+
+def _submit_daemon(work):
+    """
+    Run work() on a new daemon thread and return a Future for its result.
+    
+    Daemon threads never hold the interpreter open, so closing the window
+    during a long analysis exits the app instead of waiting for the job.
+    """
+    future = Future()
+    
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = work()
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+    
+    threading.Thread(target=run, name="nexdata-worker", daemon=True).start()
+    return future
+
+
+_COMPARE_OPS = {
+    "==": operator.eq, "!=": operator.ne,
+    ">": operator.gt, "<": operator.lt,
+    ">=": operator.ge, "<=": operator.le,
+}
+
+
+def _condition_mask(df, col, op, value, kind):
+    """
+    Boolean NumPy mask for one advanced-filter condition on df.
+    
+    kind is 'numeric' (value is a float), 'datetime' (value is a parsed
+    timestamp) or None. Numeric and datetime comparisons run on the column's
+    ndarray; "contains" matches literally (regex=False) and
+    case-insensitively; other comparisons on object, category and bool
+    columns compare the text form of the values.
+    """
+    if op in ("contains", "not contains"):
+        mask = df[col].astype(str).str.contains(value, case=False, na=False, regex=False).to_numpy()
+        return ~mask if op == "not contains" else mask
+    compare = _COMPARE_OPS[op]
+    if kind == 'numeric':
+        with np.errstate(invalid='ignore'):
+            return compare(df[col].to_numpy(dtype=float, na_value=np.nan), value)
+    if kind == 'datetime':
+        return np.asarray(compare(df[col].to_numpy(), value), dtype=bool)
+    return compare(df[col].astype(str).to_numpy(), value)
+
+
+def _parse_datetime_value(text, dtype):
+    """
+    Parse a filter value typed for a datetime64 column.
+    
+    Returns:
+        A value comparable with the column's ndarray (np.datetime64 for naive
+        columns, a tz-aware Timestamp for tz-aware ones), or None if text is
+        not a date
+    """
+    try:
+        ts = pd.Timestamp(text)
+    except (ValueError, TypeError):
+        return None
+    if ts is pd.NaT:
+        return None
+    tz = getattr(dtype, 'tz', None)
+    if tz is None:
+        return (ts.tz_convert(None) if ts.tzinfo is not None else ts).to_datetime64()
+    return ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
+
+
+def _preview_query(df, mask_fn, n=10, chunk_rows=50_000):
+    """
+    Return up to n rows of df selected by mask_fn, scanning in row chunks.
+    
+    Stops as soon as n matches are collected, so previewing a selective
+    filter on a large frame does not evaluate the whole DataFrame.
+    
+    Returns:
+        (DataFrame of at most n rows, total match count or None if the
+        scan stopped early and the total is unknown)
+    """
+    collected = []
+    found = 0
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        hits = chunk.iloc[np.flatnonzero(mask_fn(chunk))]
+        if len(hits):
+            collected.append(hits)
+            found += len(hits)
+            if found >= n:
+                total = found if start + chunk_rows >= len(df) else None
+                return pd.concat(collected).head(n), total
+    if not collected:
+        return df.iloc[0:0], 0
+    return pd.concat(collected).head(n), found
+
+
+# Bounds for tabular previews so wide frames don't flood small text widgets
+_PREVIEW_FORMAT = dict(max_cols=8, max_colwidth=20, show_dimensions=False)
+
+# Report separator lines
+_SEP80 = "=" * 80
+_SEP60 = "=" * 60
+
+# Column-name patterns used by the e-commerce dashboard
+_REVENUE_RE = re.compile(r'revenue|sales|price|amount|total', re.I)
+_CUSTOMER_RE = re.compile(r'customer|user', re.I)
+
+
+def _numeric_corr(numeric):
+    """
+    Pearson correlation matrix of an all-numeric DataFrame.
+    
+    Args:
+        numeric: DataFrame whose columns are all numeric
+    
+    Returns:
+        DataFrame of pairwise correlations, as numeric.corr() would give
+    """
+    # copy=True: the array is standardised in place below, and under
+    # copy-on-write an all-float64 frame would otherwise hand back a
+    # read-only view of its block
+    arr = numeric.to_numpy(dtype=np.float64, copy=True)
+    if len(arr) > 1 and not np.isnan(arr).any():
+        # One centred GEMM instead of pandas' pairwise loop; pandas is kept
+        # for data with gaps since it uses pairwise-complete observations
+        with np.errstate(invalid='ignore', divide='ignore'):
+            arr -= arr.mean(axis=0)
+            arr /= arr.std(axis=0)
+            values = (arr.T @ arr) / len(arr)
+        values[~np.isfinite(values)] = np.nan
+        return pd.DataFrame(values, index=numeric.columns, columns=numeric.columns)
+    return numeric.corr()
+
+
 class DataAnalystApp:
     def __init__(self, root):
         self.root = root
@@ -56,6 +235,9 @@ class DataAnalystApp:
         self.root.geometry("1400x900")
         self.root.configure(bg="#f0f0f0")
         
+        # Bumped on every assignment to self.df (see the df property) and after
+        # in-place edits; keys caches of derived data and reports
+        self._df_version = 0
         self.df = None
         self.original_df = None
         self.file_path = None
@@ -85,13 +267,45 @@ class DataAnalystApp:
         self.export_manager = ExportManager(self)
         self.viz_manager = VisualizationManager(self)
         
+        # Cleaning dialogs kept hidden between opens: key -> (dialog, df it was built for)
+        self._dialog_pool = {}
+        
+        # Pending after() id that clears the current status-bar toast
+        self._toast_job = None
+        
+        # Lowercased column names memoized per DataFrame: (id(df), columns, lowered)
+        self._cols_lower = None
+        
+        # Numeric column names and correlation matrix memoized per DataFrame:
+        # (id(df), columns, _df_version, value)
+        self._numeric_cols_cache = None
+        self._corr_cache = None
+        # Column name tuples for dialog comboboxes: (id(df), columns, _df_version, snapshot)
+        self._col_snapshot = None
+        
+        # Coalesces progressive output redraws into one idle pass every 50ms
+        self._pending_redraw = False
+        
+        # Hash of the text last written by _replace_output
+        self._last_output_sig = None
+        
+        # _df_version the cached AI report was generated for
+        self._last_report_key = None
+        self._last_report = None
+        self._report_dialog = None
+        
+        # Warm up lazily imported report/analysis modules off the UI thread
+        threading.Thread(target=_prefetch_modules, daemon=True).start()
+        
         self.setup_styles()
-        self.create_menu()
+        # Menus are filled once the first frame has painted
+        self.root.after_idle(self.create_menu)
         self.create_ui()
         self.setup_keyboard_shortcuts()
         self.check_recovery_data()
         
-        # Apply default system theme
+        # Apply default system theme to every themable tk widget built so far
+        self.theme_manager.register_tree(self.root)
         self.theme_manager.apply_theme('system')
         
         self.update_status("Ready | Auto-save: ON")
@@ -106,27 +320,8 @@ class DataAnalystApp:
         style.configure('Action.TButton', font=('Arial', 10, 'bold'), padding=5)
     
     def setup_keyboard_shortcuts(self):
-        """Setup keyboard shortcuts for common operations"""
-        # File operations
-        self.root.bind('<Control-o>', lambda e: self.import_csv())
-        self.root.bind('<Control-O>', lambda e: self.import_csv())
-        self.root.bind('<Control-e>', lambda e: self.export_csv())
-        self.root.bind('<Control-E>', lambda e: self.export_csv())
-        self.root.bind('<Control-q>', lambda e: self.root.quit())
-        self.root.bind('<Control-Q>', lambda e: self.root.quit())
-        
-        # Data operations
-        self.root.bind('<Control-d>', lambda e: self.view_data())
-        self.root.bind('<Control-D>', lambda e: self.view_data())
-        self.root.bind('<Control-s>', lambda e: self.show_statistics())
-        self.root.bind('<Control-S>', lambda e: self.show_statistics())
-        self.root.bind('<Control-r>', lambda e: self.reset_data())
-        self.root.bind('<Control-R>', lambda e: self.reset_data())
-        self.root.bind('<Control-f>', lambda e: self.advanced_filters())
-        self.root.bind('<Control-F>', lambda e: self.advanced_filters())
-        
-        # Help
-        self.root.bind('<F1>', lambda e: self.show_about())
+        """Setup keyboard shortcuts for common operations - delegates to MenuManager"""
+        self.menu_manager.bind_accelerators()
         
         self.update_status("Keyboard shortcuts enabled")
     
@@ -162,123 +357,9 @@ Would you like to recover this data?"""
                     self.autosave_manager.clear_recovery_data()
         
     def create_menu(self):
-        menubar = tk.Menu(self.root)
-        self.root.config(menu=menubar)
-        
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Import CSV", command=self.import_csv)
-        file_menu.add_command(label="Import Excel", command=self.import_excel)
-        file_menu.add_command(label="Connect to API", command=self.open_api_connector)
-        file_menu.add_separator()
-        file_menu.add_command(label="Export CSV", command=self.export_csv)
-        file_menu.add_command(label="Export Excel", command=self.export_excel)
-        file_menu.add_command(label="Export Excel with Pivot", command=self.export_excel_with_pivot)
-        file_menu.add_command(label="Export JSON", command=self.export_json)
-        file_menu.add_separator()
-        file_menu.add_command(label="Generate Executive Report (HTML)", command=self.generate_executive_report)
-        file_menu.add_command(label="Generate Quick Summary", command=self.generate_quick_summary)
-        file_menu.add_command(label="Format for Email", command=self.format_for_email)
-        file_menu.add_command(label="Export to PowerPoint", command=self.export_powerpoint)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
-        
-        data_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Data", menu=data_menu)
-        data_menu.add_command(label="View Data", command=self.view_data)
-        data_menu.add_command(label="Data Info", command=self.show_data_info)
-        data_menu.add_command(label="Statistics", command=self.show_statistics)
-        data_menu.add_separator()
-        data_menu.add_command(label="Sort Data", command=self.sort_data)
-        data_menu.add_command(label="Convert Data Types", command=self.convert_dtypes)
-        data_menu.add_separator()
-        data_menu.add_command(label="Advanced Filters", command=self.advanced_filters)
-        data_menu.add_command(label="Data Quality Check", command=self.data_quality_check)
-        data_menu.add_separator()
-        data_menu.add_command(label="Reset Data", command=self.reset_data)
-        
-        clean_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Clean", menu=clean_menu)
-        clean_menu.add_command(label="🤖 Data Quality Advisor", command=self.data_quality_advisor)
-        clean_menu.add_separator()
-        clean_menu.add_command(label="Remove Duplicates", command=self.remove_duplicates)
-        clean_menu.add_command(label="Handle Missing Values", command=self.handle_missing_values)
-        clean_menu.add_command(label="Smart Fill Missing Data", command=self.smart_fill_missing)
-        clean_menu.add_separator()
-        clean_menu.add_command(label="Find & Replace", command=self.find_replace)
-        clean_menu.add_command(label="Standardize Text Case", command=self.standardize_text_case)
-        clean_menu.add_command(label="Remove Empty Rows/Columns", command=self.remove_empty)
-        clean_menu.add_command(label="Trim All Columns", command=self.trim_all_columns)
-        clean_menu.add_separator()
-        clean_menu.add_command(label="Remove Outliers", command=self.remove_outliers)
-        clean_menu.add_command(label="Clean Order IDs", command=self.clean_order_ids)
-        clean_menu.add_separator()
-        clean_menu.add_command(label="Data Type Converter", command=self.convert_data_types)
-        clean_menu.add_command(label="Standardize Dates", command=self.standardize_dates)
-        clean_menu.add_command(label="Remove Special Characters", command=self.remove_special_chars)
-        clean_menu.add_command(label="Split/Merge Columns", command=self.split_merge_columns)
-        
-        # Analysis menu
-        analysis_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Analysis", menu=analysis_menu)
-        analysis_menu.add_command(label="🤖 AI Report Generator", command=self.ai_report_generator)
-        analysis_menu.add_separator()
-        analysis_menu.add_command(label="Group By Analysis", command=self.groupby_analysis)
-        analysis_menu.add_command(label="Pivot Table", command=self.pivot_table)
-        analysis_menu.add_command(label="SQL Query", command=self.sql_query)
-        analysis_menu.add_command(label="Data Profiling Report", command=self.data_profiling_report)
-        analysis_menu.add_command(label="Auto Insights", command=self.auto_insights)
-        analysis_menu.add_separator()
-        analysis_menu.add_command(label="Column Analysis", command=self.column_analysis)
-        analysis_menu.add_command(label="Correlation Analysis", command=self.correlation_analysis)
-        analysis_menu.add_separator()
-        analysis_menu.add_command(label="Statistical Tests", command=self.statistical_tests)
-        analysis_menu.add_command(label="A/B Testing", command=self.ab_testing)
-        analysis_menu.add_separator()
-        analysis_menu.add_command(label="RFM Customer Segmentation", command=self.rfm_segmentation)
-        analysis_menu.add_command(label="Time Series Forecasting", command=self.time_series_forecasting)
-        analysis_menu.add_separator()
-        analysis_menu.add_command(label="Sales Dashboard", command=self.sales_dashboard)
-        analysis_menu.add_command(label="Customer Dashboard", command=self.customer_dashboard)
-        analysis_menu.add_command(label="E-commerce Dashboard", command=self.ecommerce_dashboard)
-        
-        viz_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Visualize", menu=viz_menu)
-        viz_menu.add_command(label="Bar Chart", command=self.plot_bar)
-        viz_menu.add_command(label="Line Chart", command=self.plot_line)
-        viz_menu.add_command(label="Pie Chart", command=self.plot_pie)
-        viz_menu.add_separator()
-        viz_menu.add_command(label="Histogram", command=self.plot_histogram)
-        viz_menu.add_command(label="Box Plot", command=self.plot_boxplot)
-        viz_menu.add_command(label="Scatter Plot", command=self.plot_scatter)
-        viz_menu.add_separator()
-        viz_menu.add_command(label="Distribution Plot (KDE)", command=self.plot_distribution)
-        viz_menu.add_command(label="Violin Plot", command=self.plot_violin)
-        viz_menu.add_command(label="Correlation Heatmap", command=self.plot_heatmap)
-        
-        # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Tools", menu=tools_menu)
-        tools_menu.add_command(label="Compare Datasets", command=self.compare_datasets)
-        
-        # View menu for themes
-        view_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="View", menu=view_menu)
-        theme_menu = tk.Menu(view_menu, tearoff=0)
-        view_menu.add_cascade(label="Theme", menu=theme_menu)
-        theme_menu.add_command(label="System Default", command=lambda: self.change_theme('system'))
-        theme_menu.add_command(label="Light Mode", command=lambda: self.change_theme('light'))
-        theme_menu.add_command(label="Dark Mode", command=lambda: self.change_theme('dark'))
-        
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="User Guide & Tutorials", command=self.show_user_guide)
-        help_menu.add_command(label="Quick Start Guide", command=self.show_quick_start)
-        help_menu.add_separator()
-        help_menu.add_command(label="Performance Monitor", command=self.performance_monitor)
-        help_menu.add_separator()
-        help_menu.add_command(label="About", command=self.show_about)
-        
+        """Build the menu bar - delegates to MenuManager"""
+        self.menu_manager.create_menu()
+    
     def create_ui(self):
         title_frame = ttk.Frame(self.root)
         title_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -392,8 +473,304 @@ Would you like to recover this data?"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.status_bar.config(text=f"{timestamp} | {message}")
         
+    def _toast(self, message, ms=3000):
+        """
+        Show a transient success message in the status bar instead of a modal popup.
+        
+        The message reverts to "Ready" after ms milliseconds unless another
+        status has replaced it in the meantime.
+        """
+        self.update_status(message)
+        shown = self.status_bar.cget('text')
+        if self._toast_job is not None:
+            self.root.after_cancel(self._toast_job)
+        
+        def clear():
+            self._toast_job = None
+            if self.status_bar.cget('text') == shown:
+                self.update_status("Ready")
+        
+        self._toast_job = self.root.after(ms, clear)
+    
+    def _cols_lower_for(self, df):
+        """
+        Return df.columns lowercased, computed once per DataFrame.
+        
+        The cache is keyed by id(df) and the columns Index object, so renaming
+        columns (which assigns a new Index) invalidates it as well.
+        
+        Args:
+            df: DataFrame whose column names are needed in lowercase
+        
+        Returns:
+            pd.Index of lowercased column names, aligned with df.columns
+        """
+        cached = self._cols_lower
+        if cached is not None and cached[0] == id(df) and cached[1] is df.columns:
+            return cached[2]
+        lowered = df.columns.astype(str).str.lower()
+        self._cols_lower = (id(df), df.columns, lowered)
+        return lowered
+    
+    @property
+    def df(self):
+        """The current dataset (None until data is loaded)."""
+        return self._df
+    
+    @df.setter
+    def df(self, value):
+        # Every replacement of the dataset invalidates version-keyed caches
+        self._df = value
+        self._df_version += 1
+    
+    def _cache_valid(self, cached, df):
+        """True if cached was built for df as it is now (same object, columns and version)."""
+        return (cached is not None and cached[0] == id(df)
+                and cached[1] is df.columns and cached[2] == self._df_version)
+    
+    def get_numeric_columns(self, df=None):
+        """
+        Return the numeric column names of df (default: self.df), computed once per version.
+        
+        Args:
+            df: DataFrame to inspect; defaults to the current dataset
+        
+        Returns:
+            tuple of numeric column names
+        """
+        df = self.df if df is None else df
+        if self._cache_valid(self._numeric_cols_cache, df):
+            return self._numeric_cols_cache[3]
+        cols = tuple(df.select_dtypes(include='number').columns)
+        self._numeric_cols_cache = (id(df), df.columns, self._df_version, cols)
+        return cols
+    
+    def get_corr_matrix(self, df=None):
+        """
+        Return the correlation matrix of df's numeric columns, computed once per version.
+        
+        Args:
+            df: DataFrame to correlate; defaults to the current dataset
+        
+        Returns:
+            DataFrame with pairwise correlations of the numeric columns
+        """
+        df = self.df if df is None else df
+        if self._cache_valid(self._corr_cache, df):
+            return self._corr_cache[3]
+        corr = _numeric_corr(df[list(self.get_numeric_columns(df))])
+        self._corr_cache = (id(df), df.columns, self._df_version, corr)
+        return corr
+    
+    def get_column_snapshot(self):
+        """
+        Return the current dataset's column names, computed once per version.
+        
+        Returns:
+            dict with 'version', 'all' and 'numeric' (tuples of column names)
+        """
+        df = self.df
+        if self._cache_valid(self._col_snapshot, df):
+            return self._col_snapshot[3]
+        snapshot = {
+            'version': self._df_version,
+            'all': tuple(df.columns),
+            'numeric': self.get_numeric_columns(df),
+        }
+        self._col_snapshot = (id(df), df.columns, self._df_version, snapshot)
+        return snapshot
+    
+    def _make_column_combo(self, parent, variable, kind='all', extra=(), width=20):
+        """
+        Create a Combobox listing the dataset's columns, filled when first opened.
+        
+        The column list is only pushed to Tk by postcommand, so dialogs on
+        very wide frames open without copying every name up front.
+        
+        Args:
+            parent: Parent widget
+            variable: StringVar holding the selection
+            kind: 'all' or 'numeric' column list from get_column_snapshot
+            extra: Entries listed before the column names (e.g. ('None',))
+            width: Combobox width
+        
+        Returns:
+            The ttk.Combobox (not yet packed)
+        """
+        combo = ttk.Combobox(parent, textvariable=variable, values=(), width=width)
+        combo.configure(postcommand=lambda: combo.configure(
+            values=tuple(extra) + self.get_column_snapshot()[kind]))
+        return combo
+    
+    def _schedule_redraw(self):
+        """Request one output redraw within 50ms, merging bursts of inserts."""
+        if not self._pending_redraw:
+            self._pending_redraw = True
+            self.root.after(50, self._flush_redraw)
+    
+    def _flush_redraw(self):
+        """Run the single pending redraw scheduled by _schedule_redraw."""
+        self._pending_redraw = False
+        self.output_text.update_idletasks()
+    
+    def _replace_output(self, text):
+        """
+        Replace the output panel contents with text in a single widget operation.
+        
+        Skips the rewrite when text matches what this method last wrote and the
+        widget has not been modified since (tracked via the Text modified flag).
+        """
+        sig = hash(text)
+        if sig == self._last_output_sig and not self.output_text.edit_modified():
+            return
+        self.output_text.replace("1.0", tk.END, text)
+        self.output_text.edit_modified(False)
+        self._last_output_sig = sig
+        self._schedule_redraw()
+    
+    def _make_readonly_text(self, parent, text=None, font=('Courier', 10)):
+        """
+        Create a ScrolledText for static help content, with undo disabled.
+        
+        Args:
+            parent: Parent window
+            text: Content to insert; the widget is then made read-only.
+                When None the widget is left writable for a streaming loader.
+            font: Widget font
+        
+        Returns:
+            The ScrolledText widget (not yet packed)
+        """
+        text_widget = scrolledtext.ScrolledText(parent, wrap=tk.WORD, font=font,
+                                                undo=False, maxundo=0, autoseparators=False)
+        self._register_scrolled_text(text_widget)
+        if text is not None:
+            text_widget.insert(1.0, text)
+            text_widget.config(state='disabled')  # Read-only
+        return text_widget
+    
+    def _register_scrolled_text(self, text_widget):
+        """Register a ScrolledText and its container frame for theme changes"""
+        self.theme_manager.register(text_widget)
+        self.theme_manager.register(text_widget.frame)
+    
+    def _stream_text_file(self, window, text_widget, path, chunk_size=65536):
+        """
+        Fill text_widget from a file in 64KB chunks, one chunk per event-loop turn.
+        
+        Large guides paint progressively instead of blocking the UI on a
+        single insert, and the file is never held in memory as one string.
+        The widget is made read-only once the file is fully loaded.
+        """
+        fp = open(path, 'r', encoding='utf-8')
+        
+        def pump():
+            if not window.winfo_exists():
+                fp.close()
+                return
+            chunk = fp.read(chunk_size)
+            if chunk:
+                text_widget.insert(tk.END, chunk)
+                window.after(1, pump)
+            else:
+                fp.close()
+                text_widget.config(state='disabled')
+        
+        window.after_idle(pump)
+    
+    def _write_output(self, text):
+        """Show text in the output panel and switch to the output tab"""
+        self._replace_output(text)
+        self.notebook.select(0)
+    
+    def _write_report(self, sections):
+        """
+        Stream report sections into the output panel and switch to its tab.
+        
+        The panel is cleared once and each section is appended as it is
+        produced, so no concatenated copy of the report is ever built; the
+        widget is repainted after every 16KB of text.
+        
+        Args:
+            sections: Iterable of strings, typically a generator
+        """
+        self.output_text.delete("1.0", tk.END)
+        pending = 0
+        for section in sections:
+            self.output_text.insert(tk.END, section)
+            pending += len(section)
+            if pending >= 16384:
+                self.output_text.update_idletasks()
+                pending = 0
+        # Content no longer matches _replace_output's last signature
+        self._last_output_sig = None
+        self.output_text.edit_modified(False)
+        self.notebook.select(0)
+    
+    def _run_async(self, work, on_done, error_title="Operation failed", on_error=None):
+        """
+        Run work() on a daemon worker thread and deliver its result on the Tk thread.
+        
+        The future is polled with root.after, starting at 20ms and backing off
+        to 100ms, so no Tk call is ever made from the worker thread.
+        
+        Args:
+            work: Callable executed in the background; its return value is the result
+            on_done: Callable receiving the result on the UI thread
+            error_title: Prefix of the error message shown if work() raises
+            on_error: Optional callable receiving the exception on the UI thread
+                before the error message is shown
+        """
+        future = _submit_daemon(work)
+        
+        def poll(delay):
+            if not future.done():
+                self.root.after(delay, poll, min(delay * 2, 100))
+                return
+            error = future.exception()
+            if error is None:
+                on_done(future.result())
+            else:
+                if on_error is not None:
+                    on_error(error)
+                self.update_status(error_title)
+                messagebox.showerror("Error", f"{error_title}:\n{error}")
+        
+        self.root.after(20, poll, 20)
+    
+    def _show_pooled_dialog(self, key, factory):
+        """
+        Show a dialog, reusing the window from the previous open.
+        
+        Dialogs are bound to the DataFrame they were built with, so a pooled
+        window is only reused while self.df is still that object; otherwise it
+        is rebuilt. Closing the window hides it instead of destroying it.
+        
+        Args:
+            key: Pool key for the dialog kind
+            factory: Callable that builds the dialog and returns its Toplevel
+        """
+        entry = self._dialog_pool.pop(key, None)
+        if entry is not None:
+            dialog, built_for = entry
+            if dialog.winfo_exists():
+                if built_for is self.df:
+                    self._dialog_pool[key] = entry
+                    dialog.deiconify()
+                    dialog.lift()
+                    return dialog
+                dialog.destroy()
+        
+        dialog = factory()
+        if dialog is not None:
+            self.theme_manager.register_tree(dialog)
+            dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+            self._dialog_pool[key] = (dialog, self.df)
+        return dialog
+    
     def update_autosave_data(self):
         """Update autosave manager with current dataframe after modifications"""
+        self._df_version += 1
         if self.df is not None:
             self.autosave_manager.update_data(self.df)
     
@@ -617,196 +994,48 @@ Would you like to recover this data?"""
         APIConnectorWindow(self.root, load_api_data)
     
     def export_csv(self):
-        if self.df is None:
-            messagebox.showwarning("Warning", "No data to export!")
-            return
-        file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
-        if file_path:
-            try:
-                # Use data service
-                self.data_service.export_csv(self.df, file_path)
-                messagebox.showinfo("Success", f"Exported to:\n{file_path}")
-                self.update_status(f"Exported to CSV")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed:\n{str(e)}")
+        """Export data to CSV - delegates to ExportManager"""
+        self.export_manager.export_csv()
     
     def export_excel(self):
-        if self.df is None:
-            messagebox.showwarning("Warning", "No data to export!")
-            return
-        file_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx")])
-        if file_path:
-            try:
-                # Use data service
-                self.data_service.export_excel(self.df, file_path)
-                messagebox.showinfo("Success", f"Exported to:\n{file_path}")
-                self.update_status(f"Exported to Excel")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed:\n{str(e)}")
+        """Export data to Excel - delegates to ExportManager"""
+        self.export_manager.export_excel()
     
     def export_json(self):
-        if self.df is None:
-            messagebox.showwarning("Warning", "No data to export!")
-            return
-        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
-        if file_path:
-            try:
-                # Use data service
-                self.data_service.export_json(self.df, file_path)
-                messagebox.showinfo("Success", f"Exported to:\n{file_path}")
-                self.update_status(f"Exported to JSON")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed:\n{str(e)}")
+        """Export data to JSON - delegates to ExportManager"""
+        self.export_manager.export_json()
+    
+    def export_parquet(self):
+        """Export data to Parquet - delegates to ExportManager"""
+        self.export_manager.export_parquet()
+    
+    def export_feather(self):
+        """Export data to Feather - delegates to ExportManager"""
+        self.export_manager.export_feather()
     
     def export_excel_with_pivot(self):
-        """Export Excel with pivot table configuration dialog"""
-        if self.df is None:
-            messagebox.showwarning("Warning", "No data to export!")
-            return
-        
-        # Create configuration dialog
-        pivot_window = tk.Toplevel(self.root)
-        pivot_window.title("Export Excel with Pivot Table")
-        pivot_window.geometry("500x450")
-        pivot_window.transient(self.root)
-        pivot_window.grab_set()
-        
-        # Title
-        ttk.Label(pivot_window, text="Configure Pivot Table Export", style='Header.TLabel').pack(pady=10)
-        
-        # Frame for configuration
-        config_frame = ttk.Frame(pivot_window, padding=20)
-        config_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Get column names
-        columns = list(self.df.columns)
-        
-        # Index (Rows) selection
-        ttk.Label(config_frame, text="Row Field (Index):").grid(row=0, column=0, sticky='w', pady=5)
-        index_var = tk.StringVar()
-        index_combo = ttk.Combobox(config_frame, textvariable=index_var, values=columns, width=30)
-        index_combo.grid(row=0, column=1, pady=5, padx=5)
-        if columns:
-            index_combo.current(0)
-        
-        # Columns selection
-        ttk.Label(config_frame, text="Column Field (optional):").grid(row=1, column=0, sticky='w', pady=5)
-        column_var = tk.StringVar()
-        column_combo = ttk.Combobox(config_frame, textvariable=column_var, values=['None'] + columns, width=30)
-        column_combo.grid(row=1, column=1, pady=5, padx=5)
-        column_combo.current(0)
-        
-        # Values selection
-        ttk.Label(config_frame, text="Value Field:").grid(row=2, column=0, sticky='w', pady=5)
-        value_var = tk.StringVar()
-        
-        # Filter numeric columns for values
-        numeric_columns = list(self.df.select_dtypes(include=['number']).columns)
-        if not numeric_columns:
-            numeric_columns = columns
-        
-        value_combo = ttk.Combobox(config_frame, textvariable=value_var, values=numeric_columns, width=30)
-        value_combo.grid(row=2, column=1, pady=5, padx=5)
-        if numeric_columns:
-            value_combo.current(0)
-        
-        # Aggregation function
-        ttk.Label(config_frame, text="Aggregation Function:").grid(row=3, column=0, sticky='w', pady=5)
-        aggfunc_var = tk.StringVar(value='sum')
-        aggfunc_combo = ttk.Combobox(config_frame, textvariable=aggfunc_var, 
-                                     values=['sum', 'mean', 'count', 'min', 'max', 'median'], 
-                                     width=30)
-        aggfunc_combo.grid(row=3, column=1, pady=5, padx=5)
-        
-        # Add chart checkbox
-        add_chart_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(config_frame, text="Include Bar Chart", variable=add_chart_var).grid(row=4, column=0, columnspan=2, pady=10)
-        
-        # Result label
-        result_label = ttk.Label(config_frame, text="", foreground="blue")
-        result_label.grid(row=5, column=0, columnspan=2, pady=5)
-        
-        def perform_export():
-            """Perform the export with pivot"""
-            try:
-                # Get file path
-                file_path = filedialog.asksaveasfilename(
-                    defaultextension=".xlsx", 
-                    filetypes=[("Excel files", "*.xlsx")],
-                    parent=pivot_window
-                )
-                
-                if not file_path:
-                    return
-                
-                # Build pivot configuration
-                pivot_config = {
-                    'index': index_var.get(),
-                    'columns': None if column_var.get() == 'None' else column_var.get(),
-                    'values': value_var.get(),
-                    'aggfunc': aggfunc_var.get()
-                }
-                
-                # Perform export
-                result_label.config(text="Exporting...", foreground="blue")
-                pivot_window.update()
-                
-                if add_chart_var.get():
-                    success, message = ExcelPivotExporter.export_with_charts(
-                        self.df, file_path, pivot_config, chart_type='bar'
-                    )
-                else:
-                    success, message = ExcelPivotExporter.export_with_pivot(
-                        self.df, file_path, pivot_config
-                    )
-                
-                if success:
-                    messagebox.showinfo("Success", message, parent=pivot_window)
-                    self.update_status("Exported Excel with pivot table")
-                    pivot_window.destroy()
-                else:
-                    result_label.config(text=f"Error: {message}", foreground="red")
-            
-            except Exception as e:
-                result_label.config(text=f"Error: {str(e)}", foreground="red")
-                messagebox.showerror("Error", f"Export failed:\n{str(e)}", parent=pivot_window)
-        
-        # Buttons
-        button_frame = ttk.Frame(config_frame)
-        button_frame.grid(row=6, column=0, columnspan=2, pady=20)
-        
-        ttk.Button(button_frame, text="Export", command=perform_export, style='Action.TButton').pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=pivot_window.destroy).pack(side=tk.LEFT, padx=5)
+        """Export Excel with pivot table - delegates to ExportManager"""
+        self.export_manager.export_excel_with_pivot()
     
     def view_data(self):
         if self.df is None:
             messagebox.showwarning("Warning", "No data loaded!")
             return
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, f"=== DATA VIEW (First 100 rows) ===\n\n")
-        self.output_text.update_idletasks()  # Show header
-        self.output_text.insert(tk.END, f"{self.df.head(100).to_string()}")
-        self.output_text.update_idletasks()  # Show data
-        self.notebook.select(0)
+        self._write_report(("=== DATA VIEW (First 100 rows) ===\n\n",
+                            self.df.head(100).to_string()))
         self.update_status("Displaying data")
     
     def show_data_info(self):
         if self.df is None:
             messagebox.showwarning("Warning", "No data loaded!")
             return
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, "=== DATA INFORMATION ===\n\n")
-        self.output_text.update_idletasks()  # Show header
-        
         info_str = f"Shape: {self.df.shape[0]} rows × {self.df.shape[1]} columns\n\n"
         for col in self.df.columns:
             non_null = self.df[col].notna().sum()
             null_count = self.df[col].isna().sum()
             info_str += f"{col}: {self.df[col].dtype} | Non-Null: {non_null} | Null: {null_count} | Unique: {self.df[col].nunique()}\n"
         
-        self.output_text.insert(tk.END, info_str)
-        self.output_text.update_idletasks()  # Show info
-        self.notebook.select(0)
+        self._write_report(("=== DATA INFORMATION ===\n\n", info_str))
         self.update_status("Data information displayed")
     
     def show_statistics(self):
@@ -818,12 +1047,12 @@ Would you like to recover this data?"""
         stats_df = self.df.describe()
         
         # Display header in text
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, "=" * 80 + "\n")
-        self.output_text.insert(tk.END, "STATISTICAL SUMMARY\n")
-        self.output_text.insert(tk.END, f"Numeric Columns: {len(stats_df.columns)}\n")
-        self.output_text.insert(tk.END, "=" * 80 + "\n")
-        self.output_text.update_idletasks()
+        self._write_report((
+            _SEP80 + "\n",
+            "STATISTICAL SUMMARY\n",
+            f"Numeric Columns: {len(stats_df.columns)}\n",
+            _SEP80 + "\n",
+        ))
         
         # Display statistics in Excel-like grid
         self.display_results_in_grid(stats_df, title="Statistical Summary")
@@ -842,17 +1071,16 @@ Would you like to recover this data?"""
             original_count = len(self.df)
             
             # Show clear output message
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, "=" * 80 + "\n")
-            self.output_text.insert(tk.END, "DATA RESET - FILTERS CLEARED\n")
-            self.output_text.insert(tk.END, "=" * 80 + "\n\n")
-            self.output_text.insert(tk.END, f"✓ Filtered data had: {filtered_count} rows\n")
-            self.output_text.insert(tk.END, f"✓ Original data restored: {original_count} rows\n")
-            self.output_text.insert(tk.END, f"✓ All filters and modifications cleared\n\n")
-            self.output_text.insert(tk.END, "=" * 80 + "\n")
-            self.output_text.insert(tk.END, "SUCCESS: Full dataset restored!\n")
-            self.output_text.update_idletasks()
-            self.notebook.select(0)  # Switch to Output tab
+            self._write_report((
+                _SEP80 + "\n",
+                "DATA RESET - FILTERS CLEARED\n",
+                _SEP80 + "\n\n",
+                f"✓ Filtered data had: {filtered_count} rows\n",
+                f"✓ Original data restored: {original_count} rows\n",
+                f"✓ All filters and modifications cleared\n\n",
+                _SEP80 + "\n",
+                "SUCCESS: Full dataset restored!\n",
+            ))
             
             self.update_info_panel()
             self.view_data()
@@ -871,30 +1099,30 @@ Would you like to recover this data?"""
             self.update_autosave_data()
             
             # Output to text area
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, "=" * 80 + "\n")
-            self.output_text.insert(tk.END, "REMOVE DUPLICATES - OPERATION COMPLETE\n")
-            self.output_text.insert(tk.END, "=" * 80 + "\n\n")
-            self.output_text.insert(tk.END, f"✓ Original rows: {before}\n")
-            self.output_text.insert(tk.END, f"✓ Duplicates removed: {removed}\n")
-            self.output_text.insert(tk.END, f"✓ Remaining rows: {len(self.df)}\n\n")
-            self.output_text.insert(tk.END, f"Columns checked: {', '.join(subset_cols)}\n")
-            self.output_text.insert(tk.END, f"Keep strategy: {keep_option}\n\n")
-            self.output_text.insert(tk.END, "=" * 80 + "\n")
+            out = [
+                _SEP80 + "\n",
+                "REMOVE DUPLICATES - OPERATION COMPLETE\n",
+                _SEP80 + "\n\n",
+                f"✓ Original rows: {before}\n",
+                f"✓ Duplicates removed: {removed}\n",
+                f"✓ Remaining rows: {len(self.df)}\n\n",
+                f"Columns checked: {', '.join(subset_cols)}\n",
+                f"Keep strategy: {keep_option}\n\n",
+                _SEP80 + "\n",
+            ]
             if removed > 0:
-                self.output_text.insert(tk.END, f"SUCCESS: {removed} duplicate row(s) removed from dataset\n")
+                out.append(f"SUCCESS: {removed} duplicate row(s) removed from dataset\n")
             else:
-                self.output_text.insert(tk.END, "INFO: No duplicates found in selected columns\n")
-            self.output_text.update_idletasks()
-            self.notebook.select(0)
+                out.append("INFO: No duplicates found in selected columns\n")
+            self._write_report(out)
             
             self.update_info_panel()
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_remove_duplicates_dialog(
+        self._show_pooled_dialog('remove_duplicates', lambda: CleaningDialogs.show_remove_duplicates_dialog(
             self.root, self.df, self.cleaning_service, on_complete
-        )
+        ))
     
     def handle_missing_values(self):
         """Handle missing values - delegates to dialog"""
@@ -908,28 +1136,28 @@ Would you like to recover this data?"""
             self.update_autosave_data()
             
             # Output to text area
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, "=" * 80 + "\n")
-            self.output_text.insert(tk.END, "HANDLE MISSING VALUES - OPERATION COMPLETE\n")
-            self.output_text.insert(tk.END, "=" * 80 + "\n\n")
-            self.output_text.insert(tk.END, f"Method applied: {method.upper()}\n")
-            self.output_text.insert(tk.END, f"Target: {selected_col}\n")
+            out = [
+                _SEP80 + "\n",
+                "HANDLE MISSING VALUES - OPERATION COMPLETE\n",
+                _SEP80 + "\n\n",
+                f"Method applied: {method.upper()}\n",
+                f"Target: {selected_col}\n",
+            ]
             if custom_val:
-                self.output_text.insert(tk.END, f"Custom value: {custom_val}\n")
-            self.output_text.insert(tk.END, f"\n✓ Current missing values in dataset: {self.df.isnull().sum().sum()}\n")
-            self.output_text.insert(tk.END, f"✓ Total rows: {len(self.df)}\n\n")
-            self.output_text.insert(tk.END, "=" * 80 + "\n")
-            self.output_text.insert(tk.END, f"SUCCESS: Missing values handled using {method} method\n")
-            self.output_text.update_idletasks()
-            self.notebook.select(0)
+                out.append(f"Custom value: {custom_val}\n")
+            out.append(f"\n✓ Current missing values in dataset: {self.df.isnull().sum().sum()}\n")
+            out.append(f"✓ Total rows: {len(self.df)}\n\n")
+            out.append(_SEP80 + "\n")
+            out.append(f"SUCCESS: Missing values handled using {method} method\n")
+            self._write_report(out)
             
             self.update_info_panel()
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_handle_missing_dialog(
+        self._show_pooled_dialog('handle_missing', lambda: CleaningDialogs.show_handle_missing_dialog(
             self.root, self.df, on_complete
-        )
+        ))
     
     def remove_outliers(self):
         """Remove outliers from numeric columns - delegates to dialog"""
@@ -944,30 +1172,30 @@ Would you like to recover this data?"""
             self.update_autosave_data()
             
             # Output to text area
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, "=" * 80 + "\n")
-            self.output_text.insert(tk.END, "REMOVE OUTLIERS - OPERATION COMPLETE\n")
-            self.output_text.insert(tk.END, "=" * 80 + "\n\n")
-            self.output_text.insert(tk.END, f"Column analyzed: {details['column']}\n")
-            self.output_text.insert(tk.END, f"Detection method: {details['method']}\n\n")
-            self.output_text.insert(tk.END, f"✓ Original rows: {before}\n")
-            self.output_text.insert(tk.END, f"✓ Outliers removed: {removed}\n")
-            self.output_text.insert(tk.END, f"✓ Remaining rows: {len(self.df)}\n\n")
-            self.output_text.insert(tk.END, "=" * 80 + "\n")
+            out = [
+                _SEP80 + "\n",
+                "REMOVE OUTLIERS - OPERATION COMPLETE\n",
+                _SEP80 + "\n\n",
+                f"Column analyzed: {details['column']}\n",
+                f"Detection method: {details['method']}\n\n",
+                f"✓ Original rows: {before}\n",
+                f"✓ Outliers removed: {removed}\n",
+                f"✓ Remaining rows: {len(self.df)}\n\n",
+                _SEP80 + "\n",
+            ]
             if removed > 0:
-                self.output_text.insert(tk.END, f"SUCCESS: {removed} outlier row(s) removed from dataset\n")
+                out.append(f"SUCCESS: {removed} outlier row(s) removed from dataset\n")
             else:
-                self.output_text.insert(tk.END, "INFO: No outliers detected with current settings\n")
-            self.output_text.update_idletasks()
-            self.notebook.select(0)
+                out.append("INFO: No outliers detected with current settings\n")
+            self._write_report(out)
             
             self.update_info_panel()
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_remove_outliers_dialog(
+        self._show_pooled_dialog('remove_outliers', lambda: CleaningDialogs.show_remove_outliers_dialog(
             self.root, self.df, self.cleaning_service, on_complete
-        )
+        ))
     
     def clean_order_ids(self):
         """Clean Order IDs by removing letter suffixes - delegates to dialog"""
@@ -981,19 +1209,16 @@ Would you like to recover this data?"""
             self.update_autosave_data()
             
             # Display output
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, output_msg)
-            self.output_text.update_idletasks()
-            self.notebook.select(0)  # Switch to Output tab
+            self._write_output(output_msg)
             
             self.update_info_panel()
             self.view_data()
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_clean_order_ids_dialog(
+        self._show_pooled_dialog('clean_order_ids', lambda: CleaningDialogs.show_clean_order_ids_dialog(
             self.root, self.df, on_complete
-        )
+        ))
     
     def smart_fill_missing(self):
         """Smart fill missing values by looking up matching IDs - delegates to dialog"""
@@ -1007,34 +1232,34 @@ Would you like to recover this data?"""
             self.update_autosave_data()
             
             # Output results
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, "=" * 80 + "\n")
-            self.output_text.insert(tk.END, "SMART FILL MISSING DATA - COMPLETE\n")
-            self.output_text.insert(tk.END, "=" * 80 + "\n\n")
-            self.output_text.insert(tk.END, f"Target column: {details['target_column']}\n")
-            self.output_text.insert(tk.END, f"Lookup key: {details['lookup_key']}\n\n")
-            self.output_text.insert(tk.END, f"✓ Missing values before: {details['before']}\n")
-            self.output_text.insert(tk.END, f"✓ Values filled: {filled_count}\n")
-            self.output_text.insert(tk.END, f"✓ Still missing: {details['still_missing']}\n\n")
-            self.output_text.insert(tk.END, "=" * 80 + "\n")
+            out = [
+                _SEP80 + "\n",
+                "SMART FILL MISSING DATA - COMPLETE\n",
+                _SEP80 + "\n\n",
+                f"Target column: {details['target_column']}\n",
+                f"Lookup key: {details['lookup_key']}\n\n",
+                f"✓ Missing values before: {details['before']}\n",
+                f"✓ Values filled: {filled_count}\n",
+                f"✓ Still missing: {details['still_missing']}\n\n",
+                _SEP80 + "\n",
+            ]
             
             if filled_count > 0:
-                self.output_text.insert(tk.END, f"SUCCESS: Filled {filled_count} missing value(s)\n")
-                self.output_text.insert(tk.END, f"Example: Found {details['target_column']} by matching {details['lookup_key']}\n")
+                out.append(f"SUCCESS: Filled {filled_count} missing value(s)\n")
+                out.append(f"Example: Found {details['target_column']} by matching {details['lookup_key']}\n")
             else:
-                self.output_text.insert(tk.END, "INFO: No values could be filled (no matching keys found)\n")
+                out.append("INFO: No values could be filled (no matching keys found)\n")
             
-            self.output_text.update_idletasks()
-            self.notebook.select(0)
+            self._write_report(out)
             
             self.update_info_panel()
             self.view_data()
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_smart_fill_missing_dialog(
+        self._show_pooled_dialog('smart_fill_missing', lambda: CleaningDialogs.show_smart_fill_missing_dialog(
             self.root, self.df, self.cleaning_service, on_complete
-        )
+        ))
     
     def quality_advisor(self):
         """AI-powered data quality recommendations - delegates to dialog"""
@@ -1054,7 +1279,8 @@ Would you like to recover this data?"""
         }
         
         # Use dialog factory
-        AIDialogs.show_quality_advisor_dialog(self.root, self.df, self.ai_service, action_map)
+        self._show_pooled_dialog('quality_advisor', lambda: AIDialogs.show_quality_advisor_dialog(
+            self.root, self.df, self.ai_service, action_map))
     
     def ai_report_generator(self):
         """AI-powered automatic report generation - delegates to dialog"""
@@ -1062,8 +1288,37 @@ Would you like to recover this data?"""
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
-        # Use dialog factory
-        AIDialogs.show_ai_report_generator_dialog(self.root, self.df, self.ai_service, self.root)
+        df = self.df
+        # The version changes on every assignment and in-place edit of self.df
+        key = self._df_version
+        if self._last_report_key == key:
+            self._show_report_dialog(df, self._last_report)
+            return
+        
+        # Generate off the UI thread, then open the dialog with the result
+        self.update_status("Generating AI report...")
+        
+        def on_done(report):
+            self._last_report_key = key
+            self._last_report = report
+            self.update_status("AI report generated")
+            self._show_report_dialog(df, report)
+        
+        self._run_async(lambda: self.ai_service.generate_report(df), on_done, "Report generation failed")
+    
+    def _show_report_dialog(self, df, report):
+        """Show report in the AI report dialog, reusing the hidden window if present"""
+        dialog = self._report_dialog
+        if dialog is not None and dialog.winfo_exists():
+            dialog.set_report(report)
+            dialog.deiconify()
+            dialog.lift()
+            return
+        dialog = AIDialogs.show_ai_report_generator_dialog(
+            self.root, df, self.ai_service, self.root, report
+        )
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+        self._report_dialog = dialog
     
     def find_replace(self):
         """Find and replace values - delegates to dialog"""
@@ -1080,9 +1335,9 @@ Would you like to recover this data?"""
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_find_replace_dialog(
+        self._show_pooled_dialog('find_replace', lambda: CleaningDialogs.show_find_replace_dialog(
             self.root, self.df, self.cleaning_service, on_complete
-        )
+        ))
     
     def standardize_text_case(self):
         """Standardize text case - delegates to dialog"""
@@ -1099,9 +1354,9 @@ Would you like to recover this data?"""
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_standardize_text_case_dialog(
+        self._show_pooled_dialog('standardize_text_case', lambda: CleaningDialogs.show_standardize_text_case_dialog(
             self.root, self.df, self.cleaning_service, on_complete
-        )
+        ))
     
     def remove_empty(self):
         """Remove empty rows/columns - delegates to dialog"""
@@ -1118,9 +1373,9 @@ Would you like to recover this data?"""
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_remove_empty_dialog(
+        self._show_pooled_dialog('remove_empty', lambda: CleaningDialogs.show_remove_empty_dialog(
             self.root, self.df, self.cleaning_service, on_complete
-        )
+        ))
     
     def trim_all_columns(self):
         """Trim whitespace from all text columns - delegates to dialog"""
@@ -1156,9 +1411,9 @@ Would you like to recover this data?"""
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_convert_data_types_dialog(
+        self._show_pooled_dialog('convert_data_types', lambda: CleaningDialogs.show_convert_data_types_dialog(
             self.root, self.df, self.cleaning_service, on_complete
-        )
+        ))
     
     def standardize_dates(self):
         """Standardize date formats - delegates to dialog"""
@@ -1175,9 +1430,9 @@ Would you like to recover this data?"""
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_standardize_dates_dialog(
+        self._show_pooled_dialog('standardize_dates', lambda: CleaningDialogs.show_standardize_dates_dialog(
             self.root, self.df, self.cleaning_service, on_complete
-        )
+        ))
     
     def remove_special_chars(self):
         """Remove special characters - delegates to dialog"""
@@ -1194,9 +1449,9 @@ Would you like to recover this data?"""
             self.update_status(status_msg)
         
         # Use dialog factory
-        CleaningDialogs.show_remove_special_chars_dialog(
+        self._show_pooled_dialog('remove_special_chars', lambda: CleaningDialogs.show_remove_special_chars_dialog(
             self.root, self.df, self.cleaning_service, on_complete
-        )
+        ))
     
     def split_merge_columns(self):
         """Split or merge columns - delegates to dialog"""
@@ -1222,9 +1477,9 @@ Would you like to recover this data?"""
                 self.view_data()
                 self.update_status(status_msg)
             
-            CleaningDialogs.show_split_column_dialog(
+            self._show_pooled_dialog('split_column', lambda: CleaningDialogs.show_split_column_dialog(
                 self.root, self.df, self.cleaning_service, on_complete
-            )
+            ))
         
         def open_merge():
             choice_dialog.destroy()
@@ -1237,9 +1492,9 @@ Would you like to recover this data?"""
                 self.view_data()
                 self.update_status(status_msg)
             
-            CleaningDialogs.show_merge_columns_dialog(
+            self._show_pooled_dialog('merge_columns', lambda: CleaningDialogs.show_merge_columns_dialog(
                 self.root, self.df, self.cleaning_service, on_complete
-            )
+            ))
         
         btn_frame = ttk.Frame(choice_dialog)
         btn_frame.pack(pady=20)
@@ -1281,21 +1536,23 @@ Would you like to recover this data?"""
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-        if len(numeric_cols) < 2:
+        if len(self.get_numeric_columns()) < 2:
             messagebox.showwarning("Warning", "Need at least 2 numeric columns!")
             return
         
-        corr = self.df[numeric_cols].corr()
-        self.create_plot(lambda fig, ax: sns.heatmap(corr, annot=True, fmt='.2f', cmap='coolwarm', ax=ax, square=True))
+        corr = self.get_corr_matrix()
+        self.create_plot(lambda fig, ax: _seaborn().heatmap(corr, annot=True, fmt='.2f', cmap='coolwarm', ax=ax, square=True))
     
     def create_plot(self, plot_func):
         # Clear previous plot
         for widget in self.viz_canvas_frame.winfo_children():
             widget.destroy()
         
+        # Plot style is applied before the first figure is created
+        _seaborn()
+        
         # Create matplotlib figure - FIX: Use Figure from matplotlib.figure
-        from matplotlib.figure import Figure
+        Figure = _lazy('matplotlib.figure', 'Figure')
         fig = Figure(figsize=(12, 8), dpi=100)
         fig.patch.set_facecolor('white')
         
@@ -1310,12 +1567,13 @@ Would you like to recover this data?"""
             return
         
         # Embed in tkinter
+        FigureCanvasTkAgg = _lazy('matplotlib.backends.backend_tkagg', 'FigureCanvasTkAgg')
         canvas = FigureCanvasTkAgg(fig, self.viz_canvas_frame)
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Add navigation toolbar
-        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
+        NavigationToolbar2Tk = _lazy('matplotlib.backends.backend_tkagg', 'NavigationToolbar2Tk')
         toolbar = NavigationToolbar2Tk(canvas, self.viz_canvas_frame)
         toolbar.update()
         
@@ -1364,13 +1622,16 @@ Would you like to recover this data?"""
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        numeric_cols = list(self.get_numeric_columns())
         if not numeric_cols:
             messagebox.showwarning("Warning", "No numeric columns!")
             return
         
         def plot_func(fig, ax):
-            data_to_plot = [self.df[col].dropna() for col in numeric_cols[:6]]
+            # One float conversion and one NaN mask for all columns instead of per-column dropna()
+            values = self.df[numeric_cols[:6]].to_numpy(dtype=float, na_value=np.nan)
+            valid = ~np.isnan(values)
+            data_to_plot = [values[valid[:, i], i] for i in range(values.shape[1])]
             ax.violinplot(data_to_plot, showmeans=True, showmedians=True)
             ax.set_xticks(range(1, len(numeric_cols[:6]) + 1))
             ax.set_xticklabels(numeric_cols[:6], rotation=45, ha='right')
@@ -1386,7 +1647,8 @@ Would you like to recover this data?"""
             return
         
         # Use dialog factory
-        AnalysisDialogs.show_time_series_dialog(self.root, self.df, self.create_plot)
+        self._show_pooled_dialog('time_series', lambda: AnalysisDialogs.show_time_series_dialog(
+            self.root, self.df, self.create_plot))
     
     def ecommerce_dashboard(self):
         """Create e-commerce analytics dashboard"""
@@ -1394,46 +1656,54 @@ Would you like to recover this data?"""
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, "=" * 80 + "\n")
-        self.output_text.insert(tk.END, "🛍️  E-COMMERCE ANALYTICS DASHBOARD\n")
-        self.output_text.insert(tk.END, "=" * 80 + "\n\n")
-        self.output_text.update_idletasks()  # Show header
-        
-        # Key metrics
-        self.output_text.insert(tk.END, "📊 KEY METRICS:\n")
-        self.output_text.insert(tk.END, "-" * 80 + "\n")
-        self.output_text.insert(tk.END, f"Total Records: {len(self.df):,}\n")
-        self.output_text.insert(tk.END, f"Date Range: {datetime.now().strftime('%Y-%m-%d')}\n\n")
-        self.output_text.update_idletasks()  # Show key metrics
-        
-        # Find revenue-like columns
-        revenue_cols = [col for col in self.df.columns if any(x in col.lower() for x in ['revenue', 'sales', 'price', 'amount', 'total'])]
-        if revenue_cols:
-            self.output_text.insert(tk.END, f"💰 REVENUE ANALYSIS:\n")
-            for col in revenue_cols[:3]:
-                if pd.api.types.is_numeric_dtype(self.df[col]):
-                    self.output_text.insert(tk.END, f"  {col}:\n")
-                    self.output_text.insert(tk.END, f"    Total: ${self.df[col].sum():,.2f}\n")
-                    self.output_text.insert(tk.END, f"    Average: ${self.df[col].mean():,.2f}\n")
-                    self.output_text.insert(tk.END, f"    Median: ${self.df[col].median():,.2f}\n\n")
-            self.output_text.update_idletasks()  # Show revenue analysis
-        
-        # Customer analysis
-        customer_cols = [col for col in self.df.columns if 'customer' in col.lower() or 'user' in col.lower()]
-        if customer_cols:
-            self.output_text.insert(tk.END, f"👥 CUSTOMER INSIGHTS:\n")
-            for col in customer_cols[:2]:
-                unique_count = self.df[col].nunique()
-                self.output_text.insert(tk.END, f"  Unique {col}: {unique_count:,}\n")
-            self.output_text.update_idletasks()  # Show customer insights
-        
-        self.output_text.insert(tk.END, "\n" + "=" * 80 + "\n")
-        self.output_text.insert(tk.END, "💡 Use Visualize menu for detailed charts\n")
-        self.output_text.update_idletasks()  # Show complete
+        # Column matching uses the app's name cache, so it stays on the UI thread
+        cols_lower = self._cols_lower_for(self.df)
         
-        self.notebook.select(0)
-        self.update_status("Dashboard generated")
+        def work(df=self.df):
+            out = [
+                _SEP80 + "\n",
+                "🛍️  E-COMMERCE ANALYTICS DASHBOARD\n",
+                _SEP80 + "\n\n",
+            ]
+            
+            # Key metrics
+            out.append("📊 KEY METRICS:\n")
+            out.append("-" * 80 + "\n")
+            out.append(f"Total Records: {len(df):,}\n")
+            out.append(f"Date Range: {datetime.now().strftime('%Y-%m-%d')}\n\n")
+            
+            # Find revenue-like columns
+            revenue_cols = df.columns[cols_lower.str.contains(_REVENUE_RE)].tolist()
+            if revenue_cols:
+                out.append(f"💰 REVENUE ANALYSIS:\n")
+                numeric_revenue = [col for col in revenue_cols[:3] if pd.api.types.is_numeric_dtype(df[col])]
+                if numeric_revenue:
+                    # All three reductions for all columns in one agg call
+                    stats = df[numeric_revenue].agg(['sum', 'mean', 'median'])
+                    for col in numeric_revenue:
+                        out.append(f"  {col}:\n")
+                        out.append(f"    Total: ${stats.at['sum', col]:,.2f}\n")
+                        out.append(f"    Average: ${stats.at['mean', col]:,.2f}\n")
+                        out.append(f"    Median: ${stats.at['median', col]:,.2f}\n\n")
+            
+            # Customer analysis
+            customer_cols = df.columns[cols_lower.str.contains(_CUSTOMER_RE)].tolist()
+            if customer_cols:
+                out.append(f"👥 CUSTOMER INSIGHTS:\n")
+                for col in customer_cols[:2]:
+                    unique_count = df[col].nunique()
+                    out.append(f"  Unique {col}: {unique_count:,}\n")
+            
+            out.append("\n" + _SEP80 + "\n")
+            out.append("💡 Use Visualize menu for detailed charts\n")
+            return "".join(out)
+        
+        def done(text):
+            self._write_output(text)
+            self.update_status("Dashboard generated")
+        
+        self.update_status("Building dashboard...")
+        self._run_async(work, done, "Failed to build dashboard")
     
     def column_analysis(self):
         """Detailed analysis of a specific column - delegates to dialog"""
@@ -1443,18 +1713,16 @@ Would you like to recover this data?"""
         
         # Create callbacks
         def output_callback(text):
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, text)
-            self.output_text.update_idletasks()
+            self._replace_output(text)
         
         def notebook_callback():
             self.notebook.select(0)
         
         # Use dialog factory
-        AnalysisDialogs.show_column_analysis_dialog(
+        self._show_pooled_dialog('column_analysis', lambda: AnalysisDialogs.show_column_analysis_dialog(
             self.root, self.df, output_callback, 
             notebook_callback, self.update_status
-        )
+        ))
     
     def filter_data(self):
         """Filter data interactively"""
@@ -1471,9 +1739,7 @@ Would you like to recover this data?"""
         
         # Create callbacks
         def output_callback(text):
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, text)
-            self.output_text.update_idletasks()
+            self._replace_output(text)
         
         def notebook_callback():
             self.notebook.select(0)
@@ -1496,9 +1762,7 @@ Would you like to recover this data?"""
         
         # Create callbacks
         def output_callback(text):
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, text)
-            self.output_text.update_idletasks()
+            self._replace_output(text)
         
         def notebook_callback():
             self.notebook.select(0)
@@ -1520,9 +1784,7 @@ Would you like to recover this data?"""
         
         # Create callbacks
         def output_callback(text):
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, text)
-            self.output_text.update_idletasks()
+            self._replace_output(text)
         
         def notebook_callback():
             self.notebook.select(0)
@@ -1551,9 +1813,7 @@ Would you like to recover this data?"""
         
         # Create output callback
         def display_output(text):
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, text)
-            self.output_text.update_idletasks()
+            self._replace_output(text)
             self.notebook.select(0)
             self.update_status("Correlation analysis completed")
         
@@ -1570,6 +1830,26 @@ Would you like to recover this data?"""
         except:
             messagebox.showerror("Error", "Failed to copy to clipboard")
     
+    def _copy_to_clipboard(self, text):
+        """
+        Replace the clipboard contents with text.
+        
+        The clipboard is only touched here, when the user's action copies
+        something, so whatever they had copied survives app start-up.
+        
+        Args:
+            text: Text to copy
+        
+        Returns:
+            True if the clipboard was updated, False if it is unavailable
+        """
+        try:
+            self.root.clipboard_clear()
+            self.root.clipboard_append(text)
+            return True
+        except tk.TclError:
+            return False
+    
     def save_output(self):
         """Save output to file"""
         file_path = filedialog.asksaveasfilename(
@@ -1602,46 +1882,52 @@ Would you like to recover this data?"""
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
-        from data_ops.sql_interface import DataProfiler
+        DataProfiler = _lazy('data_ops.sql_interface', 'DataProfiler')
         
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, "=" * 80 + "\n")
-        self.output_text.insert(tk.END, "DATA PROFILING REPORT\n")
-        self.output_text.insert(tk.END, "=" * 80 + "\n\n")
-        self.output_text.update_idletasks()  # Show header immediately
+        header = _SEP80 + "\n" + "DATA PROFILING REPORT\n" + _SEP80 + "\n\n"
+        self._replace_output(header)  # Show header immediately
         
-        profile = DataProfiler.generate_profile(self.df)
+        self.update_status("Profiling data...")
+        self._run_async(lambda df=self.df: DataProfiler.generate_profile(df),
+                        lambda profile: self._render_profiling_report(header, profile),
+                        "Data profiling failed")
+    
+    def _render_profiling_report(self, header, profile):
+        """Write a DataProfiler profile to the output panel below header"""
+        out = [header]
         
         # Overview
-        self.output_text.insert(tk.END, "DATASET OVERVIEW:\n")
-        self.output_text.insert(tk.END, "-" * 80 + "\n")
+        out.append("DATASET OVERVIEW:\n")
+        out.append("-" * 80 + "\n")
         for key, value in profile['overview'].items():
-            self.output_text.insert(tk.END, f"  {key}: {value}\n")
-        self.output_text.update_idletasks()  # Show overview
+            out.append(f"  {key}: {value}\n")
         
         # Quality Score
-        self.output_text.insert(tk.END, f"\n📊 DATA QUALITY SCORE: {profile['quality']['quality_score']}/100\n\n")
-        self.output_text.update_idletasks()  # Show quality score
+        out.append(f"\n📊 DATA QUALITY SCORE: {profile['quality']['quality_score']}/100\n\n")
         
         # Issues
         if profile['quality']['total_issues'] > 0:
-            self.output_text.insert(tk.END, f"⚠️ ISSUES FOUND ({profile['quality']['total_issues']}):\n")
+            out.append(f"⚠️ ISSUES FOUND ({profile['quality']['total_issues']}):\n")
             for issue in profile['quality']['issues'][:10]:
-                self.output_text.insert(tk.END, f"  [{issue['severity']}] {issue['type']}: {issue['column']}\n")
-            self.output_text.update_idletasks()  # Show issues
+                out.append(f"  [{issue['severity']}] {issue['type']}: {issue['column']}\n")
         
         # Recommendations
-        self.output_text.insert(tk.END, f"\n💡 RECOMMENDATIONS ({len(profile['recommendations'])}):\n")
+        out.append(f"\n💡 RECOMMENDATIONS ({len(profile['recommendations'])}):\n")
         for rec in profile['recommendations']:
-            self.output_text.insert(tk.END, f"  [{rec['priority']}] {rec['action']}: {rec['reason']}\n")
-        self.output_text.update_idletasks()  # Show recommendations
+            out.append(f"  [{rec['priority']}] {rec['action']}: {rec['reason']}\n")
         
         # Strong correlations
-        if profile['correlations'].get('strong_correlations'):
-            self.output_text.insert(tk.END, f"\n🔗 STRONG CORRELATIONS:\n")
-            for corr in profile['correlations']['strong_correlations'][:5]:
-                self.output_text.insert(tk.END, f"  {corr['col1']} ↔ {corr['col2']}: {corr['correlation']:.3f} ({corr['strength']})\n")
-            self.output_text.update_idletasks()  # Show correlations
+        # Keep only the top 5 by magnitude (bounded heap, no full sort) and
+        # drop the full pair list from the profile once it has been reduced
+        strong = profile['correlations'].pop('strong_correlations', None)
+        if strong:
+            top_corr = heapq.nlargest(5, strong, key=lambda c: abs(c['correlation']))
+            del strong
+            out.append(f"\n🔗 STRONG CORRELATIONS:\n")
+            for corr in top_corr:
+                out.append(f"  {corr['col1']} ↔ {corr['col2']}: {corr['correlation']:.3f} ({corr['strength']})\n")
+        
+        self._replace_output("".join(out))
         
         self.notebook.select(0)
         self.update_status("Data profiling report generated")
@@ -1671,7 +1957,7 @@ Would you like to recover this data?"""
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
-        from data_ops.report_generator import ReportGenerator
+        ReportGenerator = _lazy('data_ops.report_generator', 'ReportGenerator')
         
         file_path = filedialog.asksaveasfilename(
             title="Save Executive Report",
@@ -1680,16 +1966,25 @@ Would you like to recover this data?"""
         )
         
         if file_path:
-            try:
-                success, report_path = ReportGenerator.generate_executive_summary(self.df, file_path)
+            # Build and write the HTML in the background; keep a spinner up meanwhile
+            progress = ProgressWindow(self.root, "Executive Report")
+            progress.update(status="Generating executive report...")
+            progress.set_indeterminate()
+            
+            def done(result):
+                progress.close()
+                success, report_path = result
                 if success:
                     messagebox.showinfo("Success", f"Executive report generated!\n\n{report_path}\n\nOpen in browser to view.")
                     self.update_status("✓ Executive report generated")
                     # Try to open in browser
                     import webbrowser
                     webbrowser.open(report_path)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to generate report:\n{str(e)}")
+            
+            self._run_async(
+                lambda df=self.df: ReportGenerator.generate_executive_summary(df, file_path),
+                done, "Failed to generate report", on_error=lambda e: progress.close()
+            )
     
     def generate_quick_summary(self):
         """Generate quick text summary"""
@@ -1697,25 +1992,20 @@ Would you like to recover this data?"""
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
-        from data_ops.report_generator import ReportGenerator
+        ReportGenerator = _lazy('data_ops.report_generator', 'ReportGenerator')
         
-        summary = ReportGenerator.generate_quick_summary_text(self.df)
-        
-        # Display in output
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, summary)
-        self.output_text.update_idletasks()  # Show immediately
-        self.notebook.select(0)
-        
-        # Also copy to clipboard
-        try:
-            self.root.clipboard_clear()
-            self.root.clipboard_append(summary)
-            messagebox.showinfo("Success", "Quick summary generated and copied to clipboard!\n\nPaste into your document or email.")
-        except:
-            messagebox.showinfo("Success", "Quick summary generated!\n\nUse Copy button to copy to clipboard.")
+        def done(summary):
+            # Display in output
+            self._write_output(summary)
+            
+            # Also copy to clipboard
+            if self._copy_to_clipboard(summary):
+                self._toast("✓ Quick summary generated and copied to clipboard")
+            else:
+                self._toast("✓ Quick summary generated - use Copy button to copy to clipboard")
         
-        self.update_status("✓ Quick summary generated")
+        self._run_async(lambda df=self.df: ReportGenerator.generate_quick_summary_text(df),
+                        done, "Failed to generate summary")
     
     def format_for_email(self):
         """Format data summary for email"""
@@ -1723,71 +2013,34 @@ Would you like to recover this data?"""
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
-        from data_ops.report_generator import EmailReportFormatter
+        EmailReportFormatter = _lazy('data_ops.report_generator', 'EmailReportFormatter')
         
         email_body = EmailReportFormatter.format_for_email(self.df)
         
         # Display in output
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, email_body)
-        self.output_text.update_idletasks()  # Show immediately
-        self.notebook.select(0)
+        self._write_output(email_body)
         
         # Copy to clipboard
-        try:
-            self.root.clipboard_clear()
-            self.root.clipboard_append(email_body)
-            messagebox.showinfo("Success", "Email format generated and copied to clipboard!\n\nPaste directly into your email.")
-            self.update_status("✓ Email format ready")
-        except:
-            messagebox.showinfo("Success", "Email format generated!")
+        if self._copy_to_clipboard(email_body):
+            self._toast("✓ Email format ready and copied to clipboard")
+        else:
+            self._toast("✓ Email format generated")
     
     def show_guide(self):
         """Show quick start guide"""
-        guide = """QUICK START GUIDE
-        
-1. Import Data: File > Import CSV/Excel
-2. View Data: Click 'View Data' or press Ctrl+D
-3. Clean Data: Use Clean menu options
-4. Analyze: Use Analysis menu for insights
-5. Visualize: Create charts from Visualize menu
-6. Export: File > Export to save results
-
-For Shopify Analysis:
-- Use Time Series Analysis for sales trends
-- Use E-commerce Dashboard for quick insights
-- Group By Analysis for customer segmentation
-"""
+        guide = _lazy('ui._help_texts', 'GUIDE')
         messagebox.showinfo("Quick Start Guide", guide)
     
     def show_shortcuts(self):
         """Show keyboard shortcuts"""
-        shortcuts = """KEYBOARD SHORTCUTS
-
-FILE OPERATIONS:
-Ctrl+O - Import CSV file
-Ctrl+E - Export CSV file  
-Ctrl+Q - Quit application
-
-DATA OPERATIONS:
-Ctrl+D - View Data
-Ctrl+S - Show Statistics
-Ctrl+R - Reset Data to original
-Ctrl+F - Advanced Filters
-
-HELP:
-F1 - About NexData
-
-TIP: All shortcuts work with capital or lowercase!
-"""
+        shortcuts = _lazy('ui._help_texts', 'SHORTCUTS')
         messagebox.showinfo("Keyboard Shortcuts", shortcuts)
     
     def change_theme(self, theme_name):
         """Change application theme"""
         self.theme_manager.apply_theme(theme_name)
         theme_display = self.theme_manager.get_theme_display_name(theme_name)
-        self.update_status(f"Theme changed to: {theme_display}")
-        messagebox.showinfo("Theme Changed", f"Theme set to: {theme_display}\n\nSome elements may require restart for full effect.")
+        self._toast(f"Theme changed to: {theme_display} (some elements may require restart)")
     
     # === NEW ADVANCED FEATURES ===
     
@@ -1802,104 +2055,9 @@ TIP: All shortcuts work with capital or lowercase!
         pivot_window.title("Pivot Table - How to Use")
         pivot_window.geometry("750x650")
         
-        content = """PIVOT TABLES in NexData
-
-🎯 WHAT IS A PIVOT TABLE?
-A pivot table summarizes data by grouping and aggregating.
-
-Example: Summarize employee salaries by department
-
-ORIGINAL DATA:
-Name          | Department   | Salary
-John Doe      | Sales        | 55000
-Jane Smith    | Engineering  | 75000
-Bob Johnson   | Sales        | 65000
-
-PIVOT TABLE RESULT:
-Department   | Average Salary | Count
-Sales        | 60,000         | 2
-Engineering  | 75,000         | 1
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-💡 HOW TO CREATE IN NEXDATA:
-
-Use Analysis > SQL Query (MORE POWERFUL than traditional pivot tables!)
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-📝 EXAMPLE QUERIES FOR YOUR DATA:
-
-1. BASIC PIVOT - Average by Group:
-SELECT Department, 
-       AVG(Salary) as Avg_Salary,
-       COUNT(*) as Count
-FROM data
-GROUP BY Department
-
-2. SUM BY CATEGORY:
-SELECT Department, 
-       SUM(Salary) as Total_Salary
-FROM data
-GROUP BY Department
-
-3. MULTIPLE AGGREGATIONS:
-SELECT Department,
-       AVG(Salary) as Avg_Salary,
-       MIN(Salary) as Min_Salary,
-       MAX(Salary) as Max_Salary,
-       COUNT(*) as Employees
-FROM data
-GROUP BY Department
-ORDER BY Avg_Salary DESC
-
-4. PIVOT WITH FILTERING:
-SELECT Department,
-       AVG(Salary) as Avg_Salary
-FROM data
-WHERE Experience > 5
-GROUP BY Department
-
-5. TRUE PIVOT (Columns from Rows):
-SELECT 
-    CASE WHEN Experience < 3 THEN 'Junior'
-         WHEN Experience < 8 THEN 'Mid'
-         ELSE 'Senior' END as Level,
-    AVG(CASE WHEN Department='Sales' THEN Salary END) as Sales,
-    AVG(CASE WHEN Department='Engineering' THEN Salary END) as Engineering,
-    AVG(CASE WHEN Department='Marketing' THEN Salary END) as Marketing
-FROM data
-GROUP BY Level
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-✅ TO EXPORT RESULTS:
-1. Run SQL Query
-2. Results appear in Output tab
-3. Copy (Ctrl+A then Ctrl+C)
-4. Paste into Excel or Google Sheets
-
-OR generate HTML report: File > Generate Executive Report
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-💡 TIPS:
-• Replace "Department" with your column name
-• Replace "Salary" with the column you want to aggregate
-• Table name is always "data" (lowercase)
-• Check Dataset Info panel for exact column names
-• Start simple, then add complexity
-
-🆘 MORE HELP:
-• Help > User Guide & Tutorials
-• docs/PIVOT_SQL_GUIDE.md (detailed guide)
-"""
-        
-        # Add scrolled text widget
-        text_widget = scrolledtext.ScrolledText(pivot_window, wrap=tk.WORD, font=('Courier', 10))
+        # Add scrolled text widget (static text: no undo bookkeeping)
+        text_widget = self._make_readonly_text(pivot_window, _lazy('ui._help_texts', 'PIVOT_HELP'))
         text_widget.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
-        text_widget.insert(1.0, content)
-        text_widget.config(state='disabled')  # Read-only
         
         # Add buttons
         btn_frame = ttk.Frame(pivot_window)
@@ -1913,19 +2071,15 @@ OR generate HTML report: File > Generate Executive Report
     def show_pivot_guide(self):
         """Show comprehensive pivot/SQL guide"""
         try:
-            guide_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'docs', 'PIVOT_SQL_GUIDE.md')
+            guide_path = os.path.join(_DOCS_DIR, 'PIVOT_SQL_GUIDE.md')
             if os.path.exists(guide_path):
-                with open(guide_path, 'r', encoding='utf-8') as f:
-                    guide_content = f.read()
-                
                 guide_window = tk.Toplevel(self.root)
                 guide_window.title("Pivot Tables & SQL Query - Complete Guide")
                 guide_window.geometry("950x750")
                 
-                text_widget = scrolledtext.ScrolledText(guide_window, wrap=tk.WORD, font=('Courier', 10))
+                text_widget = self._make_readonly_text(guide_window)
                 text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-                text_widget.insert(1.0, guide_content)
-                text_widget.config(state='disabled')
+                self._stream_text_file(guide_window, text_widget, guide_path)
                 
                 ttk.Button(guide_window, text="Close", command=guide_window.destroy).pack(pady=5)
                 self.update_status("Pivot/SQL guide opened")
@@ -1940,8 +2094,9 @@ OR generate HTML report: File > Generate Executive Report
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
-        # Create dialog
+        # Create dialog hidden; it is shown once all widgets are built
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Advanced Filters")
         dialog.geometry("700x550")
         
@@ -1965,11 +2120,6 @@ OR generate HTML report: File > Generate Executive Report
         scrollbar = ttk.Scrollbar(conditions_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
@@ -1979,6 +2129,20 @@ OR generate HTML report: File > Generate Executive Report
         # Store filter conditions
         filter_conditions = []
         
+        # Column names captured once for every condition row's combobox
+        columns_cache = tuple(self.df.columns)
+        has_columns = bool(columns_cache)
+        
+        rows_dirty = [False]
+        
+        def renumber_rows():
+            """Relabel condition rows after removals"""
+            if not rows_dirty[0] or not dialog.winfo_exists():
+                return
+            rows_dirty[0] = False
+            for idx, cond in enumerate(filter_conditions, 1):
+                cond['label'].config(text=f"{idx}.")
+        
         def add_condition():
             """Add a new filter condition row"""
             condition_frame = ttk.Frame(scrollable_frame)
@@ -2000,9 +2164,9 @@ OR generate HTML report: File > Generate Executive Report
             # Column selection
             column_var = tk.StringVar()
             column_combo = ttk.Combobox(condition_frame, textvariable=column_var,
-                                       values=list(self.df.columns), state='readonly', width=15)
+                                       values=columns_cache, state='readonly', width=15)
             column_combo.pack(side=tk.LEFT, padx=5)
-            if len(self.df.columns) > 0:
+            if has_columns:
                 column_combo.current(0)
             
             # Operator selection
@@ -2016,14 +2180,16 @@ OR generate HTML report: File > Generate Executive Report
             value_var = tk.StringVar()
             value_entry = ttk.Entry(condition_frame, textvariable=value_var, width=15)
             value_entry.pack(side=tk.LEFT, padx=5)
+            value_entry.bind('<KeyRelease>', lambda e: schedule_preview())
             
             # Remove button
             def remove_this():
                 condition_frame.destroy()
                 filter_conditions.remove(condition_data)
-                # Update row numbers
-                for idx, cond in enumerate(filter_conditions, 1):
-                    cond['label'].config(text=f"{idx}.")
+                # Row numbers are refreshed once per idle pass, not per removal
+                if not rows_dirty[0]:
+                    rows_dirty[0] = True
+                    dialog.after_idle(renumber_rows)
             
             remove_btn = ttk.Button(condition_frame, text="×", width=3, command=remove_this)
             remove_btn.pack(side=tk.LEFT, padx=5)
@@ -2048,7 +2214,7 @@ OR generate HTML report: File > Generate Executive Report
         preview_frame = ttk.LabelFrame(dialog, text="Preview (First 10 rows)", padding=10)
         preview_frame.pack(pady=10, padx=20, fill=tk.BOTH, expand=True)
         
-        preview_text = tk.Text(preview_frame, height=8, width=70, wrap=tk.NONE)
+        preview_text = tk.Text(preview_frame, height=8, width=70, wrap=tk.NONE, setgrid=False)
         preview_scroll = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=preview_text.yview)
         preview_text.config(yscrollcommand=preview_scroll.set)
         preview_text.grid(row=0, column=0, sticky='nsew')
@@ -2057,106 +2223,162 @@ OR generate HTML report: File > Generate Executive Report
         preview_frame.grid_columnconfigure(0, weight=1)
         preview_text.config(state=tk.DISABLED)
         
+        # Column dtypes looked up once per dialog, and the last built query
+        dtypes = self.df.dtypes.to_dict()
+        query_memo = {}
+        
         def build_filter_query():
-            """Build pandas query from conditions"""
+            """
+            Build the filter from conditions.
+            
+            Returns (query, mask_fn): query is a readable description of the
+            filter and mask_fn(df) returns its boolean row mask, or None when
+            there are no usable conditions.
+            """
             if not filter_conditions:
                 return None
             
+            key = tuple(
+                (cond['logic'].get(), cond['column'].get(), cond['operator'].get(), cond['value'].get())
+                for cond in filter_conditions
+            )
+            if key in query_memo:
+                return query_memo[key]
+            
             query_parts = []
-            for idx, cond in enumerate(filter_conditions):
-                col = cond['column'].get()
-                op = cond['operator'].get()
-                val = cond['value'].get()
-                
+            terms = []  # (logic, col, op, value, kind)
+            for logic, col, op, val in key:
                 if not col or not val:
                     continue
                 
-                # Handle different operators
-                if op == "contains":
-                    query_part = f"`{col}`.astype(str).str.contains('{val}', case=False, na=False)"
-                elif op == "not contains":
-                    query_part = f"~`{col}`.astype(str).str.contains('{val}', case=False, na=False)"
-                else:
-                    # Try to convert value to appropriate type
-                    try:
-                        if self.df[col].dtype in ['int64', 'float64']:
-                            val_formatted = float(val)
-                        else:
-                            val_formatted = f"'{val}'"
-                        query_part = f"`{col}` {op} {val_formatted}"
-                    except:
-                        query_part = f"`{col}`.astype(str) {op} '{val}'"
+                # Numeric columns compare against a float and datetime columns
+                # against a timestamp parsed once here; everything else as text
+                kind = None
+                value = val
+                if op not in ("contains", "not contains"):
+                    dtype = dtypes[col]
+                    if pd.api.types.is_datetime64_any_dtype(dtype):
+                        parsed = _parse_datetime_value(val, dtype)
+                        if parsed is not None:
+                            value = parsed
+                            kind = 'datetime'
+                    elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+                        try:
+                            value = float(val)
+                            kind = 'numeric'
+                        except ValueError:
+                            pass
                 
-                if idx > 0:
-                    logic = cond['logic'].get()
+                query_part = f"`{col}` {op} {value if kind == 'numeric' else repr(val)}"
+                if terms:
                     query_parts.append(f" {logic.lower()} {query_part}")
                 else:
                     query_parts.append(query_part)
+                terms.append((logic, col, op, value, kind))
+            
+            if not terms:
+                result = None
+            else:
+                def mask_fn(df):
+                    # AND binds tighter than OR, as in the query syntax shown to the user
+                    groups = []
+                    current = None
+                    for logic, col, op, value, kind in terms:
+                        cond_mask = _condition_mask(df, col, op, value, kind)
+                        if current is None:
+                            current = cond_mask
+                        elif logic == "OR":
+                            groups.append(current)
+                            current = cond_mask
+                        else:
+                            current = np.logical_and(current, cond_mask)
+                    groups.append(current)
+                    return np.logical_or.reduce(groups)
+                result = ("".join(query_parts), mask_fn)
             
-            return "".join(query_parts) if query_parts else None
+            query_memo.clear()
+            query_memo[key] = result
+            return result
         
         def preview_filter():
             """Preview filter results"""
+            renumber_rows()
             preview_text.config(state=tk.NORMAL)
             preview_text.delete(1.0, tk.END)
             
             try:
-                query = build_filter_query()
-                if not query:
+                built = build_filter_query()
+                if not built:
                     preview_text.insert(tk.END, "⚠️ Please add at least one filter condition\n")
                     preview_text.config(state=tk.DISABLED)
                     return
+                query, mask_fn = built
                 
-                # Apply filter
-                filtered_df = self.df.query(query)
+                # Only scan as far as needed to fill the preview
+                filtered_df, total = _preview_query(self.df, mask_fn, n=10)
                 
                 if len(filtered_df) == 0:
                     preview_text.insert(tk.END, "⚠️ No rows match the filter criteria\n\n")
                     preview_text.insert(tk.END, f"Query: {query}")
+                elif total is not None:
+                    preview_text.insert(tk.END, f"✓ Found {total} matching rows (showing first 10):\n\n")
+                    preview_text.insert(tk.END, filtered_df.to_string(**_PREVIEW_FORMAT))
                 else:
-                    preview_text.insert(tk.END, f"✓ Found {len(filtered_df)} matching rows (showing first 10):\n\n")
-                    preview_text.insert(tk.END, filtered_df.head(10).to_string())
+                    preview_text.insert(tk.END, "✓ Found matching rows (showing first 10):\n\n")
+                    preview_text.insert(tk.END, filtered_df.to_string(**_PREVIEW_FORMAT))
                 
             except Exception as e:
                 preview_text.insert(tk.END, f"❌ Error: {str(e)}\n\nPlease check your filter conditions.")
             
             preview_text.config(state=tk.DISABLED)
         
+        # Live preview while typing, debounced so only the last keystroke filters
+        preview_job = [None]
+        
+        def schedule_preview():
+            if preview_job[0] is not None:
+                dialog.after_cancel(preview_job[0])
+            preview_job[0] = dialog.after(250, run_scheduled_preview)
+        
+        def run_scheduled_preview():
+            preview_job[0] = None
+            preview_filter()
+        
         def apply_filter():
             """Apply the filter to the dataframe"""
             try:
-                query = build_filter_query()
-                if not query:
+                built = build_filter_query()
+                if not built:
                     messagebox.showwarning("Warning", "Please add at least one filter condition!")
                     return
+                query, mask_fn = built
                 
                 before_count = len(self.df)
-                # Use pandas query directly (complex multi-condition filtering)
+                # Compose the boolean masks directly (complex multi-condition filtering)
                 # AnalysisService.filter_data() is for single conditions
-                self.df = self.df.query(query)
+                self.df = self.df[mask_fn(self.df)]
                 after_count = len(self.df)
                 
                 # Output results
-                self.output_text.delete(1.0, tk.END)
-                self.output_text.insert(tk.END, "=" * 80 + "\n")
-                self.output_text.insert(tk.END, "ADVANCED FILTER APPLIED\n")
-                self.output_text.insert(tk.END, "=" * 80 + "\n\n")
-                self.output_text.insert(tk.END, f"Filter Query: {query}\n\n")
-                self.output_text.insert(tk.END, f"✓ Original rows: {before_count}\n")
-                self.output_text.insert(tk.END, f"✓ Filtered rows: {after_count}\n")
-                self.output_text.insert(tk.END, f"✓ Rows removed: {before_count - after_count}\n\n")
-                self.output_text.insert(tk.END, "=" * 80 + "\n")
-                self.output_text.update_idletasks()
-                self.notebook.select(0)
+                lines = [
+                    _SEP80,
+                    "ADVANCED FILTER APPLIED",
+                    _SEP80,
+                    "",
+                    f"Filter Query: {query}",
+                    "",
+                    f"✓ Original rows: {before_count}",
+                    f"✓ Filtered rows: {after_count}",
+                    f"✓ Rows removed: {before_count - after_count}",
+                    "",
+                    _SEP80,
+                    "",
+                ]
+                self._write_output("\n".join(lines))
                 
                 self.update_info_panel()
                 self.view_data()
-                self.update_status(f"Filter applied: {after_count} rows")
-                
-                messagebox.showinfo("Success", 
-                                  f"Filter applied successfully!\n\n"
-                                  f"Original rows: {before_count}\n"
-                                  f"Filtered rows: {after_count}")
+                self._toast(f"✓ Filter applied: {after_count} of {before_count} rows kept")
                 dialog.destroy()
                 
             except Exception as e:
@@ -2173,50 +2395,60 @@ OR generate HTML report: File > Generate Executive Report
         
         # Add first condition by default
         add_condition()
+        
+        # Track the scroll region only from here on, so building the first row
+        # does not trigger a bbox("all") scan per packed widget
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        dialog.deiconify()
     
     def data_quality_check(self):
         """Run data quality assessment"""
         if self.df is None:
             messagebox.showwarning("Warning", "No data loaded!")
             return
-        from data_ops.data_quality import DataQualityChecker
+        DataQualityChecker = _lazy('data_ops.data_quality', 'DataQualityChecker')
         self.perf_monitor.start_operation('data_quality_check')
-        quality_report = DataQualityChecker.assess_quality(self.df)
-        report_text = DataQualityChecker.generate_quality_report_text(quality_report)
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, report_text)
-        self.notebook.select(0)
-        self.perf_monitor.end_operation('data_quality_check')
-        self.update_status(f"Data quality: {quality_report['quality_level']} ({quality_report['overall_score']:.0f}/100)")
+        
+        def work(df=self.df):
+            quality_report = DataQualityChecker.assess_quality(df)
+            return quality_report, DataQualityChecker.generate_quality_report_text(quality_report)
+        
+        def done(result):
+            quality_report, report_text = result
+            self._write_output(report_text)
+            self.perf_monitor.end_operation('data_quality_check')
+            self.update_status(f"Data quality: {quality_report['quality_level']} ({quality_report['overall_score']:.0f}/100)")
+        
+        self.update_status("Assessing data quality...")
+        self._run_async(work, done, "Data quality check failed",
+                        on_error=lambda e: self.perf_monitor.end_operation('data_quality_check'))
     
     def auto_insights(self):
         """Generate automated insights"""
         if self.df is None:
             messagebox.showwarning("Warning", "No data loaded!")
             return
-        from analysis.auto_insights import AutoInsights
-        insights = AutoInsights.generate_insights(self.df)
-        output = f"\n{'='*60}\nAUTO-GENERATED INSIGHTS\n{'='*60}\n\n"
-        output += "SUMMARY:\n"
-        for item in insights['summary']:
-            output += f"• {item}\n"
-        if insights['trends']:
-            output += "\nTRENDS:\n"
-            for item in insights['trends']:
-                output += f"• {item}\n"
-        if insights['correlations']:
-            output += "\nCORRELATIONS:\n"
-            for item in insights['correlations']:
-                output += f"• {item}\n"
-        if insights['recommendations']:
-            output += "\nRECOMMENDATIONS:\n"
-            for item in insights['recommendations']:
-                output += f"✓ {item}\n"
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, output)
-        self.output_text.update_idletasks()  # Show immediately
-        self.notebook.select(0)
-        self.update_status("Auto insights generated")
+        AutoInsights = _lazy('analysis.auto_insights', 'AutoInsights')
+        
+        def sections(insights):
+            yield f"\n{_SEP60}\nAUTO-GENERATED INSIGHTS\n{_SEP60}\n\nSUMMARY:\n"
+            yield "".join(f"• {item}\n" for item in insights['summary'])
+            for key, title, bullet in (('trends', 'TRENDS', '•'),
+                                       ('correlations', 'CORRELATIONS', '•'),
+                                       ('recommendations', 'RECOMMENDATIONS', '✓')):
+                if insights[key]:
+                    yield f"\n{title}:\n"
+                    yield "".join(f"{bullet} {item}\n" for item in insights[key])
+        
+        def done(insights):
+            self._write_report(sections(insights))
+            self.update_status("Auto insights generated")
+        
+        self._run_async(lambda df=self.df: AutoInsights.generate_insights(df),
+                        done, "Failed to generate insights")
     
     def rfm_segmentation(self):
         """RFM Customer Segmentation"""
@@ -2251,32 +2483,61 @@ OR generate HTML report: File > Generate Executive Report
         if self.df is None:
             messagebox.showwarning("Warning", "No data loaded!")
             return
-        from data_ops.data_comparison import DataComparison
+        DataComparison = _lazy('data_ops.data_comparison', 'DataComparison')
         file_path = filedialog.askopenfilename(title="Select second dataset", filetypes=[("CSV files", "*.csv"), ("Excel files", "*.xlsx"), ("All files", "*.*")])
         if not file_path:
             return
-        try:
-            df2 = pd.read_csv(file_path) if file_path.endswith('.csv') else pd.read_excel(file_path)
-            comparison = DataComparison.compare_dataframes(self.df, df2)
-            output = f"=== DATASET COMPARISON ===\n\nDataset 1: {comparison['df1_shape']}\nDataset 2: {comparison['df2_shape']}\n\nCommon Columns: {len(comparison['common_columns'])}\n"
-            if comparison['only_in_df1']:
-                output += f"Only in DF1: {', '.join(comparison['only_in_df1'])}\n"
-            if comparison['only_in_df2']:
-                output += f"Only in DF2: {', '.join(comparison['only_in_df2'])}\n"
-            self.output_text.delete(1.0, tk.END)
-            self.output_text.insert(tk.END, output)
-            self.output_text.update_idletasks()  # Show immediately
-            self.notebook.select(0)
+        def work():
+            # Only shapes and column sets are reported: read the header, then
+            # count rows by parsing just the first column
+            if file_path.endswith('.csv'):
+                columns = pd.read_csv(file_path, nrows=0).columns
+                if not len(columns):
+                    return columns, 0
+                if importlib.util.find_spec('pyarrow'):
+                    try:
+                        # Multi-threaded reader; the C engine is the fallback for files it rejects
+                        return columns, len(pd.read_csv(file_path, usecols=[columns[0]], engine='pyarrow'))
+                    except (ValueError, ImportError):
+                        pass
+                return columns, len(pd.read_csv(file_path, usecols=[columns[0]]))
+            read_excel = pd.read_excel
+            if importlib.util.find_spec('python_calamine'):
+                # Rust-backed reader; openpyxl is the fallback on pandas < 2.2 or unreadable files
+                def read_excel(path, **kwargs):
+                    try:
+                        return pd.read_excel(path, engine='calamine', **kwargs)
+                    except (ValueError, ImportError):
+                        return pd.read_excel(path, **kwargs)
+            columns = read_excel(file_path, nrows=0).columns
+            return columns, (len(read_excel(file_path, usecols=[0])) if len(columns) else 0)
+        
+        def done(result):
+            columns, n_rows = result
+            comparison = DataComparison.compare_schemas(self.df, columns, n_rows)
+            
+            def sections():
+                yield "=== DATASET COMPARISON ===\n\n"
+                yield f"Dataset 1: {comparison['df1_shape']}\n"
+                yield f"Dataset 2: {comparison['df2_shape']}\n\n"
+                yield f"Common Columns: {len(comparison['common_columns'])}\n"
+                if comparison['only_in_df1']:
+                    yield f"Only in DF1: {', '.join(map(str, comparison['only_in_df1']))}\n"
+                if comparison['only_in_df2']:
+                    yield f"Only in DF2: {', '.join(map(str, comparison['only_in_df2']))}\n"
+            
+            self._write_report(sections())
             self.update_status("Comparison complete")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to compare:\n{str(e)}")
+        
+        self.update_status("Reading second dataset...")
+        self._run_async(work, done, "Failed to compare")
     
     def export_powerpoint(self):
         """Export to PowerPoint"""
         if self.df is None:
             messagebox.showwarning("Warning", "No data loaded!")
             return
-        from data_ops.pptx_export import PowerPointExporter
+        PowerPointExporter = _lazy('data_ops.pptx_export', 'PowerPointExporter')
         available, msg = PowerPointExporter.check_pptx_available()
         if not available:
             messagebox.showwarning("Package Required", "Install python-pptx:\npip install python-pptx")
@@ -2285,8 +2546,7 @@ OR generate HTML report: File > Generate Executive Report
         if file_path:
             success, msg = PowerPointExporter.create_presentation(self.df, file_path)
             if success:
-                messagebox.showinfo("Success", msg)
-                self.update_status("Exported to PowerPoint")
+                self._toast(f"✓ {msg}")
             else:
                 messagebox.showerror("Error", msg)
     
@@ -2295,33 +2555,24 @@ OR generate HTML report: File > Generate Executive Report
         report = self.perf_monitor.get_performance_report()
         report_text = self.perf_monitor.format_performance_report(report)
         tips = self.perf_monitor.get_optimization_tips(report)
-        report_text += "\n=== OPTIMIZATION TIPS ===\n"
-        for tip in tips:
-            report_text += f"{tip}\n"
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, report_text)
-        self.output_text.update_idletasks()  # Show immediately
-        self.notebook.select(0)
+        self._write_report([report_text, "\n=== OPTIMIZATION TIPS ===\n",
+                            *(f"{tip}\n" for tip in tips)])
         self.update_status("Performance report generated")
     
     def show_user_guide(self):
         """Display comprehensive user guide"""
         try:
-            guide_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'docs', 'USER_GUIDE.md')
+            guide_path = os.path.join(_DOCS_DIR, 'USER_GUIDE.md')
             if os.path.exists(guide_path):
-                with open(guide_path, 'r', encoding='utf-8') as f:
-                    guide_content = f.read()
-                
                 # Create a new window for the guide
                 guide_window = tk.Toplevel(self.root)
                 guide_window.title("NexData - User Guide & Tutorials")
                 guide_window.geometry("900x700")
                 
                 # Add scrolled text widget
-                text_widget = scrolledtext.ScrolledText(guide_window, wrap=tk.WORD, font=('Courier', 10))
+                text_widget = self._make_readonly_text(guide_window)
                 text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-                text_widget.insert(1.0, guide_content)
-                text_widget.config(state='disabled')  # Read-only
+                self._stream_text_file(guide_window, text_widget, guide_path)  # Read-only once loaded
                 
                 # Add close button
                 ttk.Button(guide_window, text="Close", command=guide_window.destroy).pack(pady=5)
@@ -2334,87 +2585,7 @@ OR generate HTML report: File > Generate Executive Report
     
     def show_quick_start(self):
         """Show quick start guide"""
-        quick_start = """NEXDATA - QUICK START GUIDE
-        
-🚀 GET STARTED IN 5 MINUTES!
-
-STEP 1: IMPORT YOUR DATA
-• File > Import CSV (or Import Excel)
-• Select your data file
-• ✅ Data loads automatically
-
-STEP 2: VIEW YOUR DATA
-• Click "View Data" button (left panel)
-• Browse your dataset
-• Check columns and data types
-
-STEP 3: CHECK DATA QUALITY
-• Data > Data Quality Check
-• Review quality score (0-100)
-• Follow recommendations
-
-STEP 4: RUN AUTO INSIGHTS
-• Analysis > Auto Insights
-• Get automated pattern detection
-• Review trends and correlations
-
-STEP 5: CREATE VISUALIZATIONS
-• Visualize > Histogram (or any chart type)
-• Select column to visualize
-• Use zoom/pan tools to explore
-
-STEP 6: EXPORT RESULTS
-• File > Generate Executive Report
-• Professional HTML report created
-• Opens in browser automatically
-
-📊 COMMON TASKS:
-
-SQL QUERIES (Most Powerful!):
-• Analysis > SQL Query
-• Example: SELECT * FROM data WHERE Salary > 50000
-• Example: SELECT Department, AVG(Salary) FROM data GROUP BY Department
-
-CUSTOMER ANALYSIS:
-• Analysis > RFM Customer Segmentation
-• Identifies Champions, Loyal, At-Risk customers
-• Perfect for marketing campaigns
-
-SALES FORECASTING:
-• Analysis > Time Series Forecasting
-• Predict future sales/revenue
-• Choose: Linear Trend, Moving Average, or Exponential Smoothing
-
-DATA COMPARISON:
-• Tools > Compare Datasets
-• Load second file to compare
-• See differences automatically
-
-💡 TIPS:
-• Always check Data Quality first
-• Use Auto Insights for quick overview
-• SQL Query can do almost anything
-• Export reports for presentations
-• Try different themes (View > Theme)
-
-🆘 NEED HELP?
-• Help > User Guide & Tutorials (full documentation)
-• Help > Performance Monitor (if slow)
-• Help > About (feature list)
-
-🎯 RECOMMENDED WORKFLOW:
-1. Import data
-2. Data Quality Check
-3. Clean data (remove duplicates/outliers)
-4. Auto Insights
-5. Detailed analysis (SQL/Statistics)
-6. Visualizations
-7. Generate reports
-
-✨ YOU'RE READY! Start exploring your data!
-
-For detailed tutorials: Help > User Guide & Tutorials
-"""
+        quick_start = _lazy('ui._help_texts', 'QUICK_START')
         
         # Create scrollable window instead of messagebox
         quick_window = tk.Toplevel(self.root)
@@ -2422,10 +2593,8 @@ For detailed tutorials: Help > User Guide & Tutorials
         quick_window.geometry("700x600")
         
         # Add scrolled text widget
-        text_widget = scrolledtext.ScrolledText(quick_window, wrap=tk.WORD, font=('Arial', 11))
+        text_widget = self._make_readonly_text(quick_window, quick_start, font=('Arial', 11))
         text_widget.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
-        text_widget.insert(1.0, quick_start)
-        text_widget.config(state='disabled')  # Read-only
         
         # Add close button
         btn_frame = ttk.Frame(quick_window)
@@ -2436,41 +2605,7 @@ For detailed tutorials: Help > User Guide & Tutorials
         self.update_status("Quick Start Guide opened")
     
     def show_about(self):
-        about_text = """NexData v3.0 - Professional Data Analysis
-Shopify Edition - Next-Generation Analytics
-
-Created for E-commerce & Shopify Data Analysts
-
-✨ 60+ Features Including:
-• Data Import/Export (CSV, Excel, JSON, PowerPoint)
-• Advanced Data Cleaning & Quality Assessment
-• Statistical Analysis & A/B Testing
-• RFM Customer Segmentation (10 segments)
-• Time Series Forecasting (3 methods)
-• Auto Insights & Anomaly Detection
-• Sales/Customer Dashboards
-• SQL Query Interface
-• 10+ Visualization Types
-• Data Comparison Tool
-• Theme Support (System/Light/Dark)
-• Performance Monitoring
-
-🎯 Perfect for analyzing:
-- Sales trends & Revenue forecasting
-- Customer segmentation & Retention
-- Product performance & Inventory
-- Marketing campaign effectiveness
-- Data quality & Validation
-
-🚀 NEW in v3.0:
-• Pivot Tables • RFM Analysis • Auto Insights
-• Forecasting • Quality Checker • Dashboards
-• Dataset Comparison • PowerPoint Export
-
-👨‍💻 Developed by: YEXIU21
-
-© 2025 NexData - Built with Python, Pandas, Matplotlib
-Next-Generation Data Analytics Platform"""
+        about_text = _lazy('ui._help_texts', 'ABOUT')
         
         messagebox.showinfo("About NexData v3.0", about_text)
 
@@ -3,8 +3,22 @@ UI Managers Package
 Managers extracted from main_window.py for separation of concerns
 """
 
-from .visualization_manager import VisualizationManager
-from .export_manager import ExportManager
-from .menu_manager import MenuManager
+import importlib
+
+# Manager name -> submodule; each is imported on first attribute access
+_MANAGERS = {
+    'VisualizationManager': '.visualization_manager',
+    'ExportManager': '.export_manager',
+    'MenuManager': '.menu_manager',
+}
 
 __all__ = ['VisualizationManager', 'ExportManager', 'MenuManager']
+
+
+def __getattr__(name):
+    module = _MANAGERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
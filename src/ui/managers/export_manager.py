@@ -6,7 +6,7 @@ Extracted from main_window.py
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from src.utils.excel_pivot_exporter import ExcelPivotExporter
+from data_ops.excel_pivot_export import ExcelPivotExporter
 
 
 class ExportManager:
@@ -21,6 +21,41 @@ class ExportManager:
         """
         self.app = app
     
+    def _run_export(self, label, file_path, write):
+        """
+        Run write() on the app's worker pool behind a modal busy dialog
+        
+        The dialog's grab keeps the data and menus untouched while the file
+        is written; completion is reported back on the Tk thread.
+        
+        Args:
+            label: Format name used in status and dialog text
+            file_path: Destination path, shown on success
+            write: Callable that writes the file
+        """
+        busy = tk.Toplevel(self.app.root)
+        busy.title("Exporting")
+        busy.resizable(False, False)
+        busy.transient(self.app.root)
+        busy.protocol("WM_DELETE_WINDOW", lambda: None)
+        ttk.Label(busy, text=f"Exporting to {label}...").pack(padx=20, pady=(15, 5))
+        bar = ttk.Progressbar(busy, mode='indeterminate', length=250)
+        bar.pack(padx=20, pady=(0, 15))
+        bar.start(15)
+        busy.grab_set()
+        self.app.update_status(f"Exporting to {label}...")
+        
+        def close(_=None):
+            bar.stop()
+            busy.destroy()
+        
+        def on_done(_):
+            close()
+            messagebox.showinfo("Success", f"Exported to:\n{file_path}")
+            self.app.update_status(f"Exported to {label}")
+        
+        self.app._run_async(write, on_done, "Export failed", on_error=close)
+    
     def export_csv(self):
         """Export data to CSV"""
         if self.app.df is None:
@@ -28,12 +63,9 @@ class ExportManager:
             return
         file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
         if file_path:
-            try:
-                self.app.data_service.export_csv(self.app.df, file_path)
-                messagebox.showinfo("Success", f"Exported to:\n{file_path}")
-                self.app.update_status(f"Exported to CSV")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed:\n{str(e)}")
+            df = self.app.df
+            self._run_export("CSV", file_path,
+                             lambda: self.app.data_service.export_csv(df, file_path))
     
     def export_excel(self):
         """Export data to Excel"""
@@ -42,26 +74,49 @@ class ExportManager:
             return
         file_path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel files", "*.xlsx")])
         if file_path:
-            try:
-                self.app.data_service.export_excel(self.app.df, file_path)
-                messagebox.showinfo("Success", f"Exported to:\n{file_path}")
-                self.app.update_status(f"Exported to Excel")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed:\n{str(e)}")
+            df = self.app.df
+            self._run_export("Excel", file_path,
+                             lambda: self.app.data_service.export_excel(df, file_path))
     
     def export_json(self):
         """Export data to JSON"""
         if self.app.df is None:
             messagebox.showwarning("Warning", "No data to export!")
             return
-        file_path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("JSON Lines (streamed)", "*.jsonl")]
+        )
         if file_path:
-            try:
-                self.app.data_service.export_json(self.app.df, file_path)
-                messagebox.showinfo("Success", f"Exported to:\n{file_path}")
-                self.app.update_status(f"Exported to JSON")
-            except Exception as e:
-                messagebox.showerror("Error", f"Export failed:\n{str(e)}")
+            df = self.app.df
+            if file_path.lower().endswith('.jsonl'):
+                self._run_export("JSON Lines", file_path,
+                                 lambda: self.app.data_service.export_jsonl(df, file_path))
+            else:
+                self._run_export("JSON", file_path,
+                                 lambda: self.app.data_service.export_json(df, file_path))
+    
+    def export_parquet(self):
+        """Export data to Parquet (zstd compressed)"""
+        if self.app.df is None:
+            messagebox.showwarning("Warning", "No data to export!")
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".parquet", filetypes=[("Parquet files", "*.parquet")])
+        if file_path:
+            df = self.app.df
+            self._run_export("Parquet", file_path,
+                             lambda: self.app.data_service.export_parquet(df, file_path))
+    
+    def export_feather(self):
+        """Export data to Feather (zstd compressed)"""
+        if self.app.df is None:
+            messagebox.showwarning("Warning", "No data to export!")
+            return
+        file_path = filedialog.asksaveasfilename(defaultextension=".feather", filetypes=[("Feather files", "*.feather")])
+        if file_path:
+            df = self.app.df
+            self._run_export("Feather", file_path,
+                             lambda: self.app.data_service.export_feather(df, file_path))
     
     def export_excel_with_pivot(self):
         """Export Excel with pivot table configuration dialog"""
@@ -72,7 +127,7 @@ class ExportManager:
         # Create configuration dialog
         pivot_window = tk.Toplevel(self.app.root)
         pivot_window.title("Export Excel with Pivot Table")
-        pivot_window.geometry("500x450")
+        pivot_window.geometry("500x480")
         pivot_window.transient(self.app.root)
         pivot_window.grab_set()
         
@@ -84,36 +139,31 @@ class ExportManager:
         config_frame.pack(fill=tk.BOTH, expand=True)
         
         # Get column names
-        columns = list(self.app.df.columns)
+        snapshot = self.app.get_column_snapshot()
+        columns = snapshot['all']
         
         # Index (Rows) selection
         ttk.Label(config_frame, text="Row Field (Index):").grid(row=0, column=0, sticky='w', pady=5)
-        index_var = tk.StringVar()
-        index_combo = ttk.Combobox(config_frame, textvariable=index_var, values=columns, width=30)
+        index_var = tk.StringVar(value=columns[0] if columns else "")
+        index_combo = self.app._make_column_combo(config_frame, index_var, 'all', width=30)
         index_combo.grid(row=0, column=1, pady=5, padx=5)
-        if columns:
-            index_combo.current(0)
         
         # Columns selection
         ttk.Label(config_frame, text="Column Field (optional):").grid(row=1, column=0, sticky='w', pady=5)
-        column_var = tk.StringVar()
-        column_combo = ttk.Combobox(config_frame, textvariable=column_var, values=['None'] + columns, width=30)
+        column_var = tk.StringVar(value='None')
+        column_combo = self.app._make_column_combo(config_frame, column_var, 'all', extra=('None',), width=30)
         column_combo.grid(row=1, column=1, pady=5, padx=5)
-        column_combo.current(0)
         
         # Values selection
         ttk.Label(config_frame, text="Value Field:").grid(row=2, column=0, sticky='w', pady=5)
-        value_var = tk.StringVar()
         
         # Filter numeric columns for values
-        numeric_columns = list(self.app.df.select_dtypes(include=['number']).columns)
-        if not numeric_columns:
-            numeric_columns = columns
+        value_kind = 'numeric' if snapshot['numeric'] else 'all'
+        numeric_columns = snapshot[value_kind]
+        value_var = tk.StringVar(value=numeric_columns[0] if numeric_columns else "")
         
-        value_combo = ttk.Combobox(config_frame, textvariable=value_var, values=numeric_columns, width=30)
+        value_combo = self.app._make_column_combo(config_frame, value_var, value_kind, width=30)
         value_combo.grid(row=2, column=1, pady=5, padx=5)
-        if numeric_columns:
-            value_combo.current(0)
         
         # Aggregation function
         ttk.Label(config_frame, text="Aggregation Function:").grid(row=3, column=0, sticky='w', pady=5)
@@ -125,11 +175,15 @@ class ExportManager:
         
         # Add chart checkbox
         add_chart_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(config_frame, text="Include Bar Chart", variable=add_chart_var).grid(row=4, column=0, columnspan=2, pady=10)
+        ttk.Checkbutton(config_frame, text="Include Bar Chart", variable=add_chart_var).grid(row=4, column=0, columnspan=2, pady=(10, 0))
+        
+        # Table styling is slow on large frames, so plain values are the default
+        styled_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(config_frame, text="Apply Table Styling (slower)", variable=styled_var).grid(row=5, column=0, columnspan=2, pady=(0, 10))
         
         # Result label
         result_label = ttk.Label(config_frame, text="", foreground="blue")
-        result_label.grid(row=5, column=0, columnspan=2, pady=5)
+        result_label.grid(row=6, column=0, columnspan=2, pady=5)
         
         def perform_export():
             """Perform the export with pivot"""
@@ -154,16 +208,20 @@ class ExportManager:
                 
                 # Perform export
                 result_label.config(text="Exporting...", foreground="blue")
-                pivot_window.update()
+                pivot_window.update_idletasks()
                 
                 if add_chart_var.get():
                     success, message = ExcelPivotExporter.export_with_charts(
                         self.app.df, file_path, pivot_config, chart_type='bar'
                     )
-                else:
+                elif styled_var.get():
                     success, message = ExcelPivotExporter.export_with_pivot(
                         self.app.df, file_path, pivot_config
                     )
+                else:
+                    success, message = ExcelPivotExporter.export_values_only(
+                        self.app.df, file_path, pivot_config
+                    )
                 
                 if success:
                     messagebox.showinfo("Success", message, parent=pivot_window)
@@ -178,7 +236,7 @@ class ExportManager:
         
         # Buttons
         button_frame = ttk.Frame(config_frame)
-        button_frame.grid(row=6, column=0, columnspan=2, pady=20)
+        button_frame.grid(row=7, column=0, columnspan=2, pady=20)
         
         ttk.Button(button_frame, text="Export", command=perform_export, style='Action.TButton').pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=pivot_window.destroy).pack(side=tk.LEFT, padx=5)
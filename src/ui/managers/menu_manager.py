@@ -8,6 +8,153 @@ import tkinter as tk
 from tkinter import ttk
 
 
+# Menu bar layout: (menu label, items). An item is None for a separator,
+# (label, items) for a submenu, or (label, action, accelerator) where action
+# is an app method name, or a (method name, argument) pair.
+_MENU_SPEC = (
+    ("File", (
+        ("Import CSV", "import_csv", "Ctrl+O"),
+        ("Import Excel", "import_excel", None),
+        ("Connect to API", "open_api_connector", None),
+        None,
+        ("Export CSV", "export_csv", "Ctrl+E"),
+        ("Export Excel", "export_excel", None),
+        ("Export Excel with Pivot", "export_excel_with_pivot", None),
+        ("Export JSON", "export_json", None),
+        ("Export Parquet", "export_parquet", None),
+        ("Export Feather", "export_feather", None),
+        None,
+        ("Generate Executive Report (HTML)", "generate_executive_report", None),
+        ("Generate Quick Summary", "generate_quick_summary", None),
+        ("Format for Email", "format_for_email", None),
+        ("Export to PowerPoint", "export_powerpoint", None),
+        None,
+        ("Exit", "quit", "Ctrl+Q"),
+    )),
+    ("Data", (
+        ("View Data", "view_data", "Ctrl+D"),
+        ("Data Info", "show_data_info", None),
+        ("Statistics", "show_statistics", "Ctrl+S"),
+        None,
+        ("Sort Data", "sort_data", None),
+        ("Convert Data Types", "convert_dtypes", None),
+        None,
+        ("Advanced Filters", "advanced_filters", "Ctrl+F"),
+        ("Data Quality Check", "data_quality_check", None),
+        None,
+        ("Reset Data", "reset_data", "Ctrl+R"),
+    )),
+    ("Clean", (
+        ("🤖 Data Quality Advisor", "quality_advisor", None),
+        None,
+        ("Remove Duplicates", "remove_duplicates", None),
+        ("Handle Missing Values", "handle_missing_values", None),
+        ("Smart Fill Missing Data", "smart_fill_missing", None),
+        None,
+        ("Find & Replace", "find_replace", None),
+        ("Standardize Text Case", "standardize_text_case", None),
+        ("Remove Empty Rows/Columns", "remove_empty", None),
+        ("Trim All Columns", "trim_all_columns", None),
+        None,
+        ("Remove Outliers", "remove_outliers", None),
+        ("Clean Order IDs", "clean_order_ids", None),
+        None,
+        ("Data Type Converter", "convert_data_types", None),
+        ("Standardize Dates", "standardize_dates", None),
+        ("Remove Special Characters", "remove_special_chars", None),
+        ("Split/Merge Columns", "split_merge_columns", None),
+    )),
+    ("Analysis", (
+        ("🤖 AI Report Generator", "ai_report_generator", None),
+        None,
+        ("Group By Analysis", "groupby_analysis", None),
+        ("Pivot Table", "pivot_table", None),
+        ("SQL Query", "sql_query", None),
+        ("Data Profiling Report", "data_profiling_report", None),
+        ("Auto Insights", "auto_insights", None),
+        None,
+        ("Column Analysis", "column_analysis", None),
+        ("Correlation Analysis", "correlation_analysis", None),
+        None,
+        ("Statistical Tests", "statistical_tests", None),
+        ("A/B Testing", "ab_testing", None),
+        None,
+        ("RFM Customer Segmentation", "rfm_segmentation", None),
+        ("Time Series Forecasting", "time_series_forecasting", None),
+        None,
+        ("Sales Dashboard", "sales_dashboard", None),
+        ("Customer Dashboard", "customer_dashboard", None),
+        ("E-commerce Dashboard", "ecommerce_dashboard", None),
+    )),
+    ("Visualize", (
+        ("Bar Chart", "plot_bar", None),
+        ("Line Chart", "plot_line", None),
+        ("Pie Chart", "plot_pie", None),
+        None,
+        ("Histogram", "plot_histogram", None),
+        ("Box Plot", "plot_boxplot", None),
+        ("Scatter Plot", "plot_scatter", None),
+        None,
+        ("Distribution Plot (KDE)", "plot_distribution", None),
+        ("Violin Plot", "plot_violin", None),
+        ("Correlation Heatmap", "plot_heatmap", None),
+    )),
+    ("Tools", (
+        ("Compare Datasets", "compare_datasets", None),
+    )),
+    ("View", (
+        ("Theme", (
+            ("System Default", ("change_theme", "system"), None),
+            ("Light Mode", ("change_theme", "light"), None),
+            ("Dark Mode", ("change_theme", "dark"), None),
+        )),
+    )),
+    ("Help", (
+        ("User Guide & Tutorials", "show_user_guide", None),
+        ("Quick Start Guide", "show_quick_start", None),
+        None,
+        ("Performance Monitor", "performance_monitor", None),
+        None,
+        ("About", "show_about", "F1"),
+    )),
+)
+
+
+def _collect_accelerators(items, found):
+    """Gather accelerator -> action pairs from _MENU_SPEC items, recursing into submenus"""
+    for item in items:
+        if item is None:
+            continue
+        if len(item) == 2:
+            _collect_accelerators(item[1], found)
+        elif item[2]:
+            found[item[2]] = item[1]
+    return found
+
+
+# Accelerator label -> app action, taken from the menu spec so the hint shown
+# in a menu and the key binding cannot drift apart
+_ACCEL_MAP = {}
+for _label, _items in _MENU_SPEC:
+    _collect_accelerators(_items, _ACCEL_MAP)
+
+_MODIFIERS = {'Ctrl': 'Control', 'Shift': 'Shift', 'Alt': 'Alt'}
+
+
+def _accel_sequences(accelerator):
+    """
+    Translate a menu accelerator label into Tk event sequences
+    
+    'Ctrl+O' maps to both '<Control-o>' and '<Control-O>' so the shortcut
+    also works with Caps Lock on; 'F1' maps to '<F1>'.
+    """
+    *mods, key = accelerator.split('+')
+    prefix = ''.join(f"{_MODIFIERS[m]}-" for m in mods)
+    if len(key) == 1 and 'Shift' not in mods:
+        return [f"<{prefix}{key.lower()}>", f"<{prefix}{key.upper()}>"]
+    return [f"<{prefix}{key}>"]
+
+
 class MenuManager:
     """Manages application menu bar"""
     
@@ -22,109 +169,53 @@ class MenuManager:
         self.root = root
         self.app = app
     
+    def _resolve(self, action):
+        """
+        Turn a _MENU_SPEC action into a callable
+        
+        Names are looked up on the app first, then on the root window
+        (for 'quit').
+        
+        Args:
+            action: Method name, or (method name, argument) pair
+        """
+        if isinstance(action, tuple):
+            name, arg = action
+            func = getattr(self.app, name)
+            return lambda: func(arg)
+        return getattr(self.app, action, None) or getattr(self.root, action)
+    
+    def _fill_menu(self, menu, items):
+        """Add the _MENU_SPEC entries in items to menu, recursing into submenus"""
+        for item in items:
+            if item is None:
+                menu.add_separator()
+            elif len(item) == 2:
+                label, sub_items = item
+                submenu = tk.Menu(menu, tearoff=0)
+                self.app.theme_manager.register(submenu, 'menu')
+                menu.add_cascade(label=label, menu=submenu)
+                self._fill_menu(submenu, sub_items)
+            else:
+                label, action, accelerator = item
+                menu.add_command(label=label, command=self._resolve(action),
+                                 accelerator=accelerator or '')
+    
     def create_menu(self):
-        """Create complete menu bar"""
+        """Create complete menu bar from _MENU_SPEC"""
         menubar = tk.Menu(self.root)
+        self.app.theme_manager.register(menubar, 'menu')
+        for label, items in _MENU_SPEC:
+            menu = tk.Menu(menubar, tearoff=0)
+            self.app.theme_manager.register(menu, 'menu')
+            menubar.add_cascade(label=label, menu=menu)
+            self._fill_menu(menu, items)
         self.root.config(menu=menubar)
-        
-        # File Menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Import CSV", command=self.app.import_csv, accelerator="Ctrl+O")
-        file_menu.add_command(label="Import Excel", command=self.app.import_excel, accelerator="Ctrl+Shift+O")
-        file_menu.add_command(label="API Connector", command=self.app.open_api_connector)
-        file_menu.add_separator()
-        file_menu.add_command(label="Export to CSV", command=self.app.export_csv, accelerator="Ctrl+S")
-        file_menu.add_command(label="Export to Excel", command=self.app.export_excel, accelerator="Ctrl+Shift+S")
-        file_menu.add_command(label="Export to JSON", command=self.app.export_json)
-        file_menu.add_command(label="Export Excel with Pivot", command=self.app.export_excel_with_pivot)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit, accelerator="Alt+F4")
-        
-        # View Menu
-        view_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_command(label="View Data", command=self.app.view_data, accelerator="Ctrl+1")
-        view_menu.add_command(label="Data Info", command=self.app.show_data_info, accelerator="Ctrl+2")
-        view_menu.add_command(label="Statistics", command=self.app.show_statistics, accelerator="Ctrl+3")
-        view_menu.add_separator()
-        view_menu.add_command(label="Reset Data", command=self.app.reset_data, accelerator="Ctrl+R")
-        
-        # Clean Menu
-        clean_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Clean", menu=clean_menu)
-        clean_menu.add_command(label="Remove Duplicates", command=self.app.remove_duplicates, accelerator="Ctrl+D")
-        clean_menu.add_command(label="Handle Missing Values", command=self.app.handle_missing_values, accelerator="Ctrl+M")
-        clean_menu.add_command(label="Remove Outliers", command=self.app.remove_outliers)
-        clean_menu.add_command(label="Clean Order IDs", command=self.app.clean_order_ids)
-        clean_menu.add_separator()
-        clean_menu.add_command(label="Smart Fill Missing", command=self.app.smart_fill_missing)
-        clean_menu.add_command(label="Find & Replace", command=self.app.find_replace, accelerator="Ctrl+F")
-        clean_menu.add_command(label="Standardize Text Case", command=self.app.standardize_text_case)
-        clean_menu.add_command(label="Remove Empty Rows/Columns", command=self.app.remove_empty)
-        clean_menu.add_command(label="Trim All Columns", command=self.app.trim_all_columns)
-        clean_menu.add_separator()
-        clean_menu.add_command(label="Convert Data Types", command=self.app.convert_data_types)
-        clean_menu.add_command(label="Standardize Dates", command=self.app.standardize_dates)
-        clean_menu.add_command(label="Remove Special Characters", command=self.app.remove_special_chars)
-        clean_menu.add_separator()
-        clean_menu.add_command(label="Split Column", command=self.app.split_column)
-        clean_menu.add_command(label="Merge Columns", command=self.app.merge_columns)
-        
-        # Analyze Menu
-        analyze_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Analyze", menu=analyze_menu)
-        analyze_menu.add_command(label="Column Analysis", command=self.app.column_analysis)
-        analyze_menu.add_command(label="Correlation Analysis", command=self.app.correlation_analysis)
-        analyze_menu.add_command(label="Statistical Tests", command=self.app.statistical_tests)
-        analyze_menu.add_command(label="A/B Testing", command=self.app.ab_testing)
-        analyze_menu.add_separator()
-        analyze_menu.add_command(label="Group By Analysis", command=self.app.group_by_analysis, accelerator="Ctrl+G")
-        analyze_menu.add_command(label="Pivot Table", command=self.app.pivot_table, accelerator="Ctrl+P")
-        analyze_menu.add_separator()
-        analyze_menu.add_command(label="SQL Query", command=self.app.sql_query, accelerator="Ctrl+Q")
-        analyze_menu.add_command(label="Data Profiling", command=self.app.data_profiling)
-        analyze_menu.add_command(label="Auto Insights", command=self.app.auto_insights)
-        
-        # Visualize Menu
-        viz_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Visualize", menu=viz_menu)
-        viz_menu.add_command(label="Bar Chart", command=lambda: self.app.create_visualization('bar'))
-        viz_menu.add_command(label="Line Chart", command=lambda: self.app.create_visualization('line'))
-        viz_menu.add_command(label="Pie Chart", command=lambda: self.app.create_visualization('pie'))
-        viz_menu.add_command(label="Scatter Plot", command=lambda: self.app.create_visualization('scatter'))
-        viz_menu.add_command(label="Histogram", command=lambda: self.app.create_visualization('histogram'))
-        viz_menu.add_command(label="Box Plot", command=lambda: self.app.create_visualization('boxplot'))
-        viz_menu.add_separator()
-        viz_menu.add_command(label="Heatmap", command=lambda: self.app.create_visualization('heatmap'))
-        viz_menu.add_command(label="Distribution Plot", command=lambda: self.app.create_visualization('distribution'))
-        
-        # E-commerce Menu
-        ecom_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="E-commerce", menu=ecom_menu)
-        ecom_menu.add_command(label="RFM Analysis", command=self.app.rfm_analysis)
-        ecom_menu.add_command(label="Time Series Forecast", command=self.app.time_series_forecast)
-        ecom_menu.add_separator()
-        ecom_menu.add_command(label="Sales Dashboard", command=self.app.sales_dashboard)
-        ecom_menu.add_command(label="Customer Dashboard", command=self.app.customer_dashboard)
-        ecom_menu.add_command(label="E-commerce Dashboard", command=self.app.ecommerce_dashboard)
-        
-        # AI Menu
-        ai_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="AI", menu=ai_menu)
-        ai_menu.add_command(label="AI Data Quality Advisor", command=self.app.ai_data_quality_advisor)
-        ai_menu.add_command(label="AI Report Generator", command=self.app.ai_report_generator)
-        
-        # Settings Menu
-        settings_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Settings", menu=settings_menu)
-        settings_menu.add_command(label="Theme Settings", command=self.app.open_theme_settings)
-        settings_menu.add_command(label="Preferences", command=self.app.open_preferences)
-        
-        # Help Menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="User Guide", command=self.app.show_user_guide)
-        help_menu.add_command(label="Keyboard Shortcuts", command=self.app.show_shortcuts)
-        help_menu.add_separator()
-        help_menu.add_command(label="About", command=self.app.show_about)
+        return menubar
+    
+    def bind_accelerators(self):
+        """Bind every accelerator listed in _MENU_SPEC on the root window"""
+        for accelerator, action in _ACCEL_MAP.items():
+            func = self._resolve(action)
+            for sequence in _accel_sequences(accelerator):
+                self.root.bind(sequence, lambda e, f=func: f())
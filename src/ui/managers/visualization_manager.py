@@ -6,9 +6,75 @@ Extracted from main_window.py
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import seaborn as sns
+import numpy as np
+import pandas as pd
+
+
+# Above these sizes the extra points are invisible on screen but dominate draw time
+MAX_SCATTER_POINTS = 50_000
+MAX_LINE_POINTS = 10_000
+# Pie charts show the largest slices and fold the rest into "Other"
+MAX_PIE_SLICES = 15
+# KDE cost grows with sample size; its shape is stable well below this
+MAX_KDE_POINTS = 20_000
+# Above this many rows, group sums use factorize + bincount instead of groupby
+FAST_GROUP_MIN_ROWS = 100_000
+
+
+def fast_group_sum(cat_series, val_series, sort=False, mean=False):
+    """
+    Sum (or average) val_series per category with NumPy bincount
+    
+    Factorizes the categories once and scatter-adds the values into one
+    bucket per code, avoiding groupby's hash aggregation. Missing
+    categories are dropped and missing values are skipped, as in groupby.
+    
+    Args:
+        cat_series: Series of group labels
+        val_series: Numeric Series aligned with cat_series
+        sort: Order the result by group label (default: first appearance)
+        mean: Return per-group means instead of sums
+    
+    Returns:
+        pd.Series indexed by group label
+    """
+    codes, uniques = pd.factorize(cat_series, sort=sort)
+    values = val_series.to_numpy(dtype=np.float64, na_value=np.nan)
+    keep = (codes >= 0) & ~np.isnan(values)
+    sums = np.bincount(codes[keep], weights=values[keep], minlength=len(uniques))
+    if mean:
+        counts = np.bincount(codes[keep], minlength=len(uniques))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sums = sums / counts
+    return pd.Series(sums, index=uniques, name=val_series.name)
+
+
+def _box_stats(frame):
+    """
+    Box plot statistics for every column of a numeric frame, for Axes.bxp
+    
+    Quartiles and whiskers (furthest points within 1.5 IQR, as ax.boxplot
+    draws them) are computed for all columns in one vectorized pass; NaNs
+    are ignored per column.
+    
+    Args:
+        frame: DataFrame of numeric columns
+    
+    Returns:
+        list of dicts, one per column, in Axes.bxp format
+    """
+    arr = frame.to_numpy(dtype=np.float64, na_value=np.nan)
+    q1, med, q3 = np.nanquantile(arr, [0.25, 0.5, 0.75], axis=0)
+    iqr = q3 - q1
+    inside = (arr >= q1 - 1.5 * iqr) & (arr <= q3 + 1.5 * iqr)
+    whislo = np.nanmin(np.where(inside, arr, np.nan), axis=0)
+    whishi = np.nanmax(np.where(inside, arr, np.nan), axis=0)
+    outside = ~inside & ~np.isnan(arr)
+    return [
+        {'label': str(col), 'med': med[i], 'q1': q1[i], 'q3': q3[i],
+         'whislo': whislo[i], 'whishi': whishi[i], 'fliers': arr[outside[:, i], i]}
+        for i, col in enumerate(frame.columns)
+    ]
 
 
 class VisualizationManager:
@@ -22,6 +88,73 @@ class VisualizationManager:
             app: Reference to main application
         """
         self.app = app
+        # Open chart windows: str(window) -> (figure, colorbar axes or None)
+        self._figs = {}
+        # Plotting libraries, imported on the first chart (see _ensure_plot_libs)
+        self._plt = None
+        self._sns = None
+        self._FigureCanvasTkAgg = None
+    
+    def _ensure_plot_libs(self):
+        """
+        Import matplotlib and seaborn on first use
+        
+        Keeps them off the startup path for sessions that never open a chart.
+        
+        Returns:
+            tuple: (pyplot module, seaborn module, FigureCanvasTkAgg class)
+        """
+        if self._plt is None:
+            import matplotlib.pyplot as plt
+            import seaborn as sns
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            # Main window no longer sets the style at import
+            sns.set_style('whitegrid')
+            self._plt, self._sns, self._FigureCanvasTkAgg = plt, sns, FigureCanvasTkAgg
+        return self._plt, self._sns, self._FigureCanvasTkAgg
+    
+    @staticmethod
+    def _clear_axes(ax):
+        """
+        Remove the plotted artists from ax but keep the axes itself
+        
+        Cheaper than ax.clear(), which rebuilds axis, tick and formatter
+        objects on every redraw.
+        
+        Args:
+            ax: Axes to clear
+        """
+        for artist in (*ax.collections, *ax.lines, *ax.patches, *ax.texts, *ax.images):
+            artist.remove()
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        ax.relim()
+        ax.autoscale_view()
+    
+    def _xy_series(self, x_col, y_col, downsample):
+        """
+        Return the x/y series for a bar or line chart
+        
+        When downsampling and the data has more than MAX_LINE_POINTS rows,
+        y is averaged per distinct x value instead of plotting every row.
+        
+        Args:
+            x_col: X-axis column name
+            y_col: Y-axis column name
+            downsample: Whether large series may be aggregated
+        
+        Returns:
+            tuple: (x values, y values)
+        """
+        df = self.app.df
+        if downsample and len(df) > FAST_GROUP_MIN_ROWS:
+            grouped = fast_group_sum(df[x_col], df[y_col], sort=True, mean=True)
+            return grouped.index, grouped.values
+        if downsample and len(df) > MAX_LINE_POINTS:
+            grouped = df.groupby(x_col)[y_col].mean()
+            return grouped.index, grouped.values
+        return df[x_col], df[y_col]
     
     def create_plot(self, plot_type='bar', **kwargs):
         """
@@ -35,17 +168,31 @@ class VisualizationManager:
             messagebox.showwarning("Warning", "No data loaded!")
             return
         
+        plt, sns, FigureCanvasTkAgg = self._ensure_plot_libs()
+        
         # Create visualization window
         viz_window = tk.Toplevel(self.app.root)
         viz_window.title(f"{plot_type.capitalize()} Chart")
         viz_window.geometry("900x700")
         
         # Create figure
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), layout='constrained')
+        window_key = str(viz_window)
+        self._figs[window_key] = (fig, None)
+        
+        def on_destroy(event):
+            # <Destroy> also fires for every child widget
+            if event.widget is viz_window:
+                closed = self._figs.pop(window_key, None)
+                if closed is not None:
+                    plt.close(closed[0])
+        
+        viz_window.bind('<Destroy>', on_destroy, add='+')
         
         # Get column selection based on plot type
-        columns = list(self.app.df.columns)
-        numeric_cols = list(self.app.df.select_dtypes(include=['number']).columns)
+        snapshot = self.app.get_column_snapshot()
+        columns = snapshot['all']
+        numeric_cols = snapshot['numeric']
         
         # Configuration frame
         config_frame = ttk.Frame(viz_window)
@@ -55,46 +202,61 @@ class VisualizationManager:
         if plot_type in ['bar', 'line']:
             ttk.Label(config_frame, text="X-axis:").pack(side=tk.LEFT, padx=5)
             x_var = tk.StringVar(value=columns[0] if columns else "")
-            x_combo = ttk.Combobox(config_frame, textvariable=x_var, values=columns, width=20)
+            x_combo = self.app._make_column_combo(config_frame, x_var, 'all', width=20)
             x_combo.pack(side=tk.LEFT, padx=5)
             
             ttk.Label(config_frame, text="Y-axis:").pack(side=tk.LEFT, padx=5)
             y_var = tk.StringVar(value=numeric_cols[0] if numeric_cols else "")
-            y_combo = ttk.Combobox(config_frame, textvariable=y_var, values=numeric_cols, width=20)
+            y_combo = self.app._make_column_combo(config_frame, y_var, 'numeric', width=20)
             y_combo.pack(side=tk.LEFT, padx=5)
             
         elif plot_type == 'pie':
             ttk.Label(config_frame, text="Category:").pack(side=tk.LEFT, padx=5)
             cat_var = tk.StringVar(value=columns[0] if columns else "")
-            cat_combo = ttk.Combobox(config_frame, textvariable=cat_var, values=columns, width=20)
+            cat_combo = self.app._make_column_combo(config_frame, cat_var, 'all', width=20)
             cat_combo.pack(side=tk.LEFT, padx=5)
             
             ttk.Label(config_frame, text="Values:").pack(side=tk.LEFT, padx=5)
             val_var = tk.StringVar(value=numeric_cols[0] if numeric_cols else "")
-            val_combo = ttk.Combobox(config_frame, textvariable=val_var, values=numeric_cols, width=20)
+            val_combo = self.app._make_column_combo(config_frame, val_var, 'numeric', width=20)
             val_combo.pack(side=tk.LEFT, padx=5)
             
-        elif plot_type in ['histogram', 'boxplot', 'distribution']:
+        elif plot_type == 'boxplot':
+            ttk.Label(config_frame, text="Columns:").pack(side=tk.LEFT, padx=5)
+            col_list = tk.Listbox(config_frame, selectmode=tk.EXTENDED, height=4,
+                                  exportselection=False, width=24)
+            col_list.insert(tk.END, *numeric_cols)
+            if numeric_cols:
+                col_list.selection_set(0)
+            col_list.pack(side=tk.LEFT, padx=5)
+            
+        elif plot_type in ['histogram', 'distribution']:
             ttk.Label(config_frame, text="Column:").pack(side=tk.LEFT, padx=5)
             col_var = tk.StringVar(value=numeric_cols[0] if numeric_cols else "")
-            col_combo = ttk.Combobox(config_frame, textvariable=col_var, values=numeric_cols, width=20)
+            col_combo = self.app._make_column_combo(config_frame, col_var, 'numeric', width=20)
             col_combo.pack(side=tk.LEFT, padx=5)
             
         elif plot_type == 'scatter':
             ttk.Label(config_frame, text="X-axis:").pack(side=tk.LEFT, padx=5)
             x_var = tk.StringVar(value=numeric_cols[0] if numeric_cols else "")
-            x_combo = ttk.Combobox(config_frame, textvariable=x_var, values=numeric_cols, width=20)
+            x_combo = self.app._make_column_combo(config_frame, x_var, 'numeric', width=20)
             x_combo.pack(side=tk.LEFT, padx=5)
             
             ttk.Label(config_frame, text="Y-axis:").pack(side=tk.LEFT, padx=5)
             y_var = tk.StringVar(value=numeric_cols[1] if len(numeric_cols) > 1 else numeric_cols[0] if numeric_cols else "")
-            y_combo = ttk.Combobox(config_frame, textvariable=y_var, values=numeric_cols, width=20)
+            y_combo = self.app._make_column_combo(config_frame, y_var, 'numeric', width=20)
             y_combo.pack(side=tk.LEFT, padx=5)
             
         elif plot_type == 'heatmap':
             # Heatmap uses all numeric columns
             pass
         
+        # Large series are sampled/aggregated; the result looks the same at screen resolution
+        downsample_var = tk.BooleanVar(value=True)
+        if plot_type in ['bar', 'line', 'scatter']:
+            ttk.Checkbutton(config_frame, text="Downsample large series",
+                            variable=downsample_var).pack(side=tk.LEFT, padx=5)
+        
         # Canvas for plot
         canvas_frame = ttk.Frame(viz_window)
         canvas_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -104,12 +266,11 @@ class VisualizationManager:
         
         def update_plot():
             """Update the plot with current selections"""
-            ax.clear()
+            self._clear_axes(ax)
             
             try:
                 if plot_type == 'bar':
-                    x_data = self.app.df[x_var.get()]
-                    y_data = self.app.df[y_var.get()]
+                    x_data, y_data = self._xy_series(x_var.get(), y_var.get(), downsample_var.get())
                     ax.bar(x_data, y_data)
                     ax.set_xlabel(x_var.get())
                     ax.set_ylabel(y_var.get())
@@ -117,54 +278,76 @@ class VisualizationManager:
                     plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
                     
                 elif plot_type == 'line':
-                    x_data = self.app.df[x_var.get()]
-                    y_data = self.app.df[y_var.get()]
-                    ax.plot(x_data, y_data, marker='o')
+                    x_data, y_data = self._xy_series(x_var.get(), y_var.get(), downsample_var.get())
+                    ax.plot(x_data, y_data, marker='o' if len(x_data) <= MAX_LINE_POINTS else None,
+                            rasterized=len(x_data) > MAX_LINE_POINTS)
                     ax.set_xlabel(x_var.get())
                     ax.set_ylabel(y_var.get())
                     ax.set_title(f"{y_var.get()} over {x_var.get()}")
                     plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
                     
                 elif plot_type == 'pie':
-                    data = self.app.df.groupby(cat_var.get())[val_var.get()].sum()
+                    if len(self.app.df) > FAST_GROUP_MIN_ROWS:
+                        data = fast_group_sum(self.app.df[cat_var.get()], self.app.df[val_var.get()])
+                    else:
+                        data = self.app.df.groupby(cat_var.get(), observed=True, sort=False)[val_var.get()].sum()
+                    if len(data) > MAX_PIE_SLICES:
+                        top = data.nlargest(MAX_PIE_SLICES)
+                        data = pd.concat([top, pd.Series({'Other': data.sum() - top.sum()})])
                     ax.pie(data.values, labels=data.index, autopct='%1.1f%%')
                     ax.set_title(f"{val_var.get()} distribution by {cat_var.get()}")
                     
                 elif plot_type == 'histogram':
                     data = self.app.df[col_var.get()].dropna()
-                    ax.hist(data, bins=30, edgecolor='black')
+                    counts, edges = np.histogram(data.to_numpy(), bins=30)
+                    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', edgecolor='black')
                     ax.set_xlabel(col_var.get())
                     ax.set_ylabel('Frequency')
                     ax.set_title(f"Distribution of {col_var.get()}")
                     
                 elif plot_type == 'boxplot':
-                    data = self.app.df[col_var.get()].dropna()
-                    ax.boxplot(data)
-                    ax.set_ylabel(col_var.get())
-                    ax.set_title(f"Box Plot of {col_var.get()}")
+                    cols = [col_list.get(i) for i in col_list.curselection()]
+                    if not cols:
+                        messagebox.showwarning("Warning", "Select at least one column!")
+                        return
+                    ax.bxp(_box_stats(self.app.df[cols]))
+                    ax.set_ylabel(cols[0] if len(cols) == 1 else "Value")
+                    ax.set_title(f"Box Plot of {', '.join(cols)}")
                     
                 elif plot_type == 'scatter':
-                    x_data = self.app.df[x_var.get()].dropna()
-                    y_data = self.app.df[y_var.get()].dropna()
-                    ax.scatter(x_data, y_data, alpha=0.5)
+                    sample = self.app.df[[x_var.get(), y_var.get()]].dropna()
+                    if downsample_var.get() and len(sample) > MAX_SCATTER_POINTS:
+                        sample = sample.sample(MAX_SCATTER_POINTS, random_state=0)
+                    ax.scatter(sample[x_var.get()], sample[y_var.get()], alpha=0.5)
                     ax.set_xlabel(x_var.get())
                     ax.set_ylabel(y_var.get())
                     ax.set_title(f"{y_var.get()} vs {x_var.get()}")
                     
                 elif plot_type == 'heatmap':
-                    numeric_df = self.app.df.select_dtypes(include=['number'])
-                    corr = numeric_df.corr()
-                    sns.heatmap(corr, annot=True, fmt='.2f', cmap='coolwarm', ax=ax)
+                    corr = self.app.get_corr_matrix()
+                    # Redraw the colorbar into the axes created by the first
+                    # heatmap instead of carving a new one out of ax each time
+                    cbar_ax = self._figs[window_key][1]
+                    if cbar_ax is not None:
+                        cbar_ax.clear()
+                    sns.heatmap(corr, annot=True, fmt='.2f', cmap='coolwarm', ax=ax, cbar_ax=cbar_ax)
+                    if cbar_ax is None:
+                        self._figs[window_key] = (fig, ax.collections[0].colorbar.ax)
                     ax.set_title("Correlation Heatmap")
                     
                 elif plot_type == 'distribution':
                     data = self.app.df[col_var.get()].dropna()
-                    sns.histplot(data, kde=True, ax=ax)
+                    counts, edges = np.histogram(data.to_numpy(), bins=30, density=True)
+                    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                           edgecolor='white', alpha=0.6)
+                    if len(data) > MAX_KDE_POINTS:
+                        data = data.sample(MAX_KDE_POINTS, random_state=0)
+                    sns.kdeplot(data, ax=ax)
                     ax.set_xlabel(col_var.get())
+                    ax.set_ylabel('Density')
                     ax.set_title(f"Distribution of {col_var.get()}")
                 
-                fig.tight_layout()
-                canvas.draw()
+                canvas.draw_idle()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to create plot:\n{str(e)}")
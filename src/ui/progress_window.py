@@ -6,7 +6,6 @@ Shows detailed progress for long-running operations
 import tkinter as tk
 from tkinter import ttk
 import threading
-import time
 
 
 class ProgressWindow:
@@ -36,9 +35,15 @@ class ProgressWindow:
         self.window.transient(parent)
         self.window.grab_set()
         
-        self.canceled = False
+        # Set on the Tk thread, polled by the worker's progress callback
+        self._cancel_event = threading.Event()
         self.cancelable = cancelable
         
+        # Latest unrendered update() values; repainted once per idle pass
+        self._pending = {}
+        self._scheduled = False
+        self._pending_lock = threading.Lock()
+        
         self._create_ui()
     
     def _create_ui(self):
@@ -90,16 +95,39 @@ class ProgressWindow:
         detail : str
             Technical detail message
         """
-        if progress is not None:
-            self.progress_var.set(progress)
-        
-        if status is not None:
-            self.status_label.config(text=status)
+        with self._pending_lock:
+            if progress is not None:
+                self._pending['progress'] = progress
+            if status is not None:
+                self._pending['status'] = status
+            if detail is not None:
+                self._pending['detail'] = detail
+            if self._scheduled:
+                return
+            self._scheduled = True
         
-        if detail is not None:
-            self.detail_label.config(text=detail)
+        # Bursts of updates collapse into a single repaint with the newest values
+        try:
+            self.window.after_idle(self._flush)
+        except tk.TclError:
+            pass  # Window already closed
+    
+    def _flush(self):
+        """Apply the most recent pending update to the widgets"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            self._scheduled = False
         
-        self.window.update()
+        try:
+            if 'progress' in pending:
+                self.progress_var.set(pending['progress'])
+            if 'status' in pending:
+                self.status_label.config(text=pending['status'])
+            if 'detail' in pending:
+                self.detail_label.config(text=pending['detail'])
+            self.window.update_idletasks()
+        except tk.TclError:
+            pass  # Window already closed
     
     def set_indeterminate(self):
         """Set progress bar to indeterminate mode (continuous animation)"""
@@ -113,14 +141,19 @@ class ProgressWindow:
     
     def _on_cancel(self):
         """Handle cancel button click"""
-        self.canceled = True
+        self._cancel_event.set()
         self.status_label.config(text="Canceling...")
         if self.cancelable:
             self.cancel_button.config(state='disabled')
     
+    @property
+    def canceled(self):
+        """True once the user has asked to cancel"""
+        return self._cancel_event.is_set()
+    
     def is_canceled(self):
         """Check if operation was canceled"""
-        return self.canceled
+        return self._cancel_event.is_set()
     
     def close(self):
         """Close progress window"""
@@ -172,17 +205,18 @@ class BackgroundTask:
         # Create progress window
         self.progress_window = ProgressWindow(self.parent, self.title, self.cancelable)
         
-        # Start task in background thread
+        # Closing the window would abandon the worker; treat it as cancel instead
+        on_close = self.progress_window._on_cancel if self.cancelable else (lambda: None)
+        self.progress_window.window.protocol("WM_DELETE_WINDOW", on_close)
+        
+        # Start task in a daemon thread, so closing the app never waits on it
+        self.done_event = threading.Event()
         self.thread = threading.Thread(target=self._execute_task, daemon=True)
         self.thread.start()
         
-        # Wait for completion
-        while self.thread.is_alive():
-            self.parent.update()
-            time.sleep(0.1)
-        
-        # Close progress window
-        self.progress_window.close()
+        # Let the main loop run until _check_done closes the window
+        self.parent.after(50, self._check_done)
+        self.progress_window.window.wait_window()
         
         # Return result or raise error
         if self.error:
@@ -190,6 +224,13 @@ class BackgroundTask:
         
         return self.result
     
+    def _check_done(self):
+        """Close the progress window once the worker has finished, else poll again"""
+        if self.done_event.is_set():
+            self.progress_window.close()
+        else:
+            self.parent.after(50, self._check_done)
+    
     def _execute_task(self):
         """Execute task in background"""
         try:
@@ -207,6 +248,9 @@ class BackgroundTask:
             
         except Exception as e:
             self.error = e
+        
+        finally:
+            self.done_event.set()
 
 
 def run_with_progress(parent, task_func, title="Processing", cancelable=False):
@@ -6,7 +6,62 @@ SEPARATION OF CONCERNS: Theme management only
 """
 
 import tkinter as tk
-from tkinter import ttk
+import weakref
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from tkinter import ttk, scrolledtext
+from types import MappingProxyType
+
+
+# configure() options per tk widget kind: option name -> THEMES colour key
+_WIDGET_OPTIONS = {
+    'text': {'bg': 'text_bg', 'fg': 'text_fg', 'insertbackground': 'text_fg',
+             'selectbackground': 'select_bg', 'selectforeground': 'select_fg'},
+    'frame': {'bg': 'bg'},
+    'label': {'bg': 'bg', 'fg': 'fg'},
+    'button': {'bg': 'button_bg', 'fg': 'button_fg',
+               'activebackground': 'select_bg', 'activeforeground': 'select_fg'},
+    'menu': {'bg': 'menu_bg', 'fg': 'menu_fg',
+             'activebackground': 'select_bg', 'activeforeground': 'select_fg'},
+}
+
+
+# Exact widget class -> registry kind. ttk widgets are styled through ttk
+# themes and are absent, as is anything else without colour options.
+_KIND_BY_TYPE = {
+    tk.Text: 'text',
+    scrolledtext.ScrolledText: 'text',
+    tk.Frame: 'frame',
+    tk.PanedWindow: 'frame',
+    tk.Label: 'label',
+    tk.Button: 'button',
+    tk.Menu: 'menu',
+}
+
+
+@dataclass(frozen=True)
+class Palette:
+    """Immutable colours of one theme, with tk configure kwargs resolved per widget kind"""
+    name: str
+    bg: str
+    fg: str
+    text_bg: str
+    text_fg: str
+    button_bg: str
+    button_fg: str
+    select_bg: str
+    select_fg: str
+    menu_bg: str
+    menu_fg: str
+    # kind -> configure kwargs, see _WIDGET_OPTIONS
+    widget_kw: Mapping = field(default_factory=dict, compare=False, repr=False)
+    
+    @classmethod
+    def from_theme(cls, theme):
+        """Build a Palette from one THEMES entry"""
+        widget_kw = {kind: {opt: theme[key] for opt, key in options.items()}
+                     for kind, options in _WIDGET_OPTIONS.items()}
+        return cls(**theme, widget_kw=MappingProxyType(widget_kw))
 
 
 class ThemeManager:
@@ -54,9 +109,20 @@ class ThemeManager:
         }
     }
     
+    # Frozen palettes with widget kwargs resolved once at import
+    PALETTES = {name: Palette.from_theme(theme) for name, theme in THEMES.items()}
+    
     def __init__(self, root):
         self.root = root
         self.current_theme = 'system'
+        self._applied = False
+        # tk widgets recoloured on theme change, by kind; entries vanish with the widget
+        self._registry = {kind: weakref.WeakSet()
+                          for kind in _WIDGET_OPTIONS}
+        # Flat [(widget, kind)] snapshot of _registry, rebuilt after any change
+        self._widget_cache = None
+        # Pending after_idle recolour; several quick theme switches share one pass
+        self._recolor_job = None
         self._create_styles()
     
     def _create_styles(self):
@@ -71,123 +137,157 @@ class ThemeManager:
             self.style.theme_use('clam')
         elif 'alt' in available_themes:
             self.style.theme_use('alt')
+        
+        # Install one ttk theme per palette up front, derived from the base
+        # theme above. Every theme switch is then a single theme_use and no
+        # ttk style is ever reconfigured in place
+        base_theme = self.style.theme_use()
+        for name, palette in self.PALETTES.items():
+            self.style.theme_create(self._ttk_theme_name(name), parent=base_theme,
+                                    settings=self._ttk_settings(palette))
+    
+    @staticmethod
+    def _ttk_theme_name(theme_name):
+        """Name of the ttk theme installed for a palette"""
+        return f"nexdata_{theme_name}"
     
     def apply_theme(self, theme_name='system'):
         """Apply a theme to the application"""
         if theme_name not in self.THEMES:
             theme_name = 'system'
         
-        theme = self.THEMES[theme_name]
+        # Already showing this palette: registered widgets were coloured on
+        # registration, so there is nothing to redo
+        if self._applied and theme_name == self.current_theme:
+            return theme_name
+        
+        palette = self.PALETTES[theme_name]
         self.current_theme = theme_name
         
         # Configure root window
-        self.root.configure(bg=theme['bg'])
+        self.root.configure(bg=palette.bg)
         
-        # Configure ttk styles
-        self.style.configure('TFrame', background=theme['bg'])
-        self.style.configure('TLabel', background=theme['bg'], foreground=theme['fg'])
-        self.style.configure('TButton', 
-                           background=theme['button_bg'], 
-                           foreground=theme['button_fg'],
-                           borderwidth=1,
-                           relief='raised')
-        self.style.map('TButton',
-                      background=[('active', theme['select_bg']),
-                                ('pressed', theme['select_bg'])],
-                      foreground=[('active', theme['select_fg']),
-                                ('pressed', theme['select_fg'])])
+        # All ttk styles for this palette were installed by _create_styles
+        self.style.theme_use(self._ttk_theme_name(theme_name))
         
-        # Configure Text widget styles
-        self.style.configure('TNotebook', background=theme['bg'])
-        self.style.configure('TNotebook.Tab', 
-                           background=theme['menu_bg'], 
-                           foreground=theme['menu_fg'])
-        self.style.map('TNotebook.Tab',
-                      background=[('selected', theme['select_bg'])],
-                      foreground=[('selected', theme['select_fg'])])
+        # Recolour the registered tk widgets in one idle pass; ttk widgets
+        # follow the ttk theme above
+        self._applied = True
+        if self._recolor_job is None:
+            self._recolor_job = self.root.after_idle(self._recolor_registered)
         
-        # Title label style
-        self.style.configure('Title.TLabel',
-                           font=('Arial', 16, 'bold'),
-                           background=theme['bg'],
-                           foreground=theme['fg'])
+        return theme_name
+    
+    @staticmethod
+    def _ttk_settings(palette):
+        """ttk theme_settings spec (style -> configure/map) for one Palette"""
+        return {
+            'TFrame': {'configure': {'background': palette.bg}},
+            'TLabel': {'configure': {'background': palette.bg, 'foreground': palette.fg}},
+            'TButton': {
+                'configure': {'background': palette.button_bg,
+                              'foreground': palette.button_fg,
+                              'borderwidth': 1,
+                              'relief': 'raised'},
+                'map': {'background': [('active', palette.select_bg),
+                                       ('pressed', palette.select_bg)],
+                        'foreground': [('active', palette.select_fg),
+                                       ('pressed', palette.select_fg)]},
+            },
+            'TNotebook': {'configure': {'background': palette.bg}},
+            'TNotebook.Tab': {
+                'configure': {'background': palette.menu_bg, 'foreground': palette.menu_fg},
+                'map': {'background': [('selected', palette.select_bg)],
+                        'foreground': [('selected', palette.select_fg)]},
+            },
+            # Title label style
+            'Title.TLabel': {'configure': {'font': ('Arial', 16, 'bold'),
+                                           'background': palette.bg,
+                                           'foreground': palette.fg}},
+            # Header label style (for "Quick Actions", "Dataset Info", etc.)
+            'Header.TLabel': {'configure': {'font': ('Arial', 12, 'bold'),
+                                            'background': palette.bg,
+                                            'foreground': palette.fg}},
+            # Action button style
+            'Action.TButton': {'configure': {'font': ('Arial', 10, 'bold'), 'padding': 5}},
+        }
+    
+    def _recolor_registered(self):
+        """Configure every registered widget for the current theme, then repaint once"""
+        self._recolor_job = None
+        # Dialogs nobody registered explicitly: pick up their tk widgets once
+        # here so they follow the switch too
+        for child in self.root.winfo_children():
+            if isinstance(child, tk.Toplevel):
+                self.register_tree(child)
+        kwargs_by_kind = self.PALETTES[self.current_theme].widget_kw
+        for widget, kind in self._flat_widgets():
+            try:
+                widget.configure(**kwargs_by_kind[kind])
+            except tk.TclError:
+                # Widget was destroyed; rebuild the flat list next time
+                self._widget_cache = None
+        self.root.update_idletasks()
+    
+    def register(self, widget, kind=None):
+        """
+        Register a tk widget to be recoloured on every theme change
         
-        # Header label style (for "Quick Actions", "Dataset Info", etc.)
-        self.style.configure('Header.TLabel',
-                           font=('Arial', 12, 'bold'),
-                           background=theme['bg'],
-                           foreground=theme['fg'])
+        Args:
+            widget: A tk (not ttk) widget
+            kind: One of 'text', 'frame', 'label', 'button', 'menu'; looked up
+                from the widget's class when omitted
         
-        # Action button style
-        self.style.configure('Action.TButton',
-                           font=('Arial', 10, 'bold'),
-                           padding=5)
+        Returns:
+            The widget, so factories can register inline
+        """
+        if kind is None:
+            kind = _KIND_BY_TYPE.get(type(widget))
+            if kind is None:
+                return widget
+        self._registry[kind].add(widget)
+        self.invalidate_cache()
+        if self._applied:
+            widget.configure(**self.PALETTES[self.current_theme].widget_kw[kind])
+        return widget
+    
+    def register_tree(self, widget):
+        """
+        Register widget and all its descendants that have a themable tk class
         
-        # Update all existing widgets
-        self._update_widgets(self.root, theme)
+        Widgets that were not registered yet are coloured for the current
+        theme straight away, as register() does.
         
-        return theme_name
+        Args:
+            widget: Root of the subtree, e.g. the main window or a dialog
+        """
+        kinds = _KIND_BY_TYPE
+        widget_kw = self.PALETTES[self.current_theme].widget_kw
+        added = False
+        stack = [widget]
+        while stack:
+            w = stack.pop()
+            kind = kinds.get(type(w))
+            if kind is not None and w not in self._registry[kind]:
+                self._registry[kind].add(w)
+                added = True
+                if self._applied:
+                    w.configure(**widget_kw[kind])
+            stack.extend(w.winfo_children())
+        if added:
+            self.invalidate_cache()
+    
+    def invalidate_cache(self):
+        """Drop the flat widget list so the next theme change rebuilds it"""
+        self._widget_cache = None
     
-    def _update_widgets(self, widget, theme):
-        """Recursively update all widgets"""
-        try:
-            # Update Text widgets (including ScrolledText)
-            if isinstance(widget, tk.Text):
-                widget.configure(
-                    bg=theme['text_bg'],
-                    fg=theme['text_fg'],
-                    insertbackground=theme['text_fg'],
-                    selectbackground=theme['select_bg'],
-                    selectforeground=theme['select_fg']
-                )
-            
-            # Update Frame widgets (both tk.Frame and ttk.Frame)
-            elif isinstance(widget, (tk.Frame, ttk.Frame)):
-                try:
-                    widget.configure(bg=theme['bg'])
-                except:
-                    # ttk.Frame doesn't have bg, uses style instead
-                    pass
-            
-            # Update Label widgets (both tk.Label and ttk.Label)
-            elif isinstance(widget, (tk.Label, ttk.Label)):
-                try:
-                    widget.configure(bg=theme['bg'], fg=theme['fg'])
-                except:
-                    # ttk.Label uses style
-                    pass
-            
-            # Update Button widgets (tk.Button only)
-            elif isinstance(widget, tk.Button):
-                widget.configure(
-                    bg=theme['button_bg'],
-                    fg=theme['button_fg'],
-                    activebackground=theme['select_bg'],
-                    activeforeground=theme['select_fg']
-                )
-            
-            # Update Menu widgets
-            elif isinstance(widget, tk.Menu):
-                widget.configure(
-                    bg=theme['menu_bg'],
-                    fg=theme['menu_fg'],
-                    activebackground=theme['select_bg'],
-                    activeforeground=theme['select_fg']
-                )
-            
-            # Update PanedWindow
-            elif isinstance(widget, (tk.PanedWindow, ttk.PanedWindow)):
-                try:
-                    widget.configure(bg=theme['bg'])
-                except:
-                    pass
-            
-            # Recursively update children
-            for child in widget.winfo_children():
-                self._update_widgets(child, theme)
-        except Exception as e:
-            # Silently continue if widget doesn't support theming
-            pass
+    def _flat_widgets(self):
+        """Registered widgets as one flat list of (widget, kind), built on demand"""
+        if self._widget_cache is None:
+            self._widget_cache = [(widget, kind)
+                                  for kind, widgets in self._registry.items()
+                                  for widget in widgets]
+        return self._widget_cache
     
     def get_current_theme(self):
         """Get current theme name"""
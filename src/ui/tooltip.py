@@ -4,14 +4,98 @@ Shows helpful hints when user hovers over UI elements
 """
 
 import tkinter as tk
+import weakref
 from tkinter import ttk
 
 
+class _TooltipManager:
+    """
+    One reusable tooltip window shared by every ToolTip in the application
+    
+    Hiding is debounced, so moving the pointer between adjacent tooltipped
+    widgets repositions the window instead of destroying and recreating it.
+    """
+    
+    HIDE_DELAY = 100  # ms
+    
+    def __init__(self, root):
+        """
+        Build the hidden tooltip window
+        
+        Parameters:
+        -----------
+        root : tk.Tk
+            Application root window
+        """
+        self.window = tk.Toplevel(root)
+        self.window.wm_overrideredirect(True)
+        self.window.withdraw()
+        self._hide_job = None
+        
+        # Styling
+        frame = tk.Frame(self.window, 
+                        background="#ffffe0",
+                        borderwidth=1,
+                        relief="solid")
+        frame.pack()
+        
+        self.label = tk.Label(frame,
+                              justify=tk.LEFT,
+                              background="#ffffe0",
+                              foreground="#000000",
+                              relief=tk.FLAT,
+                              borderwidth=0,
+                              font=('TkDefaultFont', 9))
+        self.label.pack(padx=6, pady=4)
+    
+    def show(self, text, x, y, wrap_length):
+        """Show text at screen position (x, y), cancelling any pending hide"""
+        self._cancel_hide()
+        self.label.configure(text=text, wraplength=wrap_length)
+        self.window.wm_geometry(f"+{x}+{y}")
+        self.window.deiconify()
+        self.window.lift()
+    
+    def hide(self):
+        """Withdraw the window after HIDE_DELAY unless show() is called first"""
+        self._cancel_hide()
+        self._hide_job = self.window.after(self.HIDE_DELAY, self._withdraw)
+    
+    def _cancel_hide(self):
+        if self._hide_job:
+            self.window.after_cancel(self._hide_job)
+            self._hide_job = None
+    
+    def _withdraw(self):
+        self._hide_job = None
+        self.window.withdraw()
+
+
+# Created on first hover, for the root of the first tooltipped widget
+_shared_tooltip = None
+
+
+def _get_tooltip_manager(widget):
+    """Return the shared tooltip manager, creating it on first use"""
+    global _shared_tooltip
+    if _shared_tooltip is None or not _shared_tooltip.window.winfo_exists():
+        _shared_tooltip = _TooltipManager(widget._root())
+    return _shared_tooltip
+
+
 class ToolTip:
     """
     Create a tooltip for a given widget with modern styling
+    
+    Widgets are not bound individually: each is tagged with the shared
+    'Tooltipped' bind tag, whose class-level handlers look the tooltip up
+    by event.widget.
     """
     
+    # Widget -> its ToolTip; entries go away with the widget
+    _tips = weakref.WeakKeyDictionary()
+    _class_bound = False
+    
     def __init__(self, widget, text='', delay=500, wrap_length=200):
         """
         Initialize tooltip
@@ -27,17 +111,38 @@ class ToolTip:
         wrap_length : int
             Maximum width for text wrapping
         """
-        self.widget = widget
+        # Weak, so the _tips entry does not keep its own key alive
+        self._widget_ref = weakref.ref(widget)
         self.text = text
         self.delay = delay
         self.wrap_length = wrap_length
-        self.tooltip_window = None
         self.after_id = None
         
-        # Bind events
-        self.widget.bind("<Enter>", self.on_enter)
-        self.widget.bind("<Leave>", self.on_leave)
-        self.widget.bind("<ButtonPress>", self.on_leave)
+        ToolTip._tips[widget] = self
+        if 'Tooltipped' not in widget.bindtags():
+            widget.bindtags(widget.bindtags() + ('Tooltipped',))
+        if not ToolTip._class_bound:
+            widget.bind_class('Tooltipped', '<Enter>', ToolTip._class_on_enter)
+            widget.bind_class('Tooltipped', '<Leave>', ToolTip._class_on_leave)
+            widget.bind_class('Tooltipped', '<ButtonPress>', ToolTip._class_on_leave)
+            ToolTip._class_bound = True
+    
+    @property
+    def widget(self):
+        """The widget this tooltip is attached to"""
+        return self._widget_ref()
+    
+    @staticmethod
+    def _class_on_enter(event):
+        tip = ToolTip._tips.get(event.widget)
+        if tip is not None:
+            tip.on_enter(event)
+    
+    @staticmethod
+    def _class_on_leave(event):
+        tip = ToolTip._tips.get(event.widget)
+        if tip is not None:
+            tip.on_leave(event)
     
     def on_enter(self, event=None):
         """Handle mouse enter event"""
@@ -55,47 +160,28 @@ class ToolTip:
     
     def cancel_tooltip(self):
         """Cancel scheduled tooltip"""
-        if self.after_id:
-            self.widget.after_cancel(self.after_id)
-            self.after_id = None
+        widget = self.widget
+        if self.after_id and widget is not None:
+            widget.after_cancel(self.after_id)
+        self.after_id = None
     
     def show_tooltip(self):
-        """Show tooltip window"""
-        if self.tooltip_window or not self.text:
+        """Show tooltip in the shared tooltip window"""
+        self.after_id = None
+        widget = self.widget
+        if widget is None or not self.text:
             return
         
         # Get widget position
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-        
-        # Create tooltip window
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
-        
-        # Styling
-        frame = tk.Frame(self.tooltip_window, 
-                        background="#ffffe0",
-                        borderwidth=1,
-                        relief="solid")
-        frame.pack()
+        x = widget.winfo_rootx() + 20
+        y = widget.winfo_rooty() + widget.winfo_height() + 5
         
-        label = tk.Label(frame,
-                        text=self.text,
-                        justify=tk.LEFT,
-                        background="#ffffe0",
-                        foreground="#000000",
-                        relief=tk.FLAT,
-                        borderwidth=0,
-                        wraplength=self.wrap_length,
-                        font=('TkDefaultFont', 9))
-        label.pack(padx=6, pady=4)
+        _get_tooltip_manager(widget).show(self.text, x, y, self.wrap_length)
     
     def hide_tooltip(self):
-        """Hide tooltip window"""
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-            self.tooltip_window = None
+        """Hide the shared tooltip window (debounced)"""
+        if _shared_tooltip is not None:
+            _shared_tooltip.hide()
 
 
 def create_tooltip(widget, text, delay=500):
@@ -4,11 +4,32 @@ Saves work periodically and provides crash recovery functionality
 """
 
 import os
+import heapq
+import importlib.util
 import pandas as pd
 from datetime import datetime
 import json
 import threading
-import time
+import traceback
+
+
+# Columnar zstd snapshots when pyarrow is available; gzipped CSV otherwise
+# (plain .csv is still recognised for snapshots from earlier versions)
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+_AUTOSAVE_EXTS = ('.parquet', '.csv.gz', '.csv')
+# Rows serialised per batch by the CSV fallback, bounding its peak memory
+_CSV_CHUNK_ROWS = 100_000
+
+
+def _commit_file(tmp_path, path):
+    """Flush tmp_path to disk and atomically rename it over path"""
+    # Read-write: on Windows fsync (_commit) rejects read-only descriptors
+    fd = os.open(tmp_path, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
 
 class AutoSaveManager:
@@ -27,11 +48,16 @@ class AutoSaveManager:
         """
         self.save_interval = save_interval
         self.autosave_dir = os.path.join(os.path.dirname(__file__), '..', '..', '.autosave')
-        self.is_running = False
+        # Set to stop the saver thread; wakes it immediately from its interval wait
+        self._stop_event = threading.Event()
         self.thread = None
         self.current_df = None
+        # Guards current_df, which the UI thread swaps while the saver reads it
+        self._lock = threading.Lock()
         self.original_path = None
         self.last_save_time = None
+        # Content signature of the last frame written; unchanged data is not rewritten
+        self._last_hash = None
         
         # Create autosave directory if not exists
         os.makedirs(self.autosave_dir, exist_ok=True)
@@ -53,8 +79,10 @@ class AutoSaveManager:
     def _save_metadata(self):
         """Save autosave metadata"""
         try:
-            with open(self.metadata_path, 'w') as f:
+            tmp_path = self.metadata_path + '.tmp'
+            with open(tmp_path, 'w') as f:
                 json.dump(self.metadata, f, indent=2)
+            _commit_file(tmp_path, self.metadata_path)
         except Exception as e:
             print(f"Error saving metadata: {e}")
     
@@ -72,73 +100,153 @@ class AutoSaveManager:
         if self.is_running:
             self.stop()
         
-        self.current_df = df
+        with self._lock:
+            self.current_df = df
         self.original_path = original_path
-        self.is_running = True
         
-        # Start background thread
-        self.thread = threading.Thread(target=self._autosave_loop, daemon=True)
+        # Start background thread; each run gets its own stop event
+        self._stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._autosave_loop, args=(self._stop_event,),
+                                       daemon=True)
         self.thread.start()
     
     def stop(self):
         """Stop auto-save thread"""
-        self.is_running = False
+        self._stop_event.set()
         if self.thread:
+            # Bounded: stop() runs on the Tk thread, so a large save still
+            # mid-write is left to finish on its own (daemon) thread
             self.thread.join(timeout=1.0)
         self.thread = None
     
+    @property
+    def is_running(self):
+        """True while the auto-save thread is active"""
+        return self.thread is not None and not self._stop_event.is_set()
+    
     def update_data(self, df):
         """Update dataframe to be saved"""
-        self.current_df = df
+        with self._lock:
+            self.current_df = df
     
-    def _autosave_loop(self):
+    def _autosave_loop(self, stop_event):
         """Background loop for auto-saving"""
-        while self.is_running:
-            time.sleep(self.save_interval)
-            
-            if self.current_df is not None and self.is_running:
+        while not stop_event.wait(self.save_interval):
+            if self.current_df is not None:
                 try:
                     self._perform_autosave()
-                except Exception as e:
-                    print(f"AutoSave error: {e}")
+                except Exception:
+                    # Keep the loop alive but surface the full failure
+                    print("AutoSave error:")
+                    traceback.print_exc()
     
     def _perform_autosave(self):
         """Perform the actual auto-save"""
-        if self.current_df is None:
+        # Work on a snapshot of the reference; update_data may swap it meanwhile
+        with self._lock:
+            df = self.current_df
+        if df is None:
+            return
+        
+        # Nothing changed since the last snapshot: skip the rewrite
+        signature = self._frame_signature(df)
+        if signature is not None and signature == self._last_hash:
             return
         
         # Generate autosave filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        autosave_file = os.path.join(self.autosave_dir, f"autosave_{timestamp}.csv")
-        
-        # Save dataframe
-        self.current_df.to_csv(autosave_file, index=False)
+        autosave_file = self._write_snapshot(df, os.path.join(self.autosave_dir, f"autosave_{timestamp}"))
         
         # Update metadata
         self.metadata = {
             'last_autosave': autosave_file,
             'timestamp': timestamp,
             'original_path': self.original_path,
-            'rows': len(self.current_df),
-            'columns': len(self.current_df.columns)
+            'rows': len(df),
+            'columns': len(df.columns)
         }
         self._save_metadata()
         
         self.last_save_time = datetime.now()
+        self._last_hash = signature
         
         # Clean up old autosaves (keep only last 5)
         self._cleanup_old_autosaves()
     
+    @staticmethod
+    def _frame_signature(df):
+        """
+        Cheap content signature of df: column labels, shape and row hashes in order
+        
+        Returns:
+        --------
+        tuple or None
+            None when the frame holds unhashable values (e.g. lists)
+        """
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        except TypeError:
+            return None
+        # Hash the row hashes as bytes so reordering (e.g. a sort) counts as a change
+        return tuple(df.columns), df.shape, hash(row_hashes.tobytes())
+    
+    @staticmethod
+    def _write_snapshot(df, base_path):
+        """
+        Write df to base_path plus an extension, preferring zstd Parquet
+        
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Data to save
+        base_path : str
+            Target path without extension
+        
+        Returns:
+        --------
+        str
+            Path of the file written
+        """
+        # Everything is written to a .tmp sibling and renamed into place once
+        # complete, so a crash mid-write never leaves a truncated snapshot
+        if _HAS_PYARROW:
+            path = base_path + '.parquet'
+            tmp_path = path + '.tmp'
+            try:
+                df.to_parquet(tmp_path, compression='zstd', index=False)
+                _commit_file(tmp_path, path)
+                return path
+            except (ValueError, TypeError, NotImplementedError, ImportError):
+                # Non-string column names, mixed-type object columns or unsupported dtypes
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        path = base_path + '.csv.gz'
+        tmp_path = path + '.tmp'
+        # Compression is explicit because the .tmp suffix defeats inference
+        df.to_csv(tmp_path, index=False, chunksize=_CSV_CHUNK_ROWS, compression='gzip')
+        _commit_file(tmp_path, path)
+        return path
+    
     def _cleanup_old_autosaves(self):
         """Remove old autosave files, keep only last 5"""
         try:
-            autosaves = [f for f in os.listdir(self.autosave_dir) 
-                        if f.startswith('autosave_') and f.endswith('.csv')]
-            autosaves.sort(reverse=True)
+            with os.scandir(self.autosave_dir) as it:
+                entries = [e for e in it if e.name.startswith('autosave_')]
+            autosaves = []
+            for entry in entries:
+                if entry.name.endswith(_AUTOSAVE_EXTS):
+                    autosaves.append(entry)
+                elif entry.name.endswith('.tmp'):
+                    # Left by a write interrupted in an earlier session
+                    os.unlink(entry.path)
+            if len(autosaves) <= 5:
+                return
             
-            # Keep only 5 most recent
-            for old_file in autosaves[5:]:
-                os.remove(os.path.join(self.autosave_dir, old_file))
+            # Keep only 5 most recent; DirEntry.stat() reuses the scan's metadata where it can
+            keep = {e.path for e in heapq.nlargest(5, autosaves, key=lambda e: e.stat().st_mtime)}
+            for entry in autosaves:
+                if entry.path not in keep:
+                    os.unlink(entry.path)
         except Exception as e:
             print(f"Cleanup error: {e}")
     
@@ -192,7 +300,12 @@ class AutoSaveManager:
             return None
         
         try:
-            df = pd.read_csv(recovery_info['file'])
+            path = recovery_info['file']
+            if path.endswith('.parquet'):
+                df = pd.read_parquet(path)
+            else:
+                # Infers gzip from .csv.gz; older plain .csv snapshots read as-is
+                df = pd.read_csv(path)
             return df
         except Exception as e:
             print(f"Recovery error: {e}")
@@ -207,6 +320,7 @@ class AutoSaveManager:
                     os.remove(os.path.join(self.autosave_dir, f))
             
             self.metadata = {}
+            self._last_hash = None
             return True
         except Exception as e:
             print(f"Clear error: {e}")
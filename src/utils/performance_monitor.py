@@ -11,27 +11,54 @@ import os
 from datetime import datetime
 
 
+# Fixed for the life of the process; read once at import
+_CPU_COUNT = psutil.cpu_count()
+_TOTAL_MEM = psutil.virtual_memory().total
+
+# (report section, metric, threshold, tip) - a tip is emitted when the
+# metric exceeds its threshold
+_TIP_RULES = (
+    ('memory', 'percent', 50,
+     "⚠️ High memory usage detected. Consider processing data in chunks."),
+    ('memory', 'rss_mb', 1000,
+     "💡 Memory usage exceeds 1GB. Optimize data types or filter unnecessary columns."),
+    ('cpu', 'percent', 80,
+     "⚠️ High CPU usage. Consider optimizing calculations or using vectorized operations."),
+    ('system', 'memory_percent', 90,
+     "⚠️ System memory critically low. Close other applications."),
+)
+_SLOW_OP_SECONDS = 5
+
+
 class PerformanceMonitor:
     """Monitor application performance"""
     
     def __init__(self):
-        self.start_time = time.time()
-        self.operation_times = {}
+        self.start_time = time.perf_counter()
+        # Operation name -> perf_counter() at start, and -> last measured duration
+        self._starts = {}
+        self._durations = {}
+        # One Process handle for the app's lifetime instead of one per query
+        self._process = psutil.Process(os.getpid())
+        # Prime the CPU counters so later interval=None reads return the
+        # usage since the previous call without blocking
+        self._process.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None)
     
     def start_operation(self, operation_name):
         """Start timing an operation"""
-        self.operation_times[operation_name] = {'start': time.time()}
+        self._starts[operation_name] = time.perf_counter()
     
     def end_operation(self, operation_name):
         """End timing an operation"""
-        if operation_name in self.operation_times:
-            elapsed = time.time() - self.operation_times[operation_name]['start']
-            self.operation_times[operation_name]['duration'] = elapsed
-            return elapsed
-        return None
+        start = self._starts.pop(operation_name, None)
+        if start is None:
+            return None
+        elapsed = time.perf_counter() - start
+        self._durations[operation_name] = elapsed
+        return elapsed
     
-    @staticmethod
-    def get_memory_usage():
+    def get_memory_usage(self):
         """
         Get current memory usage
         
@@ -41,19 +68,18 @@ class PerformanceMonitor:
             Memory usage information
         """
         try:
-            process = psutil.Process(os.getpid())
+            process = self._process
             memory_info = process.memory_info()
             
             return {
                 'rss_mb': memory_info.rss / 1024 / 1024,  # Resident Set Size
                 'vms_mb': memory_info.vms / 1024 / 1024,  # Virtual Memory Size
-                'percent': process.memory_percent()
+                'percent': memory_info.rss / _TOTAL_MEM * 100  # as Process.memory_percent()
             }
         except Exception as e:
             return {'error': str(e)}
     
-    @staticmethod
-    def get_cpu_usage():
+    def get_cpu_usage(self):
         """
         Get CPU usage
         
@@ -63,35 +89,44 @@ class PerformanceMonitor:
             CPU usage information
         """
         try:
-            process = psutil.Process(os.getpid())
+            process = self._process
             
+            # Non-blocking: usage since the previous call (primed in __init__)
             return {
-                'percent': process.cpu_percent(interval=0.1),
+                'percent': process.cpu_percent(interval=None),
                 'num_threads': process.num_threads(),
-                'system_wide': psutil.cpu_percent(interval=0.1)
+                'system_wide': psutil.cpu_percent(interval=None)
             }
         except Exception as e:
             return {'error': str(e)}
     
     @staticmethod
-    def get_system_info():
+    def get_system_info(cpu_percent=None):
         """
         Get system information
         
+        Parameters:
+        -----------
+        cpu_percent : float, optional
+            System-wide CPU usage already sampled by the caller; a second
+            back-to-back non-blocking sample would cover a near-zero interval
+        
         Returns:
         --------
         system_info : dict
             System information
         """
         try:
+            # Only availability and load are live; totals are module constants
             virtual_mem = psutil.virtual_memory()
             
             return {
-                'total_memory_gb': virtual_mem.total / 1024 / 1024 / 1024,
+                'total_memory_gb': _TOTAL_MEM / 1024 / 1024 / 1024,
                 'available_memory_gb': virtual_mem.available / 1024 / 1024 / 1024,
                 'memory_percent': virtual_mem.percent,
-                'cpu_count': psutil.cpu_count(),
-                'cpu_percent': psutil.cpu_percent(interval=0.1)
+                'cpu_count': _CPU_COUNT,
+                'cpu_percent': (psutil.cpu_percent(interval=None)
+                                if cpu_percent is None else cpu_percent)
             }
         except Exception as e:
             return {'error': str(e)}
@@ -105,24 +140,24 @@ class PerformanceMonitor:
         report : dict
             Performance metrics
         """
-        uptime = time.time() - self.start_time
+        uptime = time.perf_counter() - self.start_time
+        cpu = self.get_cpu_usage()
         
         report = {
             'uptime_seconds': uptime,
             'uptime_formatted': self._format_duration(uptime),
             'memory': self.get_memory_usage(),
-            'cpu': self.get_cpu_usage(),
-            'system': self.get_system_info(),
+            'cpu': cpu,
+            'system': self.get_system_info(cpu.get('system_wide')),
             'operations': {}
         }
         
         # Add operation times
-        for op_name, op_data in self.operation_times.items():
-            if 'duration' in op_data:
-                report['operations'][op_name] = {
-                    'duration_seconds': op_data['duration'],
-                    'duration_formatted': self._format_duration(op_data['duration'])
-                }
+        for op_name, duration in self._durations.items():
+            report['operations'][op_name] = {
+                'duration_seconds': duration,
+                'duration_formatted': self._format_duration(duration)
+            }
         
         return report
     
@@ -153,40 +188,39 @@ class PerformanceMonitor:
         formatted : str
             Formatted report text
         """
-        text = f"\n{'='*60}\n"
-        text += "PERFORMANCE MONITORING REPORT\n"
-        text += f"{'='*60}\n\n"
-        
-        text += f"Application Uptime: {report['uptime_formatted']}\n\n"
+        parts = ['', '=' * 60, "PERFORMANCE MONITORING REPORT", '=' * 60, '',
+                 f"Application Uptime: {report['uptime_formatted']}", '',
+                 "--- MEMORY USAGE ---"]
+        memory = report['memory']
+        if 'error' not in memory:
+            parts += [f"Process Memory: {memory['rss_mb']:.2f} MB",
+                      f"Memory Percent: {memory['percent']:.2f}%", '']
         
-        text += "--- MEMORY USAGE ---\n"
-        if 'error' not in report['memory']:
-            text += f"Process Memory: {report['memory']['rss_mb']:.2f} MB\n"
-            text += f"Memory Percent: {report['memory']['percent']:.2f}%\n\n"
+        parts.append("--- CPU USAGE ---")
+        cpu = report['cpu']
+        if 'error' not in cpu:
+            parts += [f"Process CPU: {cpu['percent']:.2f}%",
+                      f"Threads: {cpu['num_threads']}",
+                      f"System CPU: {cpu['system_wide']:.2f}%", '']
         
-        text += "--- CPU USAGE ---\n"
-        if 'error' not in report['cpu']:
-            text += f"Process CPU: {report['cpu']['percent']:.2f}%\n"
-            text += f"Threads: {report['cpu']['num_threads']}\n"
-            text += f"System CPU: {report['cpu']['system_wide']:.2f}%\n\n"
-        
-        text += "--- SYSTEM INFO ---\n"
-        if 'error' not in report['system']:
-            text += f"Total Memory: {report['system']['total_memory_gb']:.2f} GB\n"
-            text += f"Available Memory: {report['system']['available_memory_gb']:.2f} GB\n"
-            text += f"CPU Cores: {report['system']['cpu_count']}\n\n"
+        parts.append("--- SYSTEM INFO ---")
+        system = report['system']
+        if 'error' not in system:
+            parts += [f"Total Memory: {system['total_memory_gb']:.2f} GB",
+                      f"Available Memory: {system['available_memory_gb']:.2f} GB",
+                      f"CPU Cores: {system['cpu_count']}", '']
         
         if report['operations']:
-            text += "--- OPERATION TIMES ---\n"
+            parts.append("--- OPERATION TIMES ---")
             sorted_ops = sorted(report['operations'].items(), 
                               key=lambda x: x[1]['duration_seconds'], 
                               reverse=True)
-            for op_name, op_data in sorted_ops:
-                text += f"{op_name}: {op_data['duration_formatted']}\n"
+            parts.extend(f"{op_name}: {op_data['duration_formatted']}"
+                         for op_name, op_data in sorted_ops)
         
-        text += f"\n{'='*60}\n"
+        parts += ['', '=' * 60, '']
         
-        return text
+        return "\n".join(parts)
     
     @staticmethod
     def get_optimization_tips(report):
@@ -205,29 +239,19 @@ class PerformanceMonitor:
         """
         tips = []
         
-        # Memory tips
-        if 'error' not in report['memory']:
-            if report['memory']['percent'] > 50:
-                tips.append("⚠️ High memory usage detected. Consider processing data in chunks.")
-            if report['memory']['rss_mb'] > 1000:
-                tips.append("💡 Memory usage exceeds 1GB. Optimize data types or filter unnecessary columns.")
-        
-        # CPU tips
-        if 'error' not in report['cpu']:
-            if report['cpu']['percent'] > 80:
-                tips.append("⚠️ High CPU usage. Consider optimizing calculations or using vectorized operations.")
-        
-        # System tips
-        if 'error' not in report['system']:
-            if report['system']['memory_percent'] > 90:
-                tips.append("⚠️ System memory critically low. Close other applications.")
+        # Sections that failed to collect hold only an 'error' key, so
+        # .get() yields None and their rules are skipped
+        for section, key, threshold, message in _TIP_RULES:
+            value = report[section].get(key)
+            if value is not None and value > threshold:
+                tips.append(message)
         
         # Operation tips
         if report['operations']:
             slow_ops = {k: v for k, v in report['operations'].items() 
-                       if v['duration_seconds'] > 5}
+                       if v['duration_seconds'] > _SLOW_OP_SECONDS}
             if slow_ops:
-                tips.append(f"⚠️ {len(slow_ops)} operations took >5 seconds. Review for optimization.")
+                tips.append(f"⚠️ {len(slow_ops)} operations took >{_SLOW_OP_SECONDS} seconds. Review for optimization.")
         
         if not tips:
             tips.append("✓ Performance is optimal")
@@ -5,23 +5,272 @@ All visualization and chart generation functions
 SEPARATION OF CONCERNS: Only chart/plot creation logic
 """
 
-import matplotlib.pyplot as plt
+import importlib.util
+import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from matplotlib import cbook
+import matplotlib.dates as mdates
 from matplotlib.figure import Figure
-import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import pandas as pd
 import numpy as np
 
 
+# Per-thread pool of figures keyed by figsize, used only while render_png
+# draws a chart straight to PNG. Building a Figure and its Axes costs far
+# more than clearing an existing one, and the handful of sizes used below
+# keeps the pool bounded
+_figure_pool = threading.local()
+
+# Scatter plots above this many rows are drawn as a 2-D density image
+_SCATTER_DENSITY_ROWS = 50_000
+
+# Lines with at least this many points are drawn without point markers
+_LINE_MARKER_MAX = 500
+
+# Binning and percentiles are memory-bound; single precision halves the
+# bytes they stream and is far finer than any plot can show
+_PLOT_FLOAT = np.float32
+
+# Heatmaps larger than this many rows are drawn without cell labels
+_HEATMAP_ANNOT_MAX = 30
+
+# PNGs from render_png, most recently used last
+_RENDER_CACHE_SIZE = 64
+_render_cache = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+# Background renders for render_async; each worker thread keeps its own
+# figure pool, so concurrent renders never share a Figure
+_RENDER_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="render")
+
+# Optional: compiled counting loops when numba is installed; NumPy otherwise
+_HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+if _HAS_NUMBA:
+    from numba import njit
+    
+    # cache=True keeps the compiled code on disk across sessions
+    @njit(cache=True)
+    def _nb_bincount(codes, n):
+        """Occurrences of each code in [0, n); negative (missing) codes are skipped"""
+        counts = np.zeros(n, np.int64)
+        for c in codes:
+            if c >= 0:
+                counts[c] += 1
+        return counts
+    
+    @njit(cache=True)
+    def _nb_hist1d(x, lo, hi, nbins):
+        """Counts of x in nbins equal-width bins over [lo, hi]"""
+        counts = np.zeros(nbins, np.int64)
+        scale = nbins / (hi - lo)
+        for v in x:
+            if lo <= v <= hi:
+                i = int((v - lo) * scale)
+                counts[min(i, nbins - 1)] += 1  # hi itself falls in the last bin
+        return counts
+
+
+def _get_fig(figsize):
+    """
+    Return an empty (figure, axes) pair of the given size
+    
+    Charts returned to callers always get a new Figure. Inside
+    render_png, where the figure is rasterised before it could escape,
+    a pooled figure is cleared and reused instead.
+    """
+    if not getattr(_figure_pool, 'active', False):
+        fig = Figure(figsize=figsize, dpi=100)
+        return fig, fig.add_subplot(111)
+    
+    pool = getattr(_figure_pool, 'figures', None)
+    if pool is None:
+        pool = _figure_pool.figures = {}
+    fig = pool.get(figsize)
+    if fig is None:
+        fig = pool[figsize] = Figure(figsize=figsize, dpi=100)
+        return fig, fig.add_subplot(111)
+    if len(fig.axes) == 1:
+        ax = fig.axes[0]
+        ax.clear()
+        ax.set_aspect('auto')
+    else:
+        # A colorbar took space from the main axes; start the layout over
+        fig.clear()
+        ax = fig.add_subplot(111)
+    return fig, ax
+
+
+def _png_bytes(fig):
+    """Render a figure to PNG bytes with Agg, whatever the pyplot backend"""
+    buf = io.BytesIO()
+    FigureCanvasAgg(fig).print_png(buf)
+    return buf.getvalue()
+
+
+def _cols(data, *names):
+    """
+    NumPy arrays for the named columns, in order
+    
+    Columns sharing one dtype come from a single block conversion (a
+    view where pandas allows it); mixed dtypes are converted column by
+    column so each keeps its own dtype.
+    """
+    frame = data[list(names)]
+    if frame.dtypes.nunique() == 1:
+        return tuple(frame.to_numpy(copy=False).T)
+    return tuple(frame.iloc[:, i].to_numpy() for i in range(len(names)))
+
+
+def _topk_counts(series, n):
+    """
+    Counts of the n most frequent non-null values, largest first
+    
+    Equivalent to series.value_counts().head(n), but counts with a
+    bincount over factorized codes and only partially sorts them.
+    """
+    codes, uniques = pd.factorize(series, sort=False)
+    if _HAS_NUMBA:
+        counts = _nb_bincount(codes, len(uniques))
+    else:
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    if n < len(counts):
+        top = np.argpartition(-counts, n - 1)[:n]
+    else:
+        top = np.arange(len(counts))
+    top = top[np.argsort(-counts[top], kind='stable')]
+    return pd.Series(counts[top], index=uniques[top], name='count')
+
+
+def _finite_values(series):
+    """float32 array of a column's values with NaN/inf removed"""
+    values = series.to_numpy(dtype=_PLOT_FLOAT, na_value=np.nan)
+    return values[np.isfinite(values)]
+
+
+def _hist(values, bins, value_range=None):
+    """
+    (counts, edges) of finite values, as np.histogram returns them
+    
+    With numba available, a bin count over a non-degenerate range is a
+    single compiled pass with no temporary arrays.
+    """
+    if _HAS_NUMBA and isinstance(bins, int) and values.size:
+        lo, hi = value_range if value_range is not None else (values.min(), values.max())
+        if lo < hi:
+            return _nb_hist1d(values, lo, hi, bins), np.linspace(lo, hi, bins + 1)
+    return np.histogram(values, bins=bins, range=value_range)
+
+
+def _fast_kde(x, n_grid=512):
+    """
+    Gaussian KDE of finite samples x evaluated on an n_grid-point grid via binning + FFT
+    
+    The samples are binned once and the counts convolved with a gaussian
+    kernel, so the cost is O(N + n_grid log n_grid) rather than the
+    O(N * n_grid) of evaluating every sample at every grid point. The
+    bandwidth is Scott's rule, as in scipy.stats.gaussian_kde.
+    
+    Returns (grid, density), or None when there are fewer than two
+    distinct finite values to estimate from.
+    """
+    from scipy.signal import fftconvolve
+    
+    if x.size < 2:
+        return None
+    bw = x.std(ddof=1) * x.size ** -0.2
+    if bw == 0:
+        return None
+    
+    # Pad by 3 bandwidths so the tails decay inside the grid
+    counts, edges = _hist(x, n_grid, (x.min() - 3 * bw, x.max() + 3 * bw))
+    dx = edges[1] - edges[0]
+    half = min(int(np.ceil(4 * bw / dx)), n_grid)
+    kernel = np.exp(-0.5 * (np.arange(-half, half + 1) * dx / bw) ** 2)
+    density = fftconvolve(counts, kernel, mode='same') / (x.size * bw * np.sqrt(2 * np.pi))
+    # FFT round-off can leave tiny negatives in the empty tails
+    np.clip(density, 0, None, out=density)
+    return (edges[:-1] + edges[1:]) / 2, density
+
+
+def _downsample_xy(x, y, max_points):
+    """
+    Reduce a line to at most max_points with Largest-Triangle-Three-Buckets
+    
+    Each bucket keeps the point forming the largest triangle with the
+    previously kept point and the next bucket's average, which preserves
+    peaks and troughs that a plain stride would drop. Non-numeric y, or
+    a line already short enough, is returned unchanged.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= max_points or max_points < 3 or not np.issubdtype(y.dtype, np.number):
+        return x, y
+    
+    ys = y.astype(float)
+    if np.issubdtype(x.dtype, np.datetime64):
+        xs = x.view('i8').astype(float)
+    elif np.issubdtype(x.dtype, np.number):
+        xs = x.astype(float)
+    else:
+        xs = np.arange(n, dtype=float)  # Categorical x: areas by position
+    
+    # First and last points are always kept; the rest fill max_points - 2 buckets
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    keep = np.empty(max_points, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nlo, nhi = (hi, edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = xs[nlo:nhi].mean()
+        avg_y = ys[nlo:nhi].mean()
+        area = np.abs((xs[a] - avg_x) * (ys[lo:hi] - ys[a])
+                      - (xs[a] - xs[lo:hi]) * (avg_y - ys[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+
+def _line_markers(n_points):
+    """ax.plot marker kwargs: point markers only on lines short enough to read them"""
+    if n_points < _LINE_MARKER_MAX:
+        return {'marker': 'o', 'markersize': 4}
+    return {}
+
+
+def _format_date_axis(ax, is_datetime):
+    """
+    Label a date x-axis with a concise formatter
+    
+    The locator picks at most 8 ticks and only those are formatted at
+    draw time. Non-datetime x values just get slanted labels, as
+    autofmt_xdate gave them.
+    """
+    if is_datetime:
+        locator = mdates.AutoDateLocator(maxticks=8)
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    else:
+        ax.tick_params(axis='x', labelrotation=30)
+
+
 class ChartCreator:
     """Creates various types of charts"""
     
     @staticmethod
     def create_histogram(data, column, bins=30, title=None):
         """Create histogram"""
-        fig = Figure(figsize=(10, 6), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax = _get_fig((10, 6))
         
-        data[column].hist(ax=ax, bins=bins, edgecolor='black', alpha=0.7)
+        counts, edges = _hist(_finite_values(data[column]), bins)
+        # One filled step outline instead of a Rectangle artist per bin
+        ax.stairs(counts, edges, fill=True, edgecolor='black', alpha=0.7)
         ax.set_title(title or f'Distribution of {column}', fontsize=14, fontweight='bold')
         ax.set_xlabel(column)
         ax.set_ylabel('Frequency')
@@ -32,27 +281,42 @@ class ChartCreator:
     @staticmethod
     def create_boxplot(data, columns=None):
         """Create box plot"""
-        fig = Figure(figsize=(12, 6), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax = _get_fig((12, 6))
         
         if columns is None:
             columns = data.select_dtypes(include=[np.number]).columns.tolist()
         
-        data[columns].boxplot(ax=ax)
+        # Stats from one float block, then a single bxp draw of all boxes
+        values = data[columns].to_numpy(dtype=_PLOT_FLOAT, na_value=np.nan)
+        stats = cbook.boxplot_stats([col[~np.isnan(col)] for col in values.T],
+                                    labels=columns)
+        ax.bxp(stats)
         ax.set_title('Box Plot - Distribution Comparison', fontsize=14, fontweight='bold')
         ax.set_ylabel('Values')
         ax.grid(True, alpha=0.3)
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        # bxp placed the boxes at 1..n; relabel and rotate in one batch call
+        ax.set_xticks(range(1, len(columns) + 1), labels=columns, rotation=45, ha='right')
         
         return fig
     
     @staticmethod
     def create_scatter(data, x_col, y_col, title=None):
         """Create scatter plot"""
-        fig = Figure(figsize=(10, 6), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax = _get_fig((10, 6))
         
-        data.plot.scatter(x=x_col, y=y_col, ax=ax, alpha=0.6, s=50)
+        x, y = _cols(data, x_col, y_col)
+        if (len(x) > _SCATTER_DENSITY_ROWS and np.issubdtype(x.dtype, np.number)
+                and np.issubdtype(y.dtype, np.number)):
+            # Too many markers to tell apart: draw point density as one image
+            finite = np.isfinite(x) & np.isfinite(y)
+            counts, x_edges, y_edges = np.histogram2d(x[finite], y[finite], bins=512)
+            image = ax.imshow(np.ma.masked_equal(counts.T, 0), origin='lower', aspect='auto',
+                              extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]),
+                              cmap='viridis', interpolation='nearest')
+            fig.colorbar(image, ax=ax, label='Points per bin')
+        else:
+            # Rasterized markers keep vector output (PDF/SVG) small
+            ax.scatter(x, y, alpha=0.6, s=50, rasterized=True)
         ax.set_title(title or f'{y_col} vs {x_col}', fontsize=14, fontweight='bold')
         ax.set_xlabel(x_col)
         ax.set_ylabel(y_col)
@@ -63,30 +327,35 @@ class ChartCreator:
     @staticmethod
     def create_bar_chart(data, x_col, y_col=None, title=None):
         """Create bar chart"""
-        fig = Figure(figsize=(12, 6), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax = _get_fig((12, 6))
         
         if y_col:
-            data.plot.bar(x=x_col, y=y_col, ax=ax)
+            labels, heights = _cols(data, x_col, y_col)
         else:
-            value_counts = data[x_col].value_counts().head(10)
-            value_counts.plot.bar(ax=ax)
+            value_counts = _topk_counts(data[x_col], 10)
+            labels, heights = value_counts.index, value_counts.to_numpy()
+        positions = np.arange(len(heights))
+        ax.bar(positions, heights, width=0.5)
         
         ax.set_title(title or f'Bar Chart - {x_col}', fontsize=14, fontweight='bold')
         ax.set_xlabel(x_col)
         ax.set_ylabel('Count' if not y_col else y_col)
         ax.grid(True, alpha=0.3, axis='y')
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+        # Ticks, labels and their rotation set in one batch call
+        ax.set_xticks(positions, labels=[str(label) for label in labels],
+                      rotation=45, ha='right')
         
         return fig
     
     @staticmethod
     def create_line_chart(data, x_col, y_col, title=None):
         """Create line chart"""
-        fig = Figure(figsize=(12, 6), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax = _get_fig((12, 6))
         
-        ax.plot(data[x_col], data[y_col], marker='o', linestyle='-', linewidth=2, markersize=4)
+        # About two points per horizontal pixel is all a line can show
+        x, y = _downsample_xy(*_cols(data, x_col, y_col),
+                              int(fig.get_size_inches()[0] * fig.dpi * 2))
+        ax.plot(x, y, linestyle='-', linewidth=2, **_line_markers(len(y)))
         ax.set_title(title or f'{y_col} over {x_col}', fontsize=14, fontweight='bold')
         ax.set_xlabel(x_col)
         ax.set_ylabel(y_col)
@@ -97,11 +366,15 @@ class ChartCreator:
     @staticmethod
     def create_pie_chart(data, column, top_n=10, title=None):
         """Create pie chart"""
-        fig = Figure(figsize=(10, 8), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax = _get_fig((10, 8))
         
-        value_counts = data[column].value_counts().head(top_n)
-        ax.pie(value_counts.values, labels=value_counts.index, autopct='%1.1f%%', startangle=90)
+        value_counts = _topk_counts(data[column], top_n)
+        # Percentages formatted in one vectorized call and baked into the
+        # labels, rather than an autopct callback and text artist per wedge
+        counts = value_counts.to_numpy()
+        percents = np.char.mod('%.1f%%', counts / counts.sum() * 100)
+        labels = [f"{name}\n{pct}" for name, pct in zip(value_counts.index, percents)]
+        ax.pie(counts, labels=labels, startangle=90)
         ax.set_title(title or f'Distribution of {column}', fontsize=14, fontweight='bold')
         
         return fig
@@ -109,11 +382,22 @@ class ChartCreator:
     @staticmethod
     def create_heatmap(correlation_matrix, title='Correlation Heatmap'):
         """Create correlation heatmap"""
-        fig = Figure(figsize=(12, 10), dpi=100)
-        ax = fig.add_subplot(111)
+        # seaborn (and the scipy modules it pulls in) is only needed here
+        import seaborn as sns
+        
+        fig, ax = _get_fig((12, 10))
         
-        sns.heatmap(correlation_matrix, annot=True, fmt='.2f', cmap='coolwarm', 
-                   ax=ax, square=True, linewidths=0.5, cbar_kws={"shrink": 0.8})
+        # Cell labels are formatted in one vectorized call, and dropped on
+        # large matrices where they would be unreadable anyway. Large
+        # matrices also keep seaborn's thinned-out tick labels
+        if correlation_matrix.shape[0] > _HEATMAP_ANNOT_MAX:
+            annot, xticklabels, yticklabels = False, 'auto', 'auto'
+        else:
+            annot = np.char.mod('%.2f', correlation_matrix.to_numpy(dtype=float))
+            xticklabels, yticklabels = correlation_matrix.columns, correlation_matrix.index
+        sns.heatmap(correlation_matrix, annot=annot, fmt='', cmap='coolwarm', 
+                   ax=ax, square=True, linewidths=0.5, cbar_kws={"shrink": 0.8},
+                   xticklabels=xticklabels, yticklabels=yticklabels)
         ax.set_title(title, fontsize=14, fontweight='bold')
         
         return fig
@@ -121,12 +405,18 @@ class ChartCreator:
     @staticmethod
     def create_distribution_plot(data, column, title=None):
         """Create distribution plot with histogram and KDE"""
-        fig = Figure(figsize=(10, 6), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax = _get_fig((10, 6))
         
-        data[column].hist(ax=ax, bins=30, alpha=0.7, edgecolor='black', 
-                         density=True, label='Histogram')
-        data[column].plot(kind='kde', ax=ax, color='red', linewidth=2, label='KDE')
+        values = _finite_values(data[column])
+        counts, edges = _hist(values, 30)
+        widths = np.diff(edges)
+        # Normalise the same counts to a density instead of binning twice
+        density = counts / (counts.sum() * widths) if counts.sum() else counts
+        ax.stairs(density, edges, fill=True, alpha=0.7, edgecolor='black',
+                  label='Histogram')
+        kde = _fast_kde(values)
+        if kde is not None:
+            ax.plot(*kde, color='red', linewidth=2, label='KDE')
         
         ax.set_title(title or f'Distribution of {column}', fontsize=14, fontweight='bold')
         ax.set_xlabel(column)
@@ -139,17 +429,17 @@ class ChartCreator:
     @staticmethod
     def create_violin_plot(data, columns=None, title='Violin Plot'):
         """Create violin plot"""
-        fig = Figure(figsize=(12, 6), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax = _get_fig((12, 6))
         
         if columns is None:
             columns = data.select_dtypes(include=[np.number]).columns.tolist()[:6]
         
-        data_to_plot = [data[col].dropna() for col in columns]
+        # One float block for all columns; NaNs masked out per column
+        values = data[columns].to_numpy(dtype=float, na_value=np.nan)
+        data_to_plot = [col[~np.isnan(col)] for col in values.T]
         parts = ax.violinplot(data_to_plot, showmeans=True, showmedians=True)
         
-        ax.set_xticks(range(1, len(columns) + 1))
-        ax.set_xticklabels(columns, rotation=45, ha='right')
+        ax.set_xticks(range(1, len(columns) + 1), labels=columns, rotation=45, ha='right')
         ax.set_title(title, fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='y')
         
@@ -162,31 +452,128 @@ class TimeSeriesPlots:
     @staticmethod
     def create_time_series_plot(data, date_col, value_col, title=None):
         """Create time series line plot"""
-        fig = Figure(figsize=(14, 6), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax = _get_fig((14, 6))
         
-        ax.plot(data[date_col], data[value_col], marker='o', linestyle='-', 
-               linewidth=2, markersize=4)
+        dates = data[date_col]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            # Real datetimes give a numeric date axis instead of one
+            # categorical tick per distinct string
+            try:
+                dates = pd.to_datetime(dates)
+            except (ValueError, TypeError):
+                pass
+        x, y = _downsample_xy(dates, data[value_col],
+                              int(fig.get_size_inches()[0] * fig.dpi * 2))
+        ax.plot(x, y, linestyle='-', linewidth=2, **_line_markers(len(y)))
         ax.set_title(title or f'{value_col} over Time', fontsize=14, fontweight='bold')
         ax.set_xlabel('Date')
         ax.set_ylabel(value_col)
         ax.grid(True, alpha=0.3)
-        fig.autofmt_xdate()  # Format x-axis dates nicely
+        _format_date_axis(ax, pd.api.types.is_datetime64_any_dtype(dates))
         
         return fig
     
     @staticmethod
     def create_seasonal_plot(data, date_col, value_col, period='M'):
         """Create seasonal decomposition plot"""
-        fig = Figure(figsize=(14, 8), dpi=100)
-        
         # This is a placeholder - actual seasonal decomposition would require statsmodels
-        ax = fig.add_subplot(111)
-        ax.plot(data[date_col], data[value_col])
+        fig, ax = _get_fig((14, 8))
+        dates, values = _cols(data, date_col, value_col)
+        ax.plot(dates, values)
         ax.set_title('Seasonal Analysis (Basic)', fontsize=14, fontweight='bold')
         ax.set_xlabel('Date')
         ax.set_ylabel(value_col)
         ax.grid(True, alpha=0.3)
-        fig.autofmt_xdate()
+        _format_date_axis(ax, pd.api.types.is_datetime64_any_dtype(data.dtypes[date_col]))
         
         return fig
+
+
+def _freeze(value):
+    """Hashable stand-in for chart arguments (lists of columns, style dicts)"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def render_png(chart_fn, data, *args, **kwargs):
+    """
+    Render chart_fn(data, *args, **kwargs) to PNG bytes, memoized
+    
+    The cache key includes a hash of data's contents, so a chart is
+    redrawn whenever the data changes, in place or not, and identical
+    data reuses the earlier render. Unhashable data or arguments are
+    simply rendered without caching.
+    
+    Parameters:
+    -----------
+    chart_fn : callable
+        A ChartCreator / TimeSeriesPlots method
+    data : pd.DataFrame
+        Data to plot
+    *args, **kwargs
+        Remaining chart arguments
+    
+    Returns:
+    --------
+    bytes
+        PNG image
+    """
+    try:
+        key = (chart_fn.__qualname__, _freeze(args), _freeze(kwargs),
+               tuple(data.columns), data.shape,
+               hash(pd.util.hash_pandas_object(data).to_numpy().tobytes()))
+        hash(key)
+    except TypeError:
+        key = None
+    
+    if key is not None:
+        with _render_cache_lock:
+            png = _render_cache.get(key)
+            if png is not None:
+                _render_cache.move_to_end(key)
+                return png
+    
+    # The figure never leaves this call, so the chart may draw on a pooled one
+    _figure_pool.active = True
+    try:
+        png = _png_bytes(chart_fn(data, *args, **kwargs))
+    finally:
+        _figure_pool.active = False
+    
+    if key is not None:
+        with _render_cache_lock:
+            _render_cache[key] = png
+            if len(_render_cache) > _RENDER_CACHE_SIZE:
+                _render_cache.popitem(last=False)
+    return png
+
+
+def render_async(chart_fn, data, *args, **kwargs):
+    """
+    Run render_png on a background thread
+    
+    Parameters:
+    -----------
+    chart_fn : callable
+        A ChartCreator / TimeSeriesPlots method
+    data : pd.DataFrame
+        Data to plot; must not be modified until the render finishes
+    *args, **kwargs
+        Remaining chart arguments
+    
+    Returns:
+    --------
+    concurrent.futures.Future
+        Resolves to the PNG bytes. Done-callbacks run on the worker
+        thread, so Tk code should hand the result back with after()
+    """
+    return _RENDER_POOL.submit(render_png, chart_fn, data, *args, **kwargs)
+
+
+def clear_render_cache():
+    """Drop all memoized renders"""
+    with _render_cache_lock:
+        _render_cache.clear()
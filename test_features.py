@@ -1,79 +1,80 @@
 """
 Test script to verify new features are working
+
+By default each feature module is only located (importlib.util.find_spec),
+which is fast and has no import side effects. Pass --deep to import the
+modules and check that their classes exist.
 """
 import sys
 import os
+import importlib
+import importlib.util
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-print("="*60)
-print("NexData Feature Verification Test")
-print("="*60)
-
-# Test 1: Excel Pivot Export
-print("\n[1/3] Testing Excel Pivot Export...")
-try:
-    from data_ops.excel_pivot_export import ExcelPivotExporter, PivotTableBuilder
-    print("  ✅ Excel Pivot Export module imported successfully")
-    print("  ✅ Classes available: ExcelPivotExporter, PivotTableBuilder")
-except Exception as e:
-    print(f"  ❌ ERROR: {e}")
+DEEP = '--deep' in sys.argv[1:]
 
-# Test 2: API Connector
-print("\n[2/3] Testing Generic API Connector...")
-try:
-    from data_ops.api_connector import APIConnector, APIEndpointBuilder, APIResponseHandler, APICache
-    print("  ✅ API Connector module imported successfully")
-    print("  ✅ Classes available: APIConnector, APIEndpointBuilder, APIResponseHandler, APICache")
-except Exception as e:
-    print(f"  ❌ ERROR: {e}")
+# (title, module, classes)
+FEATURES = [
+    ("Excel Pivot Export", "data_ops.excel_pivot_export",
+     ["ExcelPivotExporter", "PivotTableBuilder"]),
+    ("Generic API Connector", "data_ops.api_connector",
+     ["APIConnector", "APIEndpointBuilder", "APIResponseHandler", "APICache"]),
+    ("Shopify API Integration", "data_ops.shopify_api",
+     ["ShopifyAPI", "ShopifyDataAnalyzer"]),
+    ("API Connector UI", "ui.api_connector_window",
+     ["APIConnectorWindow"]),
+    ("Main Window Integration", "ui.main_window",
+     ["DataAnalystApp"]),
+]
 
-# Test 3: Shopify API
-print("\n[3/3] Testing Shopify API Integration...")
-try:
-    from data_ops.shopify_api import ShopifyAPI, ShopifyDataAnalyzer
-    print("  ✅ Shopify API module imported successfully")
-    print("  ✅ Classes available: ShopifyAPI, ShopifyDataAnalyzer")
-except Exception as e:
-    print(f"  ❌ ERROR: {e}")
+# (distribution label, module)
+DEPENDENCIES = [
+    ("requests library", "requests"),
+    ("psutil library", "psutil"),
+    ("python-pptx library", "pptx"),
+]
 
-# Test 4: API Connector Window
-print("\n[4/4] Testing API Connector UI...")
-try:
-    from ui.api_connector_window import APIConnectorWindow
-    print("  ✅ API Connector Window module imported successfully")
-    print("  ✅ UI component available")
-except Exception as e:
-    print(f"  ❌ ERROR: {e}")
+TOTAL = len(FEATURES) + 1
 
-# Test 5: Main window integration
-print("\n[5/5] Testing Main Window Integration...")
-try:
-    from ui.main_window import DataAnalystApp
-    print("  ✅ Main window imports new modules successfully")
-except Exception as e:
-    print(f"  ❌ ERROR: {e}")
-
-# Test 6: Dependencies
-print("\n[6/6] Testing Dependencies...")
-try:
-    import requests
-    print(f"  ✅ requests library available (v{requests.__version__})")
-except:
-    print("  ❌ requests library not installed")
+print("="*60)
+print("NexData Feature Verification Test")
+print(f"Mode: {'deep (importing modules)' if DEEP else 'quick (locating modules; use --deep to import)'}")
+print("="*60)
 
-try:
-    import psutil
-    print(f"  ✅ psutil library available (v{psutil.__version__})")
-except:
-    print("  ❌ psutil library not installed")
+for number, (title, module_name, classes) in enumerate(FEATURES, 1):
+    print(f"\n[{number}/{TOTAL}] Testing {title}...")
+    try:
+        if importlib.util.find_spec(module_name) is None:
+            print(f"  ❌ ERROR: module {module_name} not found")
+            continue
+        if not DEEP:
+            print(f"  ✅ {module_name} found")
+            continue
+        module = importlib.import_module(module_name)
+        missing = [name for name in classes if not hasattr(module, name)]
+        if missing:
+            print(f"  ❌ ERROR: missing {', '.join(missing)}")
+        else:
+            print(f"  ✅ {module_name} imported successfully")
+            print(f"  ✅ Classes available: {', '.join(classes)}")
+    except Exception as e:
+        print(f"  ❌ ERROR: {e}")
 
-try:
-    from pptx import Presentation
-    print("  ✅ python-pptx library available")
-except:
-    print("  ❌ python-pptx library not installed")
+print(f"\n[{TOTAL}/{TOTAL}] Testing Dependencies...")
+for label, module_name in DEPENDENCIES:
+    if importlib.util.find_spec(module_name) is None:
+        print(f"  ❌ {label} not installed")
+    elif DEEP:
+        try:
+            module = importlib.import_module(module_name)
+            version = getattr(module, '__version__', None)
+            print(f"  ✅ {label} available" + (f" (v{version})" if version else ""))
+        except Exception as e:
+            print(f"  ❌ {label} failed to import: {e}")
+    else:
+        print(f"  ✅ {label} available")
 
 print("\n" + "="*60)
 print("VERIFICATION COMPLETE")
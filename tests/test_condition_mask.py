@@ -0,0 +1,49 @@
+"""
+Regression tests for the advanced filter's datetime conditions
+"""
+import os
+import sys
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+from ui.main_window import _condition_mask, _parse_datetime_value  # noqa: E402
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        'd': pd.to_datetime(['2024-01-04', '2024-01-05', '2024-01-05 12:30',
+                             '2024-01-10', None]),
+    })
+
+
+def _mask(df, op, text):
+    value = _parse_datetime_value(text, df['d'].dtype)
+    assert value is not None
+    return _condition_mask(df, 'd', op, value, 'datetime')
+
+
+def test_datetime_compares_as_timestamps_not_text(df):
+    # '2024-1-5' sorts after every '2024-01-..' string; as a date it doesn't
+    assert _mask(df, '>', '2024-1-5').tolist() == [False, False, True, True, False]
+
+
+def test_datetime_equality_with_time_parts_in_column(df):
+    assert _mask(df, '==', '2024-01-05').tolist() == [False, True, False, False, False]
+
+
+def test_datetime_tz_aware_column():
+    df = pd.DataFrame({'d': pd.to_datetime(['2024-01-04', '2024-01-06']).tz_localize('UTC')})
+    assert _mask(df, '<', '2024-01-05').tolist() == [True, False]
+
+
+def test_unparseable_datetime_value():
+    assert _parse_datetime_value('not a date', np.dtype('datetime64[ns]')) is None
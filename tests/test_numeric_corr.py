@@ -0,0 +1,34 @@
+"""
+Regression test for the correlation matrix fast path in the main window
+"""
+import os
+import sys
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+pytest.importorskip("matplotlib")
+pytest.importorskip("seaborn")
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src'))
+
+from ui.main_window import _numeric_corr  # noqa: E402
+
+
+def test_all_float64_frame_under_copy_on_write():
+    # A single float64 block is what to_numpy() would return as a
+    # read-only view under copy-on-write
+    df = pd.DataFrame({
+        'a': [1.0, 2.0, 3.0, 4.0, 5.0],
+        'b': [2.0, 4.1, 5.9, 8.2, 9.9],
+        'c': [5.0, 3.0, 4.0, 1.0, 2.0],
+    })
+    before = df.copy()
+    with pd.option_context("mode.copy_on_write", True):
+        corr = _numeric_corr(df)
+
+    pd.testing.assert_frame_equal(corr, df.corr())
+    # The source frame must not be standardised in place
+    pd.testing.assert_frame_equal(df, before)